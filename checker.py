@@ -1,24 +1,45 @@
 import json
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from pathlib import Path
 import argparse
 from urllib.parse import urljoin, quote
 
 from zoneinfo import ZoneInfo
 import re
+import shutil
 from difflib import SequenceMatcher
-from typing import Dict, List, Tuple, Set, Optional, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Tuple, Set, Optional, Any, Union, NamedTuple
 import itertools
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 try:
     from wcwidth import wcswidth  # type: ignore
 except Exception:
     wcswidth = None  # type: ignore
 
+try:
+    from rapidfuzz import fuzz  # type: ignore
+except Exception:
+    fuzz = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+try:
+    import lxml  # type: ignore  # noqa: F401
+    HTML_PARSER = "lxml"
+except Exception:
+    HTML_PARSER = "html.parser"
+
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
 
 # ---- Config ----
@@ -48,6 +69,8 @@ EXTERNAL_EVENT_TYPE_ID = "71"  # seminar filter
 EXTERNAL_HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; CrickNetChecker/1.0)"
 }
+EXTERNAL_LISTING_TAGS = ["article", "a"]  # teasers + the rel="next" pager link
+EXTERNAL_FETCH_WORKERS = 12  # concurrent detail-page fetches
 
 # JSON name/code -> website group label
 JSON_TO_WEBSITE_GROUP = {
@@ -111,50 +134,96 @@ SPEAKER_GROUP_SELECTOR = ".item-group-type-session-speaker-embed .item-group-inn
 SPEAKER_NAME_SELECTOR = "span.font-bold"
 SPEAKER_LAB_SELECTOR = ".text-label.text-grey div"
 
+# Reads every event row in one round-trip; returns [{title, href, speakers: [[name, lab], ...]}]
+EVENT_ROWS_JS = """
+(rows, sel) => rows.map(row => {
+    const text = el => (el ? el.innerText : "").trim();
+    const link = row.querySelector(sel.link);
+    return {
+        title: text(row.querySelector(sel.title)),
+        href: link ? (link.getAttribute("href") || "") : "",
+        speakers: Array.from(row.querySelectorAll(sel.group), g => {
+            const labs = g.querySelectorAll(sel.lab);
+            return [text(g.querySelector(sel.name)), labs.length ? text(labs[labs.length - 1]) : ""];
+        }),
+    };
+})
+"""
+
+# Patterns (compiled once; these run for every speaker/item)
+NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+# str.translate table deleting every ASCII char NON_ALNUM_RE would (after whitespace collapse)
+ASCII_PUNCT_DELETE = str.maketrans("", "", "".join(
+    ch for ch in map(chr, range(128)) if not (ch == " " or "a" <= ch <= "z" or "0" <= ch <= "9")
+))
+EVENT_LINK_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})t\d{4,6}")
+ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+LONG_DATE_RE = re.compile(
+    r"\b(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{4})\b"
+)
+SEMINAR_SUFFIX_RE = re.compile(r"\s+Seminar\s*$", re.IGNORECASE)
+SEMINAR_TITLE_RE = re.compile(r"^(.*)\s+Seminar\s+(.*)$", re.IGNORECASE)
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+NON_DIGIT_RE = re.compile(r"[^0-9]+")
+JSONLD_RE = re.compile(
+    r"<script\b[^>]*\stype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 # ---------------------------
 # Utilities
 # ---------------------------
-def safe_inner_text(locator) -> str:
-    try:
-        if locator.count() == 0:
-            return ""
-        return locator.first.inner_text().strip()
-    except Exception:
-        return ""
-
-
+@lru_cache(maxsize=8192)
 def norm_text(s: str) -> str:
-    s2 = (s or "").strip().lower()
-    s2 = re.sub(r"\s+", " ", s2)
-    s2 = re.sub(r"[^a-z0-9\s]", "", s2)  # drop punctuation
-    return s2
+    s2 = " ".join((s or "").lower().split())  # trim + collapse whitespace
+    if s2.isascii():
+        return s2.translate(ASCII_PUNCT_DELETE)  # drop punctuation
+    return NON_ALNUM_RE.sub("", s2)
 
 
+@lru_cache(maxsize=8192)
 def key_speaker_lab(speaker: str, lab: str) -> str:
     return f"{norm_text(speaker)} ({norm_text(lab)})"
 
 
 def similarity(a: str, b: str) -> float:
+    if a == b:
+        return 1.0
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
     return SequenceMatcher(None, a, b).ratio()
 
 
-def best_fuzzy_match(target: str, candidates: Set[str]) -> Tuple[Optional[str], float]:
-    best = None
-    best_score = 0.0
-    for c in candidates:
-        sc = similarity(target, c)
-        if sc > best_score:
-            best = c
-            best_score = sc
-    return best, best_score
+def similarity_matrix(
+    targets: List[str], candidates: List[str], score_cutoff: float = 0.0
+) -> List[List[float]]:
+    """Score every target against every candidate (rows follow targets).
+
+    Pairs that cannot reach score_cutoff may be reported as 0.0.
+    """
+    # The ratio can't exceed 2*shorter/(combined length), so skip pairs whose
+    # lengths alone rule them out.
+    cand_lens = [len(c) for c in candidates]
+    matrix: List[List[float]] = []
+    for t in targets:
+        t_len = len(t)
+        row: List[float] = []
+        for c, c_len in zip(candidates, cand_lens):
+            total = t_len + c_len
+            if total and 2 * min(t_len, c_len) / total < score_cutoff:
+                row.append(0.0)
+            else:
+                row.append(similarity(t, c))
+        matrix.append(row)
+    return matrix
 
 
 def parse_iso_date_from_event_link(href: str) -> Optional[str]:
     """Extract YYYY-MM-DD from URLs like ...-2026-01-14t140000"""
     if not href:
         return None
-    m = re.search(r"(\d{4}-\d{2}-\d{2})t\d{4,6}", href)
+    m = EVENT_LINK_DATE_RE.search(href)
     if m:
         return m.group(1)
     return None
@@ -185,18 +254,32 @@ def iso_to_uk(d: str) -> str:
         return d
 
 
+# Ordinal suffix and friendly strftime format, indexed by day of month
+DAY_SUFFIX = ["th" if 11 <= d <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(d % 10, "th") for d in range(32)]
+FRIENDLY_DT_FORMATS = [f"%-d{suffix} %b at %H:%M" for suffix in DAY_SUFFIX]
+
+
 def format_friendly_dt(dt_obj: datetime) -> str:
     """Converts datetime to '9th Jan at 16:26'"""
     if not dt_obj:
         return "Unknown"
 
-    day = dt_obj.day
-    if 4 <= day <= 20 or 24 <= day <= 30:
-        suffix = "th"
-    else:
-        suffix = ["st", "nd", "rd"][day % 10 - 1]
+    return dt_obj.strftime(FRIENDLY_DT_FORMATS[dt_obj.day])
 
-    return dt_obj.strftime(f"%-d{suffix} %b at %H:%M")
+
+# Python 3.11+ accepts a trailing "Z" in fromisoformat; older versions need "+00:00"
+try:
+    datetime.fromisoformat("2000-01-01T00:00:00Z")
+    FROMISOFORMAT_ACCEPTS_Z = True
+except ValueError:
+    FROMISOFORMAT_ACCEPTS_Z = False
+
+
+def parse_iso_datetime(s: str) -> datetime:
+    """datetime.fromisoformat that also accepts a UTC "Z" suffix."""
+    if not FROMISOFORMAT_ACCEPTS_Z and s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    return datetime.fromisoformat(s)
 
 
 def get_next_update_countdown(last_updated_str: str) -> Dict[str, Any]:
@@ -205,8 +288,7 @@ def get_next_update_countdown(last_updated_str: str) -> Dict[str, Any]:
         return {"due": False, "target_epoch": None, "message": ""}
 
     try:
-        clean_str = last_updated_str.replace("Z", "+00:00")
-        last_up = datetime.fromisoformat(clean_str)
+        last_up = parse_iso_datetime(last_updated_str)
 
         now = datetime.now(timezone.utc)
         next_up = last_up + timedelta(hours=6)
@@ -244,25 +326,77 @@ def display_item(item: Dict[str, str]) -> str:
     return sp
 
 
+@lru_cache(maxsize=1024)
+def parse_day(value: str, fmt: str) -> Optional[datetime]:
+    """strptime for report dates, None if unparseable (dates repeat across every group)."""
+    try:
+        return datetime.strptime(value, fmt)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def ticket_date_parts(iso: str, uk: str) -> Tuple[str, str]:
+    dt = (parse_day(iso, "%Y-%m-%d") if iso else None) or (parse_day(uk, "%d/%m/%Y") if uk else None)
+    if dt:
+        return dt.strftime("%-d"), dt.strftime("%b")
+    return "", ""
+
+
+@lru_cache(maxsize=1024)
+def date_cell_parts(iso: str, uk: str) -> str:
+    dt = parse_day(iso, "%Y-%m-%d") if iso else None
+    if dt:
+        d_str = dt.strftime("%-d %b")
+        w_str = dt.strftime("%a")
+        return f'<div class="font-bold text-base leading-tight">{d_str}</div><div class="text-xs opacity-70 uppercase tracking-wide">{w_str}</div>'
+    return f'<div class="font-bold text-base">{uk}</div>'
+
+
+@lru_cache(maxsize=256)
+def group_slug(name: str) -> str:
+    s = SLUG_RE.sub("-", (name or "").strip().lower())
+    return s.strip("-") or "group"
+
+
+@lru_cache(maxsize=4096)
+def section_anchor(group_name: str, date_iso: str, category: str) -> str:
+    g_slug = group_slug(group_name)
+    d = NON_DIGIT_RE.sub("-", (date_iso or "").strip()).strip("-") or "date"
+    c_slug = group_slug(category)
+    return f"section-{g_slug}-{d}-{c_slug}"
+
+
+HTML_SPECIAL_RE = re.compile(r"[&<>\"']")
+HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"})
+
+
 def html_escape(s: str) -> str:
     s = s or ""
-    return (
-        s.replace("&", "&amp;")
-         .replace("<", "&lt;")
-         .replace(">", "&gt;")
-         .replace('"', "&quot;")
-         .replace("'", "&#39;")
-    )
+    if not HTML_SPECIAL_RE.search(s):
+        return s  # nothing to escape: hand back the original string
+    return s.translate(HTML_ESCAPE_TABLE)
+
+
+# Group names, categories, dates, speakers and notes recur across the whole report
+html_escape_cached = lru_cache(maxsize=8192)(html_escape)
 
 
+@lru_cache(maxsize=1)
+def today_date() -> date:
+    """Local date, fixed for the whole run (run_once clears the cache)."""
+    return datetime.now(LOCAL_TZ).date()
+
+
+@lru_cache(maxsize=1)
 def today_iso() -> str:
-    return datetime.now(LOCAL_TZ).date().isoformat()
+    return today_date().isoformat()
 
 
 def within_next_days(iso_d: str, days: int) -> bool:
     try:
         d = datetime.strptime(iso_d, "%Y-%m-%d").date()
-        t = datetime.now(LOCAL_TZ).date()
+        t = today_date()
         return t <= d <= (t + timedelta(days=days))
     except Exception:
         return False
@@ -279,18 +413,54 @@ def canonicalise_category_from_sheet(category: str) -> Optional[str]:
     return None
 
 
+def field_str(record: Dict[str, Any], key: str) -> str:
+    """record[key] as stripped text; missing and null fields read as ""."""
+    v = record.get(key)
+    if isinstance(v, str):
+        return v.strip()
+    return "" if v is None else str(v).strip()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # stricter than json (e.g. BOM, NaN); let json decide
+    return json.loads(data)
+
+
+# path -> ((mtime_ns, size), parsed JSON); reused until the file changes on disk
+JSON_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def read_json_file(path: str) -> Any:
+    """Parse a JSON file, reusing the last result while its mtime and size are unchanged.
+
+    The returned object is shared between callers and must be treated as read-only.
+    """
+    st = Path(path).stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = JSON_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = json_loads(Path(path).read_bytes())
+    JSON_FILE_CACHE[path] = (stamp, data)
+    return data
+
+
 def norm_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return " ".join((s or "").split())
 
 
 def parse_iso_date(s: str) -> Optional[str]:
     s = (s or "").strip()
     if not s:
         return None
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", s):
+    if ISO_DATE_RE.fullmatch(s):
         return s
     try:
-        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        dt = parse_iso_datetime(s)
         return dt.date().isoformat()
     except Exception:
         return None
@@ -314,10 +484,7 @@ MONTHS = {
 
 def extract_date_iso_from_text(text: str) -> Optional[str]:
     t = norm_space(text).lower()
-    m = re.search(
-        r"\b(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{4})\b",
-        t,
-    )
+    m = LONG_DATE_RE.search(t)
     if not m:
         return None
     day = int(m.group(1))
@@ -329,8 +496,30 @@ def extract_date_iso_from_text(text: str) -> Optional[str]:
         return None
 
 
+def external_session() -> "requests.Session":
+    """Session shared by the detail-fetch workers, pooled to match their count.
+
+    Transient gateway errors are retried with a short backoff so one blip
+    doesn't drop a seminar from the report.
+    """
+    session = requests.Session()
+    retries = requests.adapters.Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=EXTERNAL_FETCH_WORKERS,
+        pool_maxsize=EXTERNAL_FETCH_WORKERS,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def external_fetch(
-    session: requests.Session,
+    session: "requests.Session",
     url: str,
     params: Optional[Dict[str, str]] = None,
     timeout: int = 30,
@@ -340,9 +529,26 @@ def external_fetch(
     return r.text
 
 
-def external_listing_info(html: str) -> Dict[str, str]:
+def external_fetch_detail(session: "requests.Session", url: str) -> Optional[str]:
+    try:
+        return external_fetch(session, url)
+    except Exception:
+        print(f"Failed to fetch {url}")
+        return None
+
+
+def parse_html(html: str, only_tags: Optional[List[str]] = None) -> "BeautifulSoup":
+    """Parse a page once; callers pass the soup on to the helpers below.
+
+    only_tags keeps just those elements (and their subtrees) in the tree.
+    """
+    if only_tags:
+        return BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer(only_tags))
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def external_listing_info(soup: "BeautifulSoup") -> Dict[str, str]:
     """Returns a dict of { url: title_text } found on the listing page."""
-    soup = BeautifulSoup(html, "html.parser")
     found: Dict[str, str] = {}
 
     # Keep the title and link paired by iterating the teaser blocks.
@@ -367,20 +573,25 @@ def external_listing_info(html: str) -> Dict[str, str]:
     return found
 
 
-def external_has_next_page(html: str) -> bool:
-    soup = BeautifulSoup(html, "html.parser")
+def external_has_next_page(soup: "BeautifulSoup") -> bool:
     return soup.select_one('a[rel="next"]') is not None
 
 
 def external_extract_jsonld(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
+    """JSON-LD blocks on a page, picked out of the raw HTML without a DOM parse."""
+    payloads = [m.group(1) for m in JSONLD_RE.finditer(html)]
+    if not payloads and "application/ld+json" in html:
+        # Markup the pattern doesn't cover; let the parser find the tags
+        soup = parse_html(html)
+        payloads = [tag.string or "" for tag in soup.find_all("script", attrs={"type": "application/ld+json"})]
+
     blocks = []
-    for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        txt = (tag.string or "").strip()
+    for txt in payloads:
+        txt = txt.strip()
         if not txt:
             continue
         try:
-            data = json.loads(txt)
+            data = json_loads(txt)
             if isinstance(data, list):
                 blocks.extend([x for x in data if isinstance(x, dict)])
             elif isinstance(data, dict):
@@ -398,8 +609,7 @@ def external_first_event_jsonld(blocks: List[Dict[str, Any]]) -> Optional[Dict[s
     return None
 
 
-def external_detail_page_text_description(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+def external_detail_page_text_description(soup: "BeautifulSoup") -> str:
     main = soup.select_one("main") or soup
     return norm_space(main.get_text(" ", strip=True))
 
@@ -408,17 +618,17 @@ def external_parse_group_and_speaker_from_title(title: str) -> Tuple[str, str]:
     t = norm_space(title)
     if "|" in t:
         left, right = [norm_space(x) for x in t.split("|", 1)]
-        left = re.sub(r"\s+Seminar\s*$", "", left, flags=re.IGNORECASE).strip()
+        left = SEMINAR_SUFFIX_RE.sub("", left).strip()
         return left, right
 
-    m = re.match(r"^(.*)\s+Seminar\s+(.*)$", t, flags=re.IGNORECASE)
+    m = SEMINAR_TITLE_RE.match(t)
     if m:
         return norm_space(m.group(1)), norm_space(m.group(2))
     return "", ""
 
 
 def scrape_external_seminars() -> List[Dict[str, Any]]:
-    session = requests.Session()
+    session = external_session()
 
     all_listing_info: Dict[str, str] = {}
     page = 0
@@ -430,24 +640,29 @@ def scrape_external_seminars() -> List[Dict[str, Any]]:
             "page": str(page),
         }
         html = external_fetch(session, EXTERNAL_LISTING_URL, params=params)
-        page_info = external_listing_info(html)
+        soup = parse_html(html, only_tags=EXTERNAL_LISTING_TAGS)
+        page_info = external_listing_info(soup)
         if not page_info:
             break
         all_listing_info.update(page_info)
-        if not external_has_next_page(html):
+        if not external_has_next_page(soup):
             break
         page += 1
         if page > 200:
             break
         time.sleep(0.1)
 
+    # Detail pages are independent, so fetch them concurrently; map() keeps listing order.
+    urls = list(all_listing_info)
+    with ThreadPoolExecutor(max_workers=EXTERNAL_FETCH_WORKERS) as pool:
+        pages = list(pool.map(lambda u: external_fetch_detail(session, u), urls))
+
     seminars: List[Dict[str, Any]] = []
-    for u, teaser_title in all_listing_info.items():
-        try:
-            html = external_fetch(session, u)
-        except Exception:
-            print(f"Failed to fetch {u}")
+    for u, html in zip(urls, pages):
+        if html is None:
             continue
+        teaser_title = all_listing_info[u]
+        soup = None  # only parsed if the JSON-LD leaves gaps
         blocks = external_extract_jsonld(html)
         ev = external_first_event_jsonld(blocks)
 
@@ -462,7 +677,7 @@ def scrape_external_seminars() -> List[Dict[str, Any]]:
             if ev:
                 title = norm_space(str(ev.get("name", "")))
             if not title:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = parse_html(html)
                 h1 = soup.select_one("h1")
                 if h1:
                     title = norm_space(h1.get_text(" ", strip=True))
@@ -471,7 +686,9 @@ def scrape_external_seminars() -> List[Dict[str, Any]]:
         if ev:
             desc = norm_space(str(ev.get("description", "")))
         if not desc:
-            desc = external_detail_page_text_description(html)
+            if soup is None:
+                soup = parse_html(html)
+            desc = external_detail_page_text_description(soup)
 
         group_label, speaker_name = external_parse_group_and_speaker_from_title(title)
         if not date_iso:
@@ -487,7 +704,6 @@ def scrape_external_seminars() -> List[Dict[str, Any]]:
                 "speaker_name": speaker_name,
             }
         )
-        time.sleep(0.1)
 
     return seminars
 
@@ -611,23 +827,26 @@ def scrape_interest_group_events(page, events_url: str) -> List[Dict[str, Any]]:
     except PWTimeoutError:
         return []
 
-    rows = page.locator(ROW_SELECTOR)
+    rows = page.eval_on_selector_all(
+        ROW_SELECTOR,
+        EVENT_ROWS_JS,
+        {
+            "title": TITLE_SELECTOR,
+            "link": LINK_SELECTOR,
+            "group": SPEAKER_GROUP_SELECTOR,
+            "name": SPEAKER_NAME_SELECTOR,
+            "lab": SPEAKER_LAB_SELECTOR,
+        },
+    )
     out: List[Dict[str, Any]] = []
+    t_iso = today_iso()
 
-    for i in range(rows.count()):
-        row = rows.nth(i)
-
-        title = safe_inner_text(row.locator(TITLE_SELECTOR))
+    for row in rows:
+        title = row.get("title") or ""
         if not is_interest_group_seminar(title):
             continue
 
-        href = ""
-        try:
-            if row.locator(LINK_SELECTOR).count() > 0:
-                href = row.locator(LINK_SELECTOR).first.get_attribute("href") or ""
-        except Exception:
-            href = ""
-
+        href = row.get("href") or ""
         iso_date = parse_iso_date_from_event_link(href)
         category = extract_category_from_title(title)
 
@@ -635,25 +854,12 @@ def scrape_interest_group_events(page, events_url: str) -> List[Dict[str, Any]]:
             continue
 
         # Only today onwards
-        if iso_date < today_iso():
+        if iso_date < t_iso:
             continue
 
-        speakers: List[Tuple[str, str]] = []
-        try:
-            groups = row.locator(SPEAKER_GROUP_SELECTOR)
-            for gi in range(groups.count()):
-                g = groups.nth(gi)
-                name = safe_inner_text(g.locator(SPEAKER_NAME_SELECTOR))
-
-                labs = g.locator(SPEAKER_LAB_SELECTOR)
-                lab_text = ""
-                if labs.count() > 0:
-                    lab_text = labs.last.inner_text().strip()
-
-                if name:
-                    speakers.append((name, lab_text))
-        except Exception:
-            pass
+        speakers: List[Tuple[str, str]] = [
+            (name, lab_text) for name, lab_text in row.get("speakers") or [] if name
+        ]
 
         out.append(
             {
@@ -668,45 +874,58 @@ def scrape_interest_group_events(page, events_url: str) -> List[Dict[str, Any]]:
     return out
 
 
-def load_expected_from_json(path: str, group_name: str) -> Dict[Tuple[str, str], List[Dict[str, str]]]:
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
-    records = raw.get("records", []) if isinstance(raw, dict) else raw
+# Comparison items paired with their normalised (speaker, lab) sort key
+KeyedItem = Tuple[Tuple[str, str], Dict[str, str]]
 
-    out: Dict[Tuple[str, str], List[Dict[str, str]]] = {}
-    t_iso = today_iso()
 
+def keyed_item(speaker: str, lab: str) -> KeyedItem:
+    item = {"key": key_speaker_lab(speaker, lab), "speaker": speaker, "lab": lab}
+    return (norm_text(speaker), norm_text(lab)), item
+
+
+def sorted_items(keyed: List[KeyedItem]) -> List[Dict[str, str]]:
+    if len(keyed) < 2:  # most date buckets hold a single speaker
+        return [item for _, item in keyed]
+    return [item for _, item in sorted(keyed, key=itemgetter(0))]
+
+
+def load_all_expected(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Read the SharePoint export once, grouping its records by lower-cased group name."""
+    raw = read_json_file(path)
+    records = raw.get("records", []) if isinstance(raw, dict) else raw
+
+    index: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for r in records:
-        if not isinstance(r, dict):
-            continue
+        if isinstance(r, dict):
+            index[field_str(r, "name").lower()].append(r)
+    return dict(index)
 
-        name = str(r.get("name", "")).strip()
-        if name.lower() != group_name.lower():
-            continue
 
-        status = str(r.get("status", "")).strip().lower()
-        if status != "confirmed":
+def expected_from_records(records: List[Dict[str, Any]]) -> Dict[Tuple[str, str], List[Dict[str, str]]]:
+    """Confirmed, upcoming speakers from one group's records (see load_all_expected)."""
+    keyed: Dict[Tuple[str, str], List[KeyedItem]] = defaultdict(list)
+    t_iso = today_iso()
+
+    for r in records:
+        if field_str(r, "status").lower() != "confirmed":
             continue
 
-        cat_raw = str(r.get("category", "")).strip()
-        category = canonicalise_category_from_sheet(cat_raw)
+        category = canonicalise_category_from_sheet(field_str(r, "category"))
         if category not in {"Internal", "External"}:
             continue
 
-        d = str(r.get("date", "")).strip()
+        d = field_str(r, "date")
         if not d or d < t_iso:
             continue
 
-        speaker = str(r.get("speaker_name", "")).strip()
-        lab = str(r.get("lab_affiliation", "")).strip()
+        speaker = field_str(r, "speaker_name")
+        lab = field_str(r, "lab_affiliation")
         if not speaker:
             continue
 
-        item = {"key": key_speaker_lab(speaker, lab), "speaker": speaker, "lab": lab}
-        out.setdefault((d, category), []).append(item)
+        keyed[(d, category)].append(keyed_item(speaker, lab))
 
-    for k in out:
-        out[k] = sorted(out[k], key=lambda x: (norm_text(x.get("speaker", "")), norm_text(x.get("lab", ""))))
-    return out
+    return {k: sorted_items(v) for k, v in keyed.items()}
 
 
 def build_found_map(events: List[Dict[str, Any]]) -> Dict[Tuple[str, str], List[Dict[str, str]]]:
@@ -714,15 +933,15 @@ def build_found_map(events: List[Dict[str, Any]]) -> Dict[Tuple[str, str], List[
     t_iso = today_iso()
 
     for ev in events:
-        d = str(ev.get("date", ""))
-        cat = str(ev.get("category", ""))
+        d = field_str(ev, "date")
+        cat = field_str(ev, "category")
         if not d or not cat:
             continue
         if d < t_iso:
             continue
 
         speakers = ev.get("speakers", [])
-        items: List[Dict[str, str]] = []
+        items: List[KeyedItem] = []
 
         if isinstance(speakers, list):
             for pair in speakers:
@@ -732,9 +951,9 @@ def build_found_map(events: List[Dict[str, Any]]) -> Dict[Tuple[str, str], List[
                 lab = str(pair[1]).strip()
                 if not sp:
                     continue
-                items.append({"key": key_speaker_lab(sp, lab), "speaker": sp, "lab": lab})
+                items.append(keyed_item(sp, lab))
 
-        out[(d, cat)] = sorted(items, key=lambda x: (norm_text(x.get("speaker", "")), norm_text(x.get("lab", ""))))
+        out[(d, cat)] = sorted_items(items)
 
     return out
 
@@ -744,31 +963,30 @@ def build_external_found_by_group(
 ) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
     label_to_json: Dict[str, str] = {}
     for g in GROUPS:
-        json_name = str(g.get("json", "")).strip()
+        json_name = field_str(g, "json")
         label = JSON_TO_WEBSITE_GROUP.get(json_name, json_name)
         label_to_json[norm_text(label)] = json_name
 
-    out: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+    keyed: Dict[str, Dict[str, List[KeyedItem]]] = defaultdict(lambda: defaultdict(list))
     t_iso = today_iso()
 
     for s in seminars:
-        d = str(s.get("date_iso", "")).strip()
+        d = field_str(s, "date_iso")
         if not d or d < t_iso:
             continue
-        group_label = str(s.get("group_label", "")).strip()
-        speaker = str(s.get("speaker_name", "")).strip()
+        group_label = field_str(s, "group_label")
+        speaker = field_str(s, "speaker_name")
         if not group_label or not speaker:
             continue
         json_name = label_to_json.get(norm_text(group_label))
         if not json_name:
             continue
-        item = {"key": key_speaker_lab(speaker, ""), "speaker": speaker, "lab": ""}
-        out.setdefault(json_name, {}).setdefault(d, []).append(item)
+        keyed[json_name][d].append(keyed_item(speaker, ""))
 
-    for g_map in out.values():
-        for k in g_map:
-            g_map[k] = sorted(g_map[k], key=lambda x: norm_text(x.get("speaker", "")))
-    return out
+    return {
+        json_name: {d: sorted_items(items) for d, items in g_map.items()}
+        for json_name, g_map in keyed.items()
+    }
 
 
 # ---------------------------
@@ -780,42 +998,83 @@ def build_global_speaker_lookup(
     """Build a lookup of all speakers across all dates for cross-date matching.
     
     Returns a dict keyed by normalized speaker name, with list of entries containing
-    date_iso, category, and original item data.
+    date_iso, category, and original item data. Each speaker has at most one entry
+    per date (the first seen), so see entry_on_other_date.
     """
-    lookup: Dict[str, List[Dict[str, Any]]] = {}
+    lookup: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    seen: Set[Tuple[str, str]] = set()
     for (date_iso, category), items in found_map.items():
         for item in items:
             speaker_norm = norm_text(item.get("speaker", ""))
-            if speaker_norm:
-                if speaker_norm not in lookup:
-                    lookup[speaker_norm] = []
+            if speaker_norm and (speaker_norm, date_iso) not in seen:
+                seen.add((speaker_norm, date_iso))
                 lookup[speaker_norm].append({
                     "date_iso": date_iso,
                     "category": category,
                     **item
                 })
-    return lookup
+    return dict(lookup)
+
+
+def entry_on_other_date(entries: List[Dict[str, Any]], current_date: str) -> Optional[Dict[str, Any]]:
+    """First lookup entry not on current_date; with one entry per date it is one of the first two."""
+    for entry in entries[:2]:
+        if entry.get("date_iso") != current_date:
+            return entry
+    return None
 
 
 def build_external_website_lookup(
     seminars: List[Dict[str, Any]]
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Build a lookup of external website seminars by normalized speaker name."""
-    lookup: Dict[str, List[Dict[str, Any]]] = {}
+    lookup: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for s in seminars:
-        speaker = str(s.get("speaker_name", "")).strip()
+        speaker = field_str(s, "speaker_name")
         speaker_norm = norm_text(speaker)
         if not speaker_norm:
             continue
-        if speaker_norm not in lookup:
-            lookup[speaker_norm] = []
         lookup[speaker_norm].append(s)
-    return lookup
+    return dict(lookup)
 
 
 # ---------------------------
 # Comparison model for report
 # ---------------------------
+class AnalysisRow(NamedTuple):
+    """A leftover expected or found item, classified before pairing into rows."""
+    item: Dict[str, str]
+    disp: str
+    type: str  # "missing" / "extra" / "date_mismatch"
+    other_date: str
+    note: str
+
+
+class ComparisonRow(NamedTuple):
+    """One line of a section's comparison table."""
+    status: str  # "ok" / "warn" / "bad" / "extra" / "date_mismatch"
+    icon: str
+    expected: str
+    found: str
+    note: str
+    score: Optional[int]  # percent similarity for fuzzy matches
+
+
+# (missing type, extra type) -> (status, icon, note before / after the external-site note).
+# Notes are formatted with source=<source label> and note=<the missing item's note>.
+DATE_MISMATCH_OUTCOME = ("date_mismatch", "📅", "Date mismatch", "")
+ROW_OUTCOMES: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, str, str, str]] = {
+    ("missing", None): ("bad", "❌", "", "{note}"),
+    (None, "extra"): ("extra", "➕", "", ""),
+    ("missing", "extra"): ("warn", "⚠️", "", "Mismatch on {source}"),
+    ("date_mismatch", None): DATE_MISMATCH_OUTCOME,
+    ("date_mismatch", "extra"): DATE_MISMATCH_OUTCOME,
+    ("date_mismatch", "date_mismatch"): DATE_MISMATCH_OUTCOME,
+    ("missing", "date_mismatch"): DATE_MISMATCH_OUTCOME,
+    (None, "date_mismatch"): DATE_MISMATCH_OUTCOME,
+}
+
+
 def build_comparison_rows(
     expected_items: List[Dict[str, str]],
     found_items: List[Dict[str, str]],
@@ -824,7 +1083,7 @@ def build_comparison_rows(
     cricknet_speaker_lookup: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     spreadsheet_speaker_lookup: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     external_website_lookup: Optional[Dict[str, List[Dict[str, Any]]]] = None,
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+) -> Tuple[List[ComparisonRow], Dict[str, Any]]:
     """Build comparison rows between expected (spreadsheet) and found (CrickNet) items.
     
     Args:
@@ -835,24 +1094,30 @@ def build_comparison_rows(
         cricknet_speaker_lookup: All CrickNet speakers across all dates (for checking missing)
         spreadsheet_speaker_lookup: All spreadsheet speakers across all dates (for checking extras)
     """
-    got_keys = {x["key"] for x in found_items if "key" in x}
-    exp_keys = {x["key"] for x in expected_items if "key" in x}
-
-    got_key_set: Set[str] = set(got_keys)
-    consumed_got: Set[str] = set()
-
-    rows: List[Dict[str, Any]] = []
+    found_keys = [g.get("key") or "" for g in found_items]
+    found_by_key: Dict[str, Dict[str, str]] = {}
+    for g, g_key in zip(found_items, found_keys):
+        if g_key:
+            found_by_key.setdefault(g_key, g)
+    # Found keys not yet claimed by an expected item
+    remaining_found: Set[str] = set(found_by_key)
+
+    # Display text and normalised speaker, computed once per item (keyed by id)
+    disp_of: Dict[int, str] = {}
+    speaker_of: Dict[int, str] = {}
+    for x in itertools.chain(expected_items, found_items):
+        disp_of[id(x)] = display_item(x)
+        speaker_of[id(x)] = norm_text(x.get("speaker", ""))
+
+    rows: List[ComparisonRow] = []
     any_mismatch = False
     
-    # Lists to collect detail info for summary
+    # Date mismatches collected for the summary (missing/extra lists are derived from the analysis)
     date_mismatches_summary: List[Dict[str, Any]] = []
-    truly_missing: List[str] = []
-    truly_extra: List[str] = []
 
-    def check_external(speaker_name: str) -> Optional[str]:
+    def check_external(norm_s: str) -> Optional[str]:
         if not external_website_lookup:
             return None
-        norm_s = norm_text(speaker_name)
         if not norm_s:
             return None
         
@@ -875,55 +1140,58 @@ def build_comparison_rows(
     unmatched_expected = []
     for e in expected_items:
         e_key = e.get("key", "")
-        e_disp = display_item(e)
+        e_disp = disp_of[id(e)]
         
-        if e_key in got_key_set:
+        if e_key in found_by_key:
             note = f"Scheduled on {source_label}"
-            ext_msg = check_external(e.get("speaker", ""))
+            ext_msg = check_external(speaker_of[id(e)])
             if ext_msg:
                 note += f"; {ext_msg}"
 
-            rows.append({
-                "status": "ok",
-                "icon": "✅",
-                "expected": e_disp,
-                "found": e_disp,
-                "note": note,
-                "score": None,
-            })
-            consumed_got.add(e_key)
+            rows.append(ComparisonRow("ok", "✅", e_disp, e_disp, note, None))
+            remaining_found.discard(e_key)
         else:
             unmatched_expected.append(e)
 
     # 2. Fuzzy matches from remainders
+    # Score all remaining expected items against all candidates up front; each
+    # expected item then takes its best candidate that is still unconsumed.
+    candidates = [g for g, g_key in zip(found_items, found_keys) if g_key in remaining_found]
+    cand_keys = [g["key"] for g in candidates]
+    cand_speakers = [speaker_of[id(g)] for g in candidates]
+    key_scores = similarity_matrix([e.get("key", "") for e in unmatched_expected], cand_keys, MIN_FUZZY_SCORE)
+    speaker_scores: Optional[List[List[float]]] = None
+
+    def pick_candidate(scores: List[float], require_speaker: bool = False) -> Tuple[Optional[str], float]:
+        best = None
+        best_score = 0.0
+        for j, sc in enumerate(scores):
+            if sc > best_score and cand_keys[j] in remaining_found:
+                if require_speaker and not cand_speakers[j]:
+                    continue
+                best = cand_keys[j]
+                best_score = sc
+        return best, best_score
+
     still_unmatched_expected = []
-    for e in unmatched_expected:
-        e_key = e.get("key", "")
-        e_disp = display_item(e)
-        candidates = [g for g in found_items if g.get("key") not in consumed_got]
-        
-        best, score = best_fuzzy_match(e_key, {g.get("key") for g in candidates if g.get("key")})
+    for i, e in enumerate(unmatched_expected):
+        e_disp = disp_of[id(e)]
+        best, score = pick_candidate(key_scores[i])
         used_speaker_fallback = False
         
         if not (best and score >= MIN_FUZZY_SCORE):
             # Try speaker-only match
-            target_speaker = norm_text(e.get("speaker", ""))
-            best = None
-            score = 0.0
-            for g in candidates:
-                g_key = g.get("key", "")
-                g_speaker = norm_text(g.get("speaker", ""))
-                if not g_key or not g_speaker:
-                    continue
-                sc = similarity(target_speaker, g_speaker)
-                if sc > score:
-                    score = sc
-                    best = g_key
+            if speaker_scores is None:
+                speaker_scores = similarity_matrix(
+                    [speaker_of[id(x)] for x in unmatched_expected], cand_speakers, MIN_FUZZY_SCORE
+                )
+            best, score = pick_candidate(speaker_scores[i], require_speaker=True)
             if best and score >= MIN_FUZZY_SCORE:
                 used_speaker_fallback = True
 
         if best and score >= MIN_FUZZY_SCORE:
-            best_disp = next((display_item(g) for g in found_items if g.get("key") == best), best)
+            best_item = found_by_key.get(best, {})
+            best_disp = disp_of[id(best_item)] if best_item else best
             
             note = f"Closest match on {source_label}"
             status = "warn"
@@ -936,53 +1204,37 @@ def build_comparison_rows(
             elif used_speaker_fallback:
                  note = f"Closest match on {source_label} (speaker)"
 
-            best_item = next((g for g in found_items if g.get("key") == best), {})
-            ext_msg = check_external(best_item.get("speaker", ""))
+            ext_msg = check_external(speaker_of.get(id(best_item), ""))
             if ext_msg:
                 note += f"; {ext_msg}"
                 if status == "ok": # Downgrade OK if external issue? User said "flagged".
                     status = "warn"
                     icon = "⚠️"
 
-            rows.append({
-                "status": status,
-                "icon": icon,
-                "expected": e_disp,
-                "found": best_disp,
-                "note": note,
-                "score": round(score * 100),
-            })
+            rows.append(ComparisonRow(status, icon, e_disp, best_disp, note, round(score * 100)))
             if status != "ok":
                 any_mismatch = True
-            consumed_got.add(best)
+            remaining_found.discard(best)
         else:
             still_unmatched_expected.append(e)
 
     # 3. Analyze leftovers for Date Mismatches
     
     # Remaining Expected items (potential missing or date mismatch)
-    missing_analysis = []
+    missing_analysis: List[AnalysisRow] = []
     for e in still_unmatched_expected:
-        e_disp = display_item(e)
-        e_speaker_norm = norm_text(e.get("speaker", ""))
+        e_disp = disp_of[id(e)]
+        e_speaker_norm = speaker_of[id(e)]
         
         found_on_other_date = None
         if cricknet_speaker_lookup and e_speaker_norm:
-            other_entries = cricknet_speaker_lookup.get(e_speaker_norm, [])
-            for entry in other_entries:
-                if entry.get("date_iso") != current_date:
-                    found_on_other_date = entry
-                    break
+            found_on_other_date = entry_on_other_date(cricknet_speaker_lookup.get(e_speaker_norm, []), current_date)
         
         if found_on_other_date:
             other_date = found_on_other_date.get("date_iso", "")
-            missing_analysis.append({
-                "item": e,
-                "disp": e_disp,
-                "type": "date_mismatch",
-                "other_date": other_date,
-                "note": f"Scheduled on {other_date} on {source_label}"
-            })
+            missing_analysis.append(
+                AnalysisRow(e, e_disp, "date_mismatch", other_date, f"Scheduled on {other_date} on {source_label}")
+            )
             date_mismatches_summary.append({
                 "speaker": e_disp,
                 "expected_date": current_date,
@@ -990,38 +1242,26 @@ def build_comparison_rows(
                 "direction": "spreadsheet_to_cricknet"
             })
         else:
-            missing_analysis.append({
-                "item": e,
-                "disp": e_disp,
-                "type": "missing",
-                "note": f"Not scheduled on {source_label}"
-            })
-            truly_missing.append(e_disp)
+            missing_analysis.append(AnalysisRow(e, e_disp, "missing", "", f"Not scheduled on {source_label}"))
 
     # Remaining Found items (potential extra or date mismatch)
-    extras = [g for g in found_items if g.get("key") not in consumed_got]
-    extra_analysis = []
+    extras = [g for g, g_key in zip(found_items, found_keys) if not g_key or g_key in remaining_found]
+    extra_analysis: List[AnalysisRow] = []
     for x in extras:
-        x_disp = display_item(x)
-        x_speaker_norm = norm_text(x.get("speaker", ""))
+        x_disp = disp_of[id(x)]
+        x_speaker_norm = speaker_of[id(x)]
         
         found_on_spreadsheet_other_date = None
         if spreadsheet_speaker_lookup and x_speaker_norm:
-            other_entries = spreadsheet_speaker_lookup.get(x_speaker_norm, [])
-            for entry in other_entries:
-                if entry.get("date_iso") != current_date:
-                    found_on_spreadsheet_other_date = entry
-                    break
+            found_on_spreadsheet_other_date = entry_on_other_date(
+                spreadsheet_speaker_lookup.get(x_speaker_norm, []), current_date
+            )
         
         if found_on_spreadsheet_other_date:
             spreadsheet_date = found_on_spreadsheet_other_date.get("date_iso", "")
-            extra_analysis.append({
-                "item": x,
-                "disp": x_disp,
-                "type": "date_mismatch",
-                "other_date": spreadsheet_date,
-                "note": f"Expected on {spreadsheet_date} per spreadsheet"
-            })
+            extra_analysis.append(
+                AnalysisRow(x, x_disp, "date_mismatch", spreadsheet_date, f"Expected on {spreadsheet_date} per spreadsheet")
+            )
             date_mismatches_summary.append({
                 "speaker": x_disp,
                 "expected_date": spreadsheet_date,
@@ -1029,84 +1269,42 @@ def build_comparison_rows(
                 "direction": "cricknet_to_spreadsheet"
             })
         else:
-            extra_analysis.append({
-                "item": x,
-                "disp": x_disp,
-                "type": "extra",
-                "note": ""
-            })
-            truly_extra.append(x_disp)
+            extra_analysis.append(AnalysisRow(x, x_disp, "extra", "", ""))
+
+    # Built in one go now that both sides are classified
+    truly_missing = [a.disp for a in missing_analysis if a.type == "missing"]
+    truly_extra = [a.disp for a in extra_analysis if a.type == "extra"]
 
     # 4. Pair up and create rows
     # We zip the lists. If one is longer, we handle leftovers.
-    import itertools
     for m, x in itertools.zip_longest(missing_analysis, extra_analysis):
         any_mismatch = True
-        
-        # Prepare row data
-        e_disp = m["disp"] if m else "(extra on CrickNet)"
-        f_disp = x["disp"] if x else "(none)"
-        
-        # Determine status and note
-        status = "bad" # default
-        icon = "❌"
-        note_parts = []
-        
-        is_date_mismatch = False
-        
-        if m:
-            if m["type"] == "date_mismatch":
-                is_date_mismatch = True
-                note_parts.append("Date mismatch")
-            elif m["type"] == "missing":
-                pass # Status bad
+        # Paired Missing + Extra (checking slot mismatch) is a generic warn;
+        # any date mismatch on either side wins ("date_mismatch" maps to Check)
+        status, icon, note_head, note_tail = ROW_OUTCOMES[(m.type if m else None, x.type if x else None)]
+        note_parts: List[str] = [note_head] if note_head else []
         
         if x:
-            if x["type"] == "date_mismatch":
-                is_date_mismatch = True
-                if "Date mismatch" not in note_parts:
-                    note_parts.append("Date mismatch")
-            
             # Check external consistency for the Found item
-            ext_msg = check_external(x["item"].get("speaker", ""))
+            ext_msg = check_external(speaker_of[id(x.item)])
             if ext_msg:
                 note_parts.append(ext_msg)
-            
-            elif x["type"] == "extra":
-                if not m:
-                    status = "extra"
-                    icon = "➕"
         
-        if is_date_mismatch:
-            status = "date_mismatch" # Maps to Check
-            icon = "📅"
-        elif m and not x:
-             status = "bad"
-             icon = "❌"
-             note_parts.append(m["note"])
-        elif x and not m:
-             status = "extra"
-             icon = "➕"
-        elif m and x:
-             # Paired Missing + Extra (checking slot mismatch)
-             # If neither is officially a date mismatch, treat as a generic mismatch/warn
-             if not is_date_mismatch:
-                 status = "warn"
-                 icon = "⚠️"
-                 note_parts.append(f"Mismatch on {source_label}")
+        if note_tail:
+            note_parts.append(note_tail.format(source=source_label, note=m.note if m else ""))
 
         # Improve note for combined row
         # If we have both, combine notes?
         # User wants "Found: Sunaina" (Extra) next to "Expected: Giampietro" (Missing)
         
-        rows.append({
-            "status": status,
-            "icon": icon,
-            "expected": m["disp"] if m else "", # Empty string or explicit label? User screenshot shows blank expected for extra
-            "found": x["disp"] if x else "",
-            "note": "; ".join(note_parts) if note_parts else "",
-            "score": None
-        })
+        rows.append(ComparisonRow(
+            status,
+            icon,
+            m.disp if m else "",  # Empty string or explicit label? User screenshot shows blank expected for extra
+            x.disp if x else "",
+            "; ".join(note_parts) if note_parts else "",
+            None,
+        ))
 
 
 
@@ -1147,7 +1345,7 @@ def build_report_model() -> Dict[str, Any]:
 
     if Path(LOCAL_JSON_PATH).exists():
         try:
-            raw = json.loads(Path(LOCAL_JSON_PATH).read_text(encoding="utf-8"))
+            raw = read_json_file(LOCAL_JSON_PATH)
             if isinstance(raw, dict):
                 lu_str = str(raw.get("lastUpdated", "")).strip()
                 model["sourceLastUpdated"] = lu_str
@@ -1157,7 +1355,7 @@ def build_report_model() -> Dict[str, Any]:
                     model["recordCount"] = len(recs)
                 if lu_str:
                     try:
-                        lu_dt = datetime.fromisoformat(lu_str.replace("Z", "+00:00")).astimezone(LOCAL_TZ)
+                        lu_dt = parse_iso_datetime(lu_str).astimezone(LOCAL_TZ)
                         model["sourceLastUpdatedFriendly"] = format_friendly_dt(lu_dt)
                     except Exception:
                         model["sourceLastUpdatedFriendly"] = lu_str
@@ -1207,579 +1405,298 @@ def generate_mailto(group_name: str, missing_list: List[str], date_str: str) ->
     return f"mailto:{EMAIL_CONFIG['to']}?{query}"
 
 
-def render_report_html(report: Dict[str, Any]) -> str:
-    generated_friendly = html_escape(str(report.get("generated_friendly", "")))
-    source_updated_friendly = html_escape(str(report.get("sourceLastUpdatedFriendly", "")))
-    report_date_iso_raw = str(report.get("reportDateIso", "")).strip()
-    if not report_date_iso_raw:
-        report_date_iso_raw = today_iso()
-    report_date_iso = html_escape(report_date_iso_raw)
-    # Countdown: render DaisyUI markup (do NOT html_escape this block)
-    next_update_msg_fallback = html_escape(str(report.get("nextUpdateMsg", "")))
-    next_due = bool(report.get("nextUpdateDue", False))
-    next_target = report.get("nextUpdateTargetEpoch")
+@lru_cache(maxsize=2048)
+def generate_mailto_cached(group_name: str, missing: Tuple[str, ...], date_str: str) -> str:
+    """generate_mailto for repeated (group, speakers, date) combinations in one report."""
+    return generate_mailto(group_name, list(missing), date_str)
 
-    if next_due or not next_target:
-        next_update_html = next_update_msg_fallback
-    else:
-        next_update_html = f"""
-          <span class=\"mr-2\">Next update in</span>
-          <span id=\"next-update-countdown\" data-target-epoch=\"{int(next_target)}\">
-            <span class=\"countdown font-mono\"><span id=\"cd-hours\" style=\"--value:0;\" aria-live=\"polite\" aria-label=\"0\">0</span></span>h
-            <span class=\"countdown font-mono ml-2\"><span id=\"cd-mins\" style=\"--value:0;\" aria-live=\"polite\" aria-label=\"0\">0</span></span>m
-            <span class=\"countdown font-mono ml-2\"><span id=\"cd-secs\" style=\"--value:0;\" aria-live=\"polite\" aria-label=\"0\">0</span></span>s
-          </span>
-        """
-    if not generated_friendly:
-        generated_friendly = html_escape(str(report.get("generatedAt", "")))
-    if not source_updated_friendly:
-        source_updated_friendly = html_escape(str(report.get("sourceLastUpdated", "")))
-    if not source_updated_friendly:
-        source_updated_friendly = "Unknown"
 
-    priority = report.get("priority", [])
-    groups = report.get("groups", [])
+GROUP_PALETTE = {
+    "cancer": "var(--col-blue)",
+    "development-and-stem-cells": "var(--col-taupe)",
+    "genes-to-cells": "var(--col-clay)",
+    "immunology": "var(--col-bronze)",
+    "host-and-pathogen": "var(--col-sand)",
+    "neuroscience": "var(--col-blue)",
+    "structural-chemical-biology": "var(--col-taupe)",
+}
+GROUP_COLOR_CSS = "\n".join(f".group-{slug} {{ --group-color: {color}; }}" for slug, color in GROUP_PALETTE.items())
 
-    def group_slug(name: str) -> str:
-        s = re.sub(r"[^a-z0-9]+", "-", (name or "").strip().lower())
-        return s.strip("-") or "group"
 
-    def section_anchor(group_name: str, date_iso: str, category: str) -> str:
-        g_slug = group_slug(group_name)
-        d = re.sub(r"[^0-9]+", "-", (date_iso or "").strip()).strip("-") or "date"
-        c_slug = group_slug(category)
-        return f"section-{g_slug}-{d}-{c_slug}"
+# Badge buckets each row status counts towards:
+# OK -> OK + Confirmed, Warn -> Check + Confirmed, Bad -> Missing + Confirmed,
+# Extra -> Check (but NOT confirmed). Date mismatches are not counted.
+STATUS_BADGES = {
+    "ok": ("ok", "confirmed"),
+    "warn": ("check", "confirmed"),
+    "bad": ("missing", "confirmed"),
+    "extra": ("check",),
+}
+BADGE_NAMES = ("confirmed", "ok", "missing", "check")
+# Row statuses that flag a section for checking
+CHECK_STATUSES = frozenset(("warn", "extra", "date_mismatch"))
 
-    priority_groups = {p.get("group", "") for p in priority if p.get("group")}
-    priority_group_count = len(priority_groups)
-    priority_item_count = len(priority)
-    priority_counts: Dict[str, int] = {}
-    priority_counts_int: Dict[str, int] = {}
-    priority_counts_ext: Dict[str, int] = {}
-    priority_display: Dict[str, str] = {}
 
-    for g in groups:
-        slug = group_slug(g.get("display", ""))
-        priority_counts[slug] = 0
-        priority_counts_int[slug] = 0
-        priority_counts_ext[slug] = 0
-        priority_display[slug] = str(g.get("display", "")).strip()
+def status_badge(status: str) -> str:
+    if status == "ok":
+        return "badge badge-success"
+    if status == "warn":
+        return "badge badge-warning"
+    if status == "bad":
+        return "badge badge-error"
+    if status == "date_mismatch":
+        return "badge badge-warning"  # Amber/orange for date mismatch
+    return "badge"
 
-    for p in priority:
-        slug = group_slug(p.get("group", ""))
-        priority_counts[slug] = priority_counts.get(slug, 0) + 1
 
-        cat = str(p.get("category", "")).strip().lower()
-        if "external" in cat:
-            priority_counts_ext[slug] = priority_counts_ext.get(slug, 0) + 1
-        else:
-            # Treat anything not explicitly external as internal
-            priority_counts_int[slug] = priority_counts_int.get(slug, 0) + 1
+def status_label(status: str) -> str:
+    return {"ok": "OK", "warn": "Check", "bad": "Missing", "extra": "Extra", "date_mismatch": "Check"}.get(status, status)
 
-        if slug not in priority_display:
-            priority_display[slug] = str(p.get("group", "")).strip()
 
-    priority_summary_items = "\n".join(
-        f'''
-        <div class="priority-count group-{slug}">
-          <span class="label">{html_escape(priority_display.get(slug, slug))}</span>
+def status_cell_html(status: str) -> str:
+    return f'<span class="{status_badge(status)}">{html_escape(status_label(status))}</span>'
+
+
+# " (N% similar)" note suffix for every possible fuzzy-match score
+SCORE_SUFFIXES = [f" ({n}% similar)" for n in range(101)]
+
+# Status cell markup for every status build_comparison_rows emits
+STATUS_CELLS = {st: status_cell_html(st) for st in ("ok", "warn", "bad", "extra", "date_mismatch")}
+
+
+def count_row_statuses(sections: List[Dict[str, Any]]) -> Counter:
+    """Count rows by (status, is_external) across the given sections."""
+    counts: Counter = Counter()
+    for s in sections:
+        is_ext = "external" in str(s.get("category", "")).lower()  # covers "External" and "External website"
+        counts.update((r.status, is_ext) for r in s.get("rows", []))
+    return counts
+
+
+def badge_stats(counts: Counter) -> Dict[str, Dict[str, int]]:
+    """
+    Returns a dict of status -> {total, int, ext}
+    Statuses: confirmed, ok, missing, check.
+    """
+    stats = {name: {"total": 0, "int": 0, "ext": 0} for name in BADGE_NAMES}
+    for (status, is_ext), n in counts.items():
+        side = "ext" if is_ext else "int"
+        for name in STATUS_BADGES.get(status, ()):
+            bucket = stats[name]
+            bucket["total"] += n
+            bucket[side] += n
+    return stats
+
+
+# Repeated report fragments, filled with %-formatting from already-escaped fields
+CALENDAR_PILL_HTML = """
+        <a href="#%(anchor)s" class="cal-pill group-%(slug)s %(border)s is-hidden" data-cal-date="%(date)s" title="%(label)s">
+            <span class="cal-dot group-%(slug)s"></span>
+            <span class="cal-text">%(short)s</span>
+        </a>
+        """
+
+PRIORITY_COUNT_HTML = """
+        <div class="priority-count group-%s">
+          <span class="label">%s</span>
           <div class="dropdown dropdown-hover dropdown-end">
-            <div tabindex="0" role="button" class="value">{priority_counts.get(slug, 0)}</div>
+            <div tabindex="0" role="button" class="value">%d</div>
             <ul tabindex="-1" class="dropdown-content menu bg-base-100 rounded-box z-10 w-40 p-2 shadow-sm">
-              <li><a>Internal {priority_counts_int.get(slug, 0)}</a></li>
-              <li><a>External {priority_counts_ext.get(slug, 0)}</a></li>
+              <li><a>Internal %d</a></li>
+              <li><a>External %d</a></li>
             </ul>
           </div>
         </div>
-        '''
-        for slug in priority_display
-    )
+        """
 
-    group_filter_options = "\n".join(
-        f'<option value="{group_slug(g.get("display", ""))}">{html_escape(g.get("display", ""))}</option>'
-        for g in groups
-    )
+GROUP_OPTION_HTML = '<option value="%s">%s</option>'
 
-    def get_badge_counts_by_category(sections: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
-        """
-        Returns a dict of status -> {total, int, ext}
-        Statuses: confirmed, ok, missing, check.
-        Logic mostly mirroring count_statuses but split by category.
+GROUP_NAV_HTML = """
+          <li class="group-%(slug)s" data-has-issues="%(has_issues)s">
+            <a class="group-link group-%(slug)s" href="#group-%(slug)s" data-group-link="%(slug)s">
+              <span class="name">%(name)s</span>
+              <span class="group-badges text-xs">
+                <span class="badge badge-ghost">%(confirmed)d</span>
+                <span class="badge badge-success">%(ok)d</span>
+                <span class="badge badge-error">%(missing)d</span>
+                <span class="badge badge-warning">%(check)d</span>
+              </span>
+            </a>
+          </li>
         """
-        stats = {
-            "confirmed": {"total": 0, "int": 0, "ext": 0},
-            "ok":        {"total": 0, "int": 0, "ext": 0},
-            "missing":   {"total": 0, "int": 0, "ext": 0},
-            "check":     {"total": 0, "int": 0, "ext": 0},
-        }
 
-        for s in sections:
-            cat_raw = str(s.get("category", "")).lower()
-            is_ext = ("external" in cat_raw) # covers "External" and "External website"
-            
-            for r in s.get("rows", []):
-                st = r.get("status")
-                
-                # Logic:
-                # OK -> OK + Confirmed
-                # Warn -> Check + Confirmed
-                # Bad -> Missing + Confirmed
-                # Extra -> Check (but NOT confirmed)
-
-                if st == "ok":
-                    stats["ok"]["total"] += 1
-                    stats["confirmed"]["total"] += 1
-                    if is_ext:
-                        stats["ok"]["ext"] += 1
-                        stats["confirmed"]["ext"] += 1
-                    else:
-                        stats["ok"]["int"] += 1
-                        stats["confirmed"]["int"] += 1
-
-                elif st == "warn":
-                    stats["check"]["total"] += 1
-                    stats["confirmed"]["total"] += 1
-                    if is_ext:
-                        stats["check"]["ext"] += 1
-                        stats["confirmed"]["ext"] += 1
-                    else:
-                        stats["check"]["int"] += 1
-                        stats["confirmed"]["int"] += 1
-
-                elif st == "bad":
-                    stats["missing"]["total"] += 1
-                    stats["confirmed"]["total"] += 1
-                    if is_ext:
-                        stats["missing"]["ext"] += 1
-                        stats["confirmed"]["ext"] += 1
-                    else:
-                        stats["missing"]["int"] += 1
-                        stats["confirmed"]["int"] += 1
-
-                elif st == "extra":
-                    stats["check"]["total"] += 1
-                    if is_ext:
-                        stats["check"]["ext"] += 1
-                    else:
-                        stats["check"]["int"] += 1
-        return stats
+GROUP_CARD_HEAD_HTML = """
+          <div id="group-%(slug)s" data-group="%(slug)s" data-has-issues="%(has_issues)s" class="card bg-base-100 shadow group-card group-%(slug)s reveal" style="animation-delay: %(delay)dms;">
+            <div class="card-body p-0">
+              <details class="group-details collapse" open>
+                <summary class="collapse-title px-6 py-5 cursor-pointer">
+                  <div class="flex flex-wrap items-center justify-between gap-y-3 gap-x-4 w-full pr-8 relative">
+                    
+                    <!-- Left: Title & Link -->
+                    <div class="flex flex-wrap items-center gap-3">
+                        <h2 class="card-title m-0 text-lg sm:text-xl">%(name)s</h2>
+                        <a class="btn btn-xs btn-outline shrink-0" href="%(url)s" target="_blank" rel="noopener">Open events page</a>
+                    </div>
+                    
+                    <!-- Right: Badges -->
+                    <div class="flex flex-wrap items-center gap-2 justify-end">
+                         <!-- Group 1: Good stuff -->
+                         <div class="flex items-center gap-2">
+                            <div class="tooltip tooltip-bottom" data-tip="%(confirmed_tip)s">
+                                <span class="badge badge-neutral shrink-0">%(confirmed)d confirmed</span>
+                            </div>
+                            <div class="tooltip tooltip-bottom" data-tip="%(ok_tip)s">
+                                <span class="badge badge-success shrink-0">%(ok)d OK</span>
+                            </div>
+                         </div>
+                         <!-- Group 2: Bad stuff -->
+                         <div class="flex items-center gap-2">
+                            <div class="tooltip tooltip-bottom" data-tip="%(missing_tip)s">
+                                <span class="badge badge-error shrink-0">%(missing)d missing</span>
+                            </div>
+                            <div class="tooltip tooltip-bottom" data-tip="%(check_tip)s">
+                                <span class="badge badge-warning shrink-0">%(check)d check</span>
+                            </div>
+                         </div>
+                    </div>
 
-    def make_tooltip(counts: Dict[str, int]) -> str:
-        return f"Int: {counts['int']} | Ext: {counts['ext']}"
+                    <!-- Chevron (Absolute right) -->
+                    <div class="absolute right-0 top-1/2 -translate-y-1/2">
+                        <svg class="w-5 h-5 transition-transform duration-300 transform chevron" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor">
+                           <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7" />
+                        </svg>
+                    </div>
 
-    all_sections = []
-    for g in groups:
-        all_sections.extend(g.get("sections", []))
-    
-    # Overall summary counts (we use the same logic just for totals)
-    global_stats = get_badge_counts_by_category(all_sections)
+                  </div>
+                </summary>
 
-    total_confirmed = global_stats["confirmed"]["total"]
-    total_ok = global_stats["ok"]["total"]
-    total_missing = global_stats["missing"]["total"]
-    total_check = global_stats["check"]["total"]
+                <div class="collapse-content px-6 pb-6">
+                  <div class="mt-2 space-y-4">
+        """
 
-    summary_line = (
-        f"{total_confirmed} confirmed, "
-        f"{total_ok} OK, "
-        f"{total_missing} missing on listings, "
-        f"{total_check} check."
-    )
+# Date mismatch direction -> (summary key holding the other date, list item template)
+DATE_MISMATCH_LINES = {
+    # Speaker appears on CrickNet for this date, but spreadsheet says different date
+    "cricknet_to_spreadsheet": (
+        "expected_date",
+        "<li>%s is scheduled for <strong>%s</strong> on spreadsheet, but appears here on %s</li>",
+    ),
+}
+# Speaker on spreadsheet for this date, but CrickNet shows different date
+DATE_MISMATCH_LINE_DEFAULT = (
+    "actual_date",
+    "<li>%s is on the spreadsheet for this date, but scheduled for <strong>%s</strong> on %s</li>",
+)
 
-    def badge(status: str) -> str:
-        if status == "ok":
-            return "badge badge-success"
-        if status == "warn":
-            return "badge badge-warning"
-        if status == "bad":
-            return "badge badge-error"
-        if status == "date_mismatch":
-            return "badge badge-warning"  # Amber/orange for date mismatch
-        return "badge"
-
-    def status_label(status: str) -> str:
-        return {"ok": "OK", "warn": "Check", "bad": "Missing", "extra": "Extra", "date_mismatch": "Check"}.get(status, status)
-
-    group_palette = {
-        "cancer": "var(--col-blue)",
-        "development-and-stem-cells": "var(--col-taupe)",
-        "genes-to-cells": "var(--col-clay)",
-        "immunology": "var(--col-bronze)",
-        "host-and-pathogen": "var(--col-sand)",
-        "neuroscience": "var(--col-blue)",
-        "structural-chemical-biology": "var(--col-taupe)",
-    }
-    group_color_css = []
-    for slug, color in group_palette.items():
-        group_color_css.append(f".group-{slug} {{ --group-color: {color}; }}")
-    group_color_css_text = "\n".join(group_color_css)
-
-    def ticket_date_parts(iso: str, uk: str) -> Tuple[str, str]:
-        if iso:
-            try:
-                dt = datetime.strptime(iso, "%Y-%m-%d")
-                return dt.strftime("%-d"), dt.strftime("%b")
-            except Exception:
-                pass
-        if uk:
-            try:
-                dt = datetime.strptime(uk, "%d/%m/%Y")
-                return dt.strftime("%-d"), dt.strftime("%b")
-            except Exception:
-                pass
-        return "", ""
-        
-    def date_cell_parts(iso: str, uk: str) -> str:
-        d_str, w_str = "", ""
-        if iso:
-            try:
-                dt = datetime.strptime(iso, "%Y-%m-%d")
-                d_str = dt.strftime("%-d %b")
-                w_str = dt.strftime("%a")
-                return f'<div class="font-bold text-base leading-tight">{d_str}</div><div class="text-xs opacity-70 uppercase tracking-wide">{w_str}</div>'
-            except: pass
-        return f'<div class="font-bold text-base">{uk}</div>'
-
-    def short_group_label(name: str) -> str:
-        parts = (name or "").strip().split()
-        if not parts:
-            return "Group"
-        return parts[0][:4]
-
-    calendar_events: List[Dict[str, str]] = []
-    for g in groups:
-        g_name = str(g.get("display", "")).strip()
-        if not g_name:
-            continue
-        slug = group_slug(g_name)
-        short_label = short_group_label(g_name)
-        for s in g.get("sections", []):
-            date_iso = str(s.get("date_iso", "")).strip()
-            if not date_iso:
-                continue
-            category_raw = str(s.get("category", "")).strip()
-            anchor = section_anchor(g_name, date_iso, category_raw)
-            calendar_events.append({
-                "date_iso": date_iso,
-                "group_slug": slug,
-                "group_label": g_name,
-                "category": category_raw,
-                "anchor": anchor,
-                "short_label": short_label,
-            })
-
-    calendar_events_json = json.dumps(calendar_events).replace("</", "<\\/")
-    calendar_pills_parts = []
-    for ev in calendar_events:
-        cat = str(ev.get("category", "")).lower()
-        border_class = "border-dashed" if "external" in cat else "border-solid"
-        calendar_pills_parts.append(f"""
-        <a href="#{html_escape(ev.get("anchor", ""))}" class="cal-pill group-{html_escape(ev.get("group_slug", ""))} {border_class} is-hidden" data-cal-date="{html_escape(ev.get("date_iso", ""))}" title="{html_escape(ev.get("group_label", ""))}">
-            <span class="cal-dot group-{html_escape(ev.get("group_slug", ""))}"></span>
-            <span class="cal-text">{html_escape(ev.get("short_label", ""))}</span>
-        </a>
-        """)
-    calendar_pills_html = "\n".join(calendar_pills_parts)
-
-    # Priority cards
-    priority_cards = ""
-    if priority:
-        cards = []
-        for idx, p in enumerate(priority):
-            p_slug = group_slug(p.get("group", ""))
-            anchor = section_anchor(p.get("group", ""), p.get("date_iso", ""), p.get("category", ""))
-            day, month = ticket_date_parts(p.get("date_iso"), p.get("date_uk"))
-            missing_list = [str(x) for x in p.get("missing", []) if str(x).strip()]
-            missing_text = ", ".join(missing_list) if missing_list else "Unknown"
-            
-            mailto_link = generate_mailto(p.get("group", ""), missing_list, p.get("date_uk", ""))
-            
-            cards.append(f"""
-              <div class="priority-ticket reveal group-{p_slug}" style="animation-delay: {idx * 60}ms;">
-                <div class="ticket-sidebar" style="background-color: var(--group-color, var(--col-blue));">
-                  <div class="ticket-date">
-                    <span class="day">{html_escape(day)}</span>
-                    <span class="month">{html_escape(month)}</span>
-                  </div>
-                </div>
-                <div class="ticket-content flex flex-col justify-between">
-                  <div>
-                    <div class="ticket-header">
-                      <span class="badge badge-outline">{html_escape(p["group"])}</span>
-                      <span class="ticket-type">{html_escape(p["category"])}</span>
-                    </div>
-                    <div class="ticket-title"><a href="#{html_escape(anchor)}" class="hover:underline">{html_escape(p["title"])}</a></div>
-                    <div class="ticket-missing">
-                      <strong>Missing:</strong> {html_escape(missing_text)}
-                    </div>
-                  </div>
-                  <div class="mt-3 flex gap-2">
-                    <a href="{html_escape(p["url"])}" target="_blank" class="btn btn-xs btn-outline">View Page</a>
-                    <a href="{html_escape(mailto_link)}" class="btn btn-xs btn-outline">Draft Email</a>
-                  </div>
-                </div>
-              </div>
-            """)
-        priority_cards = "\n".join(cards)
-    else:
-        priority_cards = """
-          <div class="alert alert-success">
-            <span>Nothing urgent: no missing Internal/External seminars in the next 14 days.</span>
-          </div>
-        """
-
-    # Group sections
-    group_html_parts = []
-    group_nav_items = []
-    for idx, g in enumerate(groups):
-        g_name_raw = str(g.get("display", ""))
-        g_name = html_escape(g_name_raw)
-        g_url = html_escape(g.get("url", ""))
-        slug = group_slug(g_name_raw)
-        sections = g.get("sections", [])
-
-        # Detailed Counts with Tooltips
-        stats = get_badge_counts_by_category(sections)
-        
-        confirmed_count = stats["confirmed"]["total"]
-        ok_count = stats["ok"]["total"]
-        missing_count = stats["missing"]["total"]
-        check_count = stats["check"]["total"]
-        
-        has_issues = missing_count > 0 or check_count > 0
-
-        group_nav_items.append(f"""
-          <li class="group-{slug}" data-has-issues="{str(has_issues).lower()}">
-            <a class="group-link group-{slug}" href="#group-{slug}" data-group-link="{slug}">
-              <span class="name">{g_name}</span>
-              <span class="group-badges text-xs">
-                <span class="badge badge-ghost">{confirmed_count}</span>
-                <span class="badge badge-success">{ok_count}</span>
-                <span class="badge badge-error">{missing_count}</span>
-                <span class="badge badge-warning">{check_count}</span>
-              </span>
-            </a>
-          </li>
-        """)
-
-        group_html_parts.append(f"""
-          <div id="group-{slug}" data-group="{slug}" data-has-issues="{str(has_issues).lower()}" class="card bg-base-100 shadow group-card group-{slug} reveal" style="animation-delay: {idx * 70}ms;">
-            <div class="card-body p-0">
-              <details class="group-details collapse" open>
-                <summary class="collapse-title px-6 py-5 cursor-pointer">
-                  <div class="flex flex-wrap items-center justify-between gap-y-3 gap-x-4 w-full pr-8 relative">
-                    
-                    <!-- Left: Title & Link -->
-                    <div class="flex flex-wrap items-center gap-3">
-                        <h2 class="card-title m-0 text-lg sm:text-xl">{g_name}</h2>
-                        <a class="btn btn-xs btn-outline shrink-0" href="{g_url}" target="_blank" rel="noopener">Open events page</a>
-                    </div>
-                    
-                    <!-- Right: Badges -->
-                    <div class="flex flex-wrap items-center gap-2 justify-end">
-                         <!-- Group 1: Good stuff -->
-                         <div class="flex items-center gap-2">
-                            <div class="tooltip tooltip-bottom" data-tip="{make_tooltip(stats['confirmed'])}">
-                                <span class="badge badge-neutral shrink-0">{confirmed_count} confirmed</span>
-                            </div>
-                            <div class="tooltip tooltip-bottom" data-tip="{make_tooltip(stats['ok'])}">
-                                <span class="badge badge-success shrink-0">{ok_count} OK</span>
-                            </div>
-                         </div>
-                         <!-- Group 2: Bad stuff -->
-                         <div class="flex items-center gap-2">
-                            <div class="tooltip tooltip-bottom" data-tip="{make_tooltip(stats['missing'])}">
-                                <span class="badge badge-error shrink-0">{missing_count} missing</span>
-                            </div>
-                            <div class="tooltip tooltip-bottom" data-tip="{make_tooltip(stats['check'])}">
-                                <span class="badge badge-warning shrink-0">{check_count} check</span>
-                            </div>
+SECTION_CARD_HEAD_HTML = """
+                  <div id="%(anchor)s" class="%(box_class)s date-card" data-group="%(slug)s" data-group-slug="%(slug)s" data-category="%(category_attr)s" data-date="%(date)s" data-group-label="%(group_label)s" data-group-url="%(group_url)s">
+                    <div class="flex flex-row items-start gap-4 mb-3">
+                      <div class="flex-none w-16 text-center pt-1">
+                         %(date_cell)s
+                      </div>
+                      <div class="flex-1 min-w-0">
+                         <div class="flex items-center gap-2 mb-1">
+                            <span class="badge %(header_badge)s">%(header_text)s</span>
+                            <span class="text-xs uppercase tracking-wide text-gray-500 font-bold">%(category)s</span>
                          </div>
+                         <div class="text-sm font-medium">%(title)s</div>
+                      </div>
                     </div>
 
-                    <!-- Chevron (Absolute right) -->
-                    <div class="absolute right-0 top-1/2 -translate-y-1/2">
-                        <svg class="w-5 h-5 transition-transform duration-300 transform chevron" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                           <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7" />
-                        </svg>
-                    </div>
-
-                  </div>
-                </summary>
-
-                <div class="collapse-content px-6 pb-6">
-                  <div class="mt-2 space-y-4">
-        """)
-
-        if not sections:
-            group_html_parts.append("""
-                <div class="alert">
-                  <span>No upcoming Internal/External seminars found (or no data available).</span>
-                </div>
-            """)
-        elif missing_count == 0 and check_count == 0:
-             group_html_parts.append("""
-                <div class="flex flex-col items-center justify-center p-8 text-center opacity-60">
-                   <div class="text-4xl mb-2">✅</div>
-                   <div class="text-lg font-medium">All Good</div>
-                   <div class="text-sm">Everything scheduled matches the spreadsheet.</div>
-                </div>
-            """)
-        else:
-            for s in sections:
-                date_uk = html_escape(s.get("date_uk", ""))
-                date_iso = s.get("date_iso", "")
-                category_raw = s.get("category", "")
-                category = html_escape(category_raw)
-                title = html_escape(s.get("title", "Interest group seminar"))
-                source_label = html_escape(str(s.get("source_label", "CrickNet")))
-                found_label = "Found"
-                any_mismatch = bool(s.get("any_mismatch"))
-                rows_list = s.get("rows", [])
-                has_missing = any(r.get("status") == "bad" for r in rows_list)
-                has_check = any(r.get("status") in {"warn", "extra", "date_mismatch"} for r in rows_list)
-                box_class = "border border-base-200 rounded-xl p-4 bg-base-100 shadow-sm"
-                
-                # Header Badge Logic
-                if has_missing:
-                    header_badge = "badge-error"
-                    header_text = "Missing"
-                elif has_check:
-                    header_badge = "badge-warning"
-                    header_text = "Check"
-                else:
-                    header_badge = "badge-success"
-                    header_text = "All good"
-
-                # Table rows
-                tr_parts = []
-                for r in rows_list:
-                    st = r.get("status", "")
-                    tr_parts.append(f"""
-                      <tr data-status="{html_escape(st)}">
-                        <td class="w-28">
-                          <span class="{badge(st)}">{html_escape(status_label(st))}</span>
-                        </td>
-                        <td class="align-top break-words">{html_escape(r.get("expected",""))}</td>
-                        <td class="align-top break-words">{html_escape(r.get("found",""))}</td>
-                        <td class="align-top break-words">
-                          {html_escape(r.get("note",""))}
-                          {f' ({int(r["score"])}% similar)' if r.get("score") is not None else ''}
-                        </td>
-                      </tr>
-                    """)
-
-                missing_list = s.get("missing", [])
-                date_mismatches_list = s.get("date_mismatches", [])
-                extra_list = s.get("extras", [])
-                likely = s.get("likely_pairs", [])
+                    <div class="overflow-x-auto">
+                      <table class="table table-sm">
+                        <thead>
+                          <tr>
+                            <th>Status</th>
+                            <th>Expected</th>
+                            <th>%(found_label)s</th>
+                            <th>Note</th>
+                          </tr>
+                        </thead>
+                        <tbody>
+                          """
 
-                detail_parts = []
-                if any_mismatch:
-                    if missing_list:
-                        mailto_missing = generate_mailto(g_name_raw, missing_list, date_uk)
-                        detail_parts.append(f"""
-                          <div class="mt-3 detail-block p-3 bg-red-50 rounded-lg border border-red-100" data-detail="missing">
+# Section detail blocks shown under the table when a section has mismatches
+DETAIL_MISSING_HTML = """                          <div class="mt-3 detail-block p-3 bg-red-50 rounded-lg border border-red-100" data-detail="missing">
                             <div class="flex justify-between items-start">
                                 <div>
-                                    <div class="font-semibold text-red-800 text-sm">Found on spreadsheet, missing on {source_label}:</div>
+                                    <div class="font-semibold text-red-800 text-sm">Found on spreadsheet, missing on %(source)s:</div>
                                     <ul class="list-disc ml-6 text-sm text-red-900 mt-1">
-                                    {''.join(f"<li>{html_escape(x)}</li>" for x in missing_list)}
+                                    %(items)s
                                     </ul>
                                 </div>
-                                <a href="{html_escape(mailto_missing)}" class="btn btn-xs btn-outline btn-error bg-white">Draft Email</a>
+                                <a href="%(mailto)s" class="btn btn-xs btn-outline btn-error bg-white">Draft Email</a>
                             </div>
                           </div>
-                        """)
-                    if date_mismatches_list:
-                        # Build different messages based on mismatch direction
-                        dm_lines = []
-                        for dm in date_mismatches_list:
-                            speaker = html_escape(dm.get('speaker', ''))
-                            direction = dm.get('direction', '')
-                            if direction == 'cricknet_to_spreadsheet':
-                                # Speaker appears on CrickNet for this date, but spreadsheet says different date
-                                spreadsheet_date = dm.get('expected_date', '')
-                                dm_lines.append(f"<li>{speaker} is scheduled for <strong>{html_escape(spreadsheet_date)}</strong> on spreadsheet, but appears here on {source_label}</li>")
-                            else:
-                                # Speaker on spreadsheet for this date, but CrickNet shows different date  
-                                cricknet_date = dm.get('actual_date', '')
-                                dm_lines.append(f"<li>{speaker} is on the spreadsheet for this date, but scheduled for <strong>{html_escape(cricknet_date)}</strong> on {source_label}</li>")
-                        
-                        detail_parts.append(f"""
-                          <div class="mt-3 detail-block p-3 bg-amber-50 rounded-lg border border-amber-200" data-detail="date-mismatch">
+                        """
+
+DETAIL_DATE_MISMATCH_HTML = """                          <div class="mt-3 detail-block p-3 bg-amber-50 rounded-lg border border-amber-200" data-detail="date-mismatch">
                             <div class="font-semibold text-amber-800 text-sm">📅 Date mismatch:</div>
                             <ul class="list-disc ml-6 text-sm text-amber-900 mt-1">
-                              {''.join(dm_lines)}
+                              %s
                             </ul>
                           </div>
-                        """)
-                    if extra_list:
-                        detail_parts.append(f"""
-                          <div class="mt-3 detail-block p-3 bg-gray-50 rounded-lg border border-gray-100" data-detail="extra">
-                            <div class="font-semibold text-gray-700 text-sm">Found on {source_label}, not on spreadsheet:</div>
+                        """
+
+DETAIL_EXTRA_HTML = """                          <div class="mt-3 detail-block p-3 bg-gray-50 rounded-lg border border-gray-100" data-detail="extra">
+                            <div class="font-semibold text-gray-700 text-sm">Found on %(source)s, not on spreadsheet:</div>
                             <ul class="list-disc ml-6 text-sm text-gray-800 mt-1">
-                              {''.join(f"<li>{html_escape(x)}</li>" for x in extra_list)}
+                              %(items)s
                             </ul>
                           </div>
-                        """)
-                    if likely:
-                        detail_parts.append(f"""
-                          <div class="mt-3 detail-block p-3 bg-orange-50 rounded-lg border border-orange-100" data-detail="likely">
+                        """
+
+DETAIL_LIKELY_HTML = """                          <div class="mt-3 detail-block p-3 bg-orange-50 rounded-lg border border-orange-100" data-detail="likely">
                             <div class="font-semibold text-orange-800 text-sm">Likely match:</div>
                             <ul class="list-disc ml-6 text-sm text-orange-900 mt-1">
-                              {''.join(f"<li>{html_escape(x['a'])} &nbsp;↔&nbsp; {html_escape(x['b'])} ({int(x['score'])}% similar)</li>" for x in likely)}
+                              %s
                             </ul>
                           </div>
-                        """)
+                        """
 
-                group_html_parts.append(f"""
-                  <div id="{html_escape(section_anchor(g.get("display", ""), s.get("date_iso", ""), s.get("category", "")))}" class="{box_class} date-card" data-group="{slug}" data-group-slug="{slug}" data-category="{html_escape(category_raw).lower()}" data-date="{html_escape(date_iso)}" data-group-label="{html_escape(g_name_raw)}" data-group-url="{html_escape(g_url)}">
-                    <div class="flex flex-row items-start gap-4 mb-3">
-                      <div class="flex-none w-16 text-center pt-1">
-                         {date_cell_parts(date_iso, date_uk)}
-                      </div>
-                      <div class="flex-1 min-w-0">
-                         <div class="flex items-center gap-2 mb-1">
-                            <span class="badge {header_badge}">{header_text}</span>
-                            <span class="text-xs uppercase tracking-wide text-gray-500 font-bold">{category}</span>
-                         </div>
-                         <div class="text-sm font-medium">{title}</div>
-                      </div>
-                    </div>
+TABLE_ROW_HTML = """                      <tr data-status="%s">
+                        <td class="w-28">
+                          %s
+                        </td>
+                        <td class="align-top break-words">%s</td>
+                        <td class="align-top break-words">%s</td>
+                        <td class="align-top break-words">
+                          %s
+                          %s
+                        </td>
+                      </tr>
+                    """
 
-                    <div class="overflow-x-auto">
-                      <table class="table table-sm">
-                        <thead>
-                          <tr>
-                            <th>Status</th>
-                            <th>Expected</th>
-                            <th>{found_label}</th>
-                            <th>Note</th>
-                          </tr>
-                        </thead>
-                        <tbody>
-                          {''.join(tr_parts)}
-                        </tbody>
-                      </table>
+PRIORITY_TICKET_HTML = """
+              <div class="priority-ticket reveal group-%(slug)s" style="animation-delay: %(delay)dms;">
+                <div class="ticket-sidebar" style="background-color: var(--group-color, var(--col-blue));">
+                  <div class="ticket-date">
+                    <span class="day">%(day)s</span>
+                    <span class="month">%(month)s</span>
+                  </div>
+                </div>
+                <div class="ticket-content flex flex-col justify-between">
+                  <div>
+                    <div class="ticket-header">
+                      <span class="badge badge-outline">%(group)s</span>
+                      <span class="ticket-type">%(category)s</span>
+                    </div>
+                    <div class="ticket-title"><a href="#%(anchor)s" class="hover:underline">%(title)s</a></div>
+                    <div class="ticket-missing">
+                      <strong>Missing:</strong> %(missing)s
                     </div>
-
-                    {''.join(detail_parts)}
                   </div>
-                """)
-
-        group_html_parts.append("""
+                  <div class="mt-3 flex gap-2">
+                    <a href="%(url)s" target="_blank" class="btn btn-xs btn-outline">View Page</a>
+                    <a href="%(mailto)s" class="btn btn-xs btn-outline">Draft Email</a>
                   </div>
                 </div>
-              </details>
-            </div>
-          </div>
-        """)
+              </div>
+            """
 
-    group_html = "\n".join(group_html_parts)
-    group_nav_html = "\n".join(group_nav_items)
 
-    html = f"""<!doctype html>
+# Static page head: CDN assets and the report stylesheet (plain string, so CSS braces are not doubled)
+REPORT_HEAD_HTML = """<!doctype html>
 <html lang="en" data-theme="light">
 <head>
   <meta charset="utf-8" />
@@ -1796,7 +1713,7 @@ def render_report_html(report: Dict[str, Any]) -> str:
   <script defer src="https://cdn.jsdelivr.net/npm/alpinejs@3.x.x/dist/cdn.min.js"></script>
 
   <style>
-    :root {{
+    :root {
       /* Requested Palette */
       --col-blue: #628395;
       --col-taupe: #96897b;
@@ -1809,39 +1726,45 @@ def render_report_html(report: Dict[str, Any]) -> str:
       --text-main: #2d3748;
       --text-muted: #718096;
       --group-color: var(--col-blue);
-    }}
+    }
 
-    html {{
+    html {
       scroll-behavior: smooth;
-    }}
+    }
 
-    body {{
+    body {
       font-family: "Spectral", serif;
       background: radial-gradient(circle at top left, #f2efe6 0%, #f7f4ec 45%, #eef4f7 100%);
       color: var(--text-main);
-    }}
+    }
 
-    h1, h2, h3, .stat-value {{
+    h1, h2, h3, .stat-value {
       font-family: "Space Grotesk", sans-serif;
       color: var(--text-main);
       letter-spacing: -0.01em;
-    }}
+    }
 
-    aside, .btn, .badge, .stat-value, table, .input, .select, .tooltip {{
+    aside, .btn, .badge, .stat-value, table, .input, .select, .tooltip {
       font-family: system-ui, -apple-system, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-    }}
+    }
 
-    .group-card {{
+    .group-card {
       border-left: 6px solid var(--group-color);
       background: linear-gradient(90deg, color-mix(in srgb, var(--group-color) 12%, #ffffff) 0%, #ffffff 55%);
       scroll-margin-top: 5.5rem;
-    }}
+    }
 
-    .group-card:target {{
+    .group-card:target {
       box-shadow: 0 0 0 2px color-mix(in srgb, var(--group-color) 25%, transparent);
-    }}
+    }
+
+    /* Off-screen date cards skip layout and paint until scrolled near; rows stay in the DOM for filtering */
+    .date-card {
+      content-visibility: auto;
+      contain-intrinsic-size: auto 220px;
+    }
 
-    .group-link {{
+    .group-link {
       display: grid;
       grid-template-columns: minmax(0, 1fr) 240px;
       align-items: center;
@@ -1852,9 +1775,9 @@ def render_report_html(report: Dict[str, Any]) -> str:
       color: var(--text-main);
       border-radius: 0.75rem;
       transition: background 200ms ease, transform 200ms ease, box-shadow 200ms ease;
-    }}
+    }
 
-    .group-link::before {{
+    .group-link::before {
       content: "";
       position: absolute;
       width: 0.55rem;
@@ -1864,113 +1787,113 @@ def render_report_html(report: Dict[str, Any]) -> str:
       left: 0.65rem;
       top: 50%;
       transform: translateY(-50%);
-    }}
+    }
 
-    .group-link {{
+    .group-link {
       position: relative;
-    }}
+    }
 
-    .group-link .name {{
+    .group-link .name {
       font-weight: 600;
       line-height: 1.2;
       white-space: normal;
-    }}
+    }
 
-    .group-link.is-active {{
+    .group-link.is-active {
       background: color-mix(in srgb, var(--group-color) 15%, white);
       font-weight: 600;
       border-left-width: 6px;
-    }}
+    }
 
-    .group-link.is-active::before {{
+    .group-link.is-active::before {
       transform: translateY(-50%) scale(1.2);
-    }}
+    }
 
-    .group-badges {{
+    .group-badges {
       display: grid;
       grid-template-columns: repeat(2, minmax(0, 1fr));
       gap: 0.35rem 0.4rem;
       justify-items: stretch;
-    }}
+    }
 
-      .group-badges .badge {{
+      .group-badges .badge {
         width: 100%;
         justify-content: center;
         white-space: nowrap;
-      }}
+      }
 
       /* (dropdown wrappers in group badges styles removed) */
 
-    .quick-summary {{
+    .quick-summary {
       display: none;
       opacity: 0;
       transform: translateY(-6px);
       pointer-events: none;
-    }}
+    }
 
-    .quick-summary.is-visible {{
+    .quick-summary.is-visible {
       display: block;
       opacity: 1;
       transform: translateY(0);
       pointer-events: auto;
       animation: quickFade 220ms ease;
-    }}
+    }
 
-    .interest-groups-card {{
+    .interest-groups-card {
       position: sticky;
       top: 4.5rem;
       max-height: calc(100vh - 5rem);
       overflow: auto;
-    }}
+    }
 
-    .summary-stats {{
+    .summary-stats {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
       gap: 0.75rem;
       width: 100%;
-    }}
+    }
 
-    .summary-stat {{
+    .summary-stat {
       background: var(--card-bg);
       border: 1px solid #e2e8f0;
       border-radius: 0.9rem;
       padding: 0.75rem 1rem;
-    }}
+    }
 
-    .summary-stat .label {{
+    .summary-stat .label {
       font-size: 0.75rem;
       text-transform: uppercase;
       letter-spacing: 0.08em;
       color: var(--text-muted);
-    }}
+    }
 
-    .summary-stat .value {{
+    .summary-stat .value {
       font-family: "Space Grotesk", sans-serif;
       font-size: 1.6rem;
       font-weight: 600;
       margin-top: 0.2rem;
-    }}
+    }
 
-    .summary-stat.value-ok .value {{
+    .summary-stat.value-ok .value {
       color: #16a34a;
-    }}
+    }
 
-    .summary-stat.value-missing .value {{
+    .summary-stat.value-missing .value {
       color: #dc2626;
-    }}
+    }
 
-    .summary-stat.value-check .value {{
+    .summary-stat.value-check .value {
       color: #d97706;
-    }}
+    }
 
-    .priority-counts {{
+    .priority-counts {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
       gap: 0.5rem;
       margin-top: 0.75rem;
-    }}
+    }
 
-    .priority-count {{
+    .priority-count {
       display: flex;
       align-items: center;
       justify-content: space-between;
@@ -1979,18 +1902,18 @@ def render_report_html(report: Dict[str, Any]) -> str:
       border-left: 4px solid var(--group-color);
       background: color-mix(in srgb, var(--group-color) 12%, #ffffff);
       font-size: 0.85rem;
-    }}
+    }
 
-    .priority-count .label {{
+    .priority-count .label {
       font-weight: 600;
-    }}
+    }
 
-    .priority-count .value {{
+    .priority-count .value {
       font-family: "Space Grotesk", sans-serif;
       font-weight: 600;
-    }}
+    }
 
-    .priority-ticket {{
+    .priority-ticket {
       display: flex;
       background: var(--card-bg);
       border: 1px solid #e2e8f0;
@@ -1999,14 +1922,14 @@ def render_report_html(report: Dict[str, Any]) -> str:
       margin-bottom: 0.75rem;
       box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
       transition: transform 150ms ease, box-shadow 150ms ease;
-    }}
+    }
 
-    .priority-ticket:hover {{
+    .priority-ticket:hover {
       transform: translateY(-1px);
       box-shadow: 0 2px 6px rgba(0, 0, 0, 0.08);
-    }}
+    }
 
-    .ticket-sidebar {{
+    .ticket-sidebar {
       width: 60px;
       display: flex;
       align-items: center;
@@ -2016,74 +1939,74 @@ def render_report_html(report: Dict[str, Any]) -> str:
       text-align: center;
       line-height: 1.1;
       order: 0;
-    }}
+    }
 
-    .ticket-date {{
+    .ticket-date {
       display: flex;
       flex-direction: column;
       align-items: center;
       text-transform: uppercase;
       letter-spacing: 0.04em;
-    }}
+    }
 
-    .ticket-date .day {{
+    .ticket-date .day {
       font-size: 1.05rem;
-    }}
+    }
 
-    .ticket-date .month {{
+    .ticket-date .month {
       font-size: 0.7rem;
-    }}
+    }
 
-    .ticket-content {{
+    .ticket-content {
       flex: 1;
       padding: 1rem;
       order: 1;
-    }}
+    }
 
-    .ticket-header {{
+    .ticket-header {
       display: flex;
       align-items: center;
       flex-wrap: wrap;
       gap: 0.5rem;
-    }}
+    }
 
-    .ticket-type {{
+    .ticket-type {
       font-size: 0.75rem;
       letter-spacing: 0.08em;
       text-transform: uppercase;
       color: var(--text-muted);
-    }}
+    }
 
-    .ticket-title {{
+    .ticket-title {
       font-weight: 600;
       font-size: 1.05rem;
       margin: 0.25rem 0;
-    }}
+    }
 
-    .ticket-missing {{
+    .ticket-missing {
       color: #e53e3e;
       font-size: 0.9rem;
-    }}
+    }
 
-    .filter-row {{
+    .filter-row {
       display: grid;
       gap: 1rem;
       grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-    }}
+    }
 
-    .filter-status {{
+    .filter-status {
       display: flex;
       flex-wrap: wrap;
       gap: 0.75rem 1.5rem;
-    }}
+    }
 
-    .filter-status label {{
+    .filter-status label {
       display: inline-flex;
       align-items: center;
       gap: 0.5rem;
-    }}
+    }
 
-    .to-top {{
+    .to-top {
       position: fixed;
       right: 1.5rem;
       bottom: 1.5rem;
@@ -2092,128 +2015,128 @@ def render_report_html(report: Dict[str, Any]) -> str:
       transform: translateY(8px);
       pointer-events: none;
       transition: opacity 200ms ease, transform 200ms ease;
-    }}
+    }
 
-    .to-top.is-visible {{
+    .to-top.is-visible {
       opacity: 1;
       transform: translateY(0);
       pointer-events: auto;
-    }}
+    }
 
-    .is-hidden {{
+    .is-hidden {
       display: none !important;
-    }}
+    }
 
-    .group-details {{
+    .group-details {
       width: 100%;
-    }}
+    }
     
-    .collapse > summary {{
+    .collapse > summary {
        list-style: none;
-    }}
-    .collapse > summary::-webkit-details-marker {{
+    }
+    .collapse > summary::-webkit-details-marker {
        display: none;
-    }}
+    }
 
     /* Split layout means we don't need padding-right hack for absolute arrow */
-    .collapse-title {{
+    .collapse-title {
       position: relative;
       max-width: 100%;
       padding-right: 1.5rem;
-    }}
+    }
     
     /* Rotate the SVG chevron when open */
-    .collapse[open] .chevron {{
+    .collapse[open] .chevron {
       transform: rotate(180deg);
-    }}
+    }
 
-    .card, .group-card, .collapse-title, .collapse-content {{
+    .card, .group-card, .collapse-title, .collapse-content {
       max-width: 100%;
-    }}
+    }
 
-    .table {{
+    .table {
       width: 100%;
       table-layout: fixed;
-    }}
+    }
 
-    .table th, .table td {{
+    .table th, .table td {
       word-break: break-word;
-    }}
+    }
 
-    @media (max-width: 640px) {{
-      .group-link {{
+    @media (max-width: 640px) {
+      .group-link {
         grid-template-columns: 1fr;
-      }}
-      .group-badges {{
+      }
+      .group-badges {
         justify-items: start;
-      }}
-      .interest-groups-card {{
+      }
+      .interest-groups-card {
         max-height: none;
         overflow: visible;
         position: static;
-      }}
-      .priority-ticket {{
+      }
+      .priority-ticket {
         flex-direction: column;
-      }}
-      .ticket-sidebar {{
+      }
+      .ticket-sidebar {
         width: 100%;
         padding: 0.5rem 0;
-      }}
-    }}
+      }
+    }
 
-    .reveal {{
+    .reveal {
       animation: rise 480ms ease both;
-    }}
+    }
 
-    @keyframes rise {{
-      from {{
+    @keyframes rise {
+      from {
         opacity: 0;
         transform: translateY(8px);
-      }}
-      to {{
+      }
+      to {
         opacity: 1;
         transform: translateY(0);
-      }}
-    }}
+      }
+    }
 
-    @keyframes quickFade {{
-      from {{
+    @keyframes quickFade {
+      from {
         opacity: 0;
         transform: translateY(-6px);
-      }}
-      to {{
+      }
+      to {
         opacity: 1;
         transform: translateY(0);
-      }}
-    }}
+      }
+    }
 
-    @media (prefers-reduced-motion: reduce) {{
-      .reveal {{
+    @media (prefers-reduced-motion: reduce) {
+      .reveal {
         animation: none;
-      }}
-    }}
+      }
+    }
 
     /* Custom Calendar Grid Styles */
-    .custom-calendar-card {{
+    .custom-calendar-card {
       background: #fff;
       max-width: 100%;
-    }}
+    }
 
-    .cal-grid {{
+    .cal-grid {
       display: grid;
       grid-template-columns: repeat(5, minmax(0, 1fr));
       gap: 4px;
       text-align: center;
-    }}
+    }
 
-    .cal-header {{
+    .cal-header {
       font-size: 0.75rem;
       font-weight: 700;
       color: var(--text-muted);
       padding-bottom: 8px;
-    }}
+    }
 
-    .cal-cell {{
+    .cal-cell {
       aspect-ratio: 1 / 1;
       display: flex;
       flex-direction: column;
@@ -2227,28 +2150,28 @@ def render_report_html(report: Dict[str, Any]) -> str:
       cursor: pointer;
       position: relative;
       transition: background 0.15s;
-    }}
+    }
 
-    .cal-cell.empty {{
+    .cal-cell.empty {
       cursor: default;
-    }}
+    }
 
-    .cal-cell:hover:not(.empty) {{
+    .cal-cell:hover:not(.empty) {
       background-color: #f3f4f6;
-    }}
+    }
 
-    .cal-cell.is-selected {{
+    .cal-cell.is-selected {
       background-color: #ebf8ff;
       border-color: #4299e1;
       color: #2b6cb0;
-    }}
+    }
 
-    .cal-cell.is-focused {{
+    .cal-cell.is-focused {
       outline: 2px solid #1d4ed8;
       outline-offset: 1px;
-    }}
+    }
 
-    .cal-cell.is-today .day-num {{
+    .cal-cell.is-today .day-num {
       background-color: var(--text-main);
       color: #fff;
       border-radius: 50%;
@@ -2256,48 +2179,48 @@ def render_report_html(report: Dict[str, Any]) -> str:
       height: 24px;
       line-height: 24px;
       display: block;
-    }}
+    }
 
-    .day-num {{
+    .day-num {
       font-size: 0.9rem;
       font-weight: 600;
       line-height: 1.2;
       z-index: 2;
-    }}
+    }
 
-    .cal-dots-row {{
+    .cal-dots-row {
       display: flex;
       gap: 2px;
       margin-top: 2px;
       height: 6px;
       justify-content: center;
-    }}
+    }
 
-    .cal-cell.heat-0 {{
+    .cal-cell.heat-0 {
       background: transparent;
-    }}
+    }
 
-    .cal-cell.heat-1 {{
+    .cal-cell.heat-1 {
       background: rgba(254, 243, 199, 0.7);
-    }}
+    }
 
-    .cal-cell.heat-2 {{
+    .cal-cell.heat-2 {
       background: rgba(253, 230, 138, 0.7);
-    }}
+    }
 
-    .cal-cell.heat-3 {{
+    .cal-cell.heat-3 {
       background: rgba(252, 211, 77, 0.7);
-    }}
+    }
 
-    .cal-cell.heat-4 {{
+    .cal-cell.heat-4 {
       background: rgba(251, 191, 36, 0.75);
-    }}
+    }
 
-    .cal-cell.issues-hidden {{
+    .cal-cell.issues-hidden {
       visibility: hidden;
-    }}
+    }
 
-    .calendar-tooltip {{
+    .calendar-tooltip {
       position: absolute;
       left: 50%;
       bottom: calc(100% + 6px);
@@ -2313,103 +2236,103 @@ def render_report_html(report: Dict[str, Any]) -> str:
       pointer-events: none;
       transition: opacity 0.15s, transform 0.15s;
       z-index: 10;
-    }}
+    }
 
-    .cal-cell:hover .calendar-tooltip {{
+    .cal-cell:hover .calendar-tooltip {
       opacity: 1;
       transform: translateX(-50%) translateY(0);
-    }}
+    }
 
-    .cal-grid-dot {{
+    .cal-grid-dot {
       width: 5px;
       height: 5px;
       border-radius: 50%;
       background: var(--group-color);
-    }}
+    }
 
-    .calendar-wrapper {{
+    .calendar-wrapper {
       display: grid;
       gap: 0.75rem;
-    }}
+    }
 
-    .calendar-sticky {{
+    .calendar-sticky {
       position: sticky;
       top: 1rem;
       align-self: start;
-    }}
+    }
 
-    .calendar-header {{
+    .calendar-header {
       display: flex;
       align-items: center;
       justify-content: space-between;
       gap: 0.5rem;
-    }}
+    }
 
-    .calendar-controls {{
+    .calendar-controls {
       display: grid;
       gap: 0.4rem;
-    }}
+    }
 
-    .calendar-controls-row {{
+    .calendar-controls-row {
       display: flex;
       flex-wrap: wrap;
       gap: 0.4rem;
-    }}
+    }
 
-    .calendar-toggle {{
+    .calendar-toggle {
       display: inline-flex;
       align-items: center;
       gap: 0.35rem;
       font-size: 0.75rem;
       color: var(--text-muted);
-    }}
+    }
 
-    .calendar-events {{
+    .calendar-events {
       display: grid;
       gap: 0.5rem;
-    }}
+    }
 
-    .calendar-events-header {{
+    .calendar-events-header {
       font-family: "Space Grotesk", sans-serif;
       font-size: 0.7rem;
       text-transform: uppercase;
       letter-spacing: 0.1em;
       color: var(--text-muted);
-    }}
+    }
 
-    .calendar-empty {{
+    .calendar-empty {
       display: none;
       font-size: 0.75rem;
       opacity: 0.6;
-    }}
+    }
 
-    .calendar-empty.is-visible {{
+    .calendar-empty.is-visible {
       display: block;
-    }}
+    }
 
-    .cal-events-list {{
+    .cal-events-list {
       flex-grow: 1;
       display: flex;
       flex-wrap: wrap;
       gap: 0.35rem;
-    }}
+    }
 
-    .calendar-agenda {{
+    .calendar-agenda {
       display: grid;
       gap: 0.35rem;
-    }}
+    }
 
-    .calendar-agenda-summary {{
+    .calendar-agenda-summary {
       font-size: 0.75rem;
       color: var(--text-muted);
-    }}
+    }
 
-    .calendar-agenda-list {{
+    .calendar-agenda-list {
       display: grid;
       gap: 0.45rem;
-    }}
+    }
 
-    .agenda-item {{
+    .agenda-item {
       display: flex;
       justify-content: space-between;
       align-items: flex-start;
@@ -2418,33 +2341,33 @@ def render_report_html(report: Dict[str, Any]) -> str:
       border-radius: 0.6rem;
       border: 1px solid #e2e8f0;
       background: #fff;
-    }}
+    }
 
-    .agenda-title {{
+    .agenda-title {
       font-size: 0.8rem;
       font-weight: 600;
-    }}
+    }
 
-    .agenda-meta {{
+    .agenda-meta {
       font-size: 0.7rem;
       color: var(--text-muted);
-    }}
+    }
 
-    .agenda-actions {{
+    .agenda-actions {
       display: flex;
       flex-wrap: wrap;
       gap: 0.25rem;
-    }}
+    }
 
-    #calendar-collapse-toggle {{
+    #calendar-collapse-toggle {
       display: inline-flex;
-    }}
+    }
 
-    #calendar-card.is-collapsed #calendar-body {{
+    #calendar-card.is-collapsed #calendar-body {
       display: none;
-    }}
+    }
 
-    .cal-pill {{
+    .cal-pill {
       display: inline-flex;
       align-items: center;
       gap: 0.35rem;
@@ -2458,373 +2381,138 @@ def render_report_html(report: Dict[str, Any]) -> str:
       border-width: 1.5px;
       border-color: var(--group-color);
       transition: transform 0.1s;
-    }}
+    }
 
-    .cal-pill:hover {{
+    .cal-pill:hover {
       transform: scale(1.05);
-    }}
+    }
 
-    .cal-pill.border-dashed {{
+    .cal-pill.border-dashed {
       border-style: dashed;
-    }}
+    }
 
-    .cal-pill.border-solid {{
+    .cal-pill.border-solid {
       border-style: solid;
-    }}
+    }
 
-    .cal-dot {{
+    .cal-dot {
       width: 6px;
       height: 6px;
       border-radius: 50%;
       background: var(--group-color);
-    }}
+    }
 
-    {group_color_css_text}
+    """ + GROUP_COLOR_CSS + """
   </style>
 </head>
-<body>
-  <nav class="navbar bg-base-100 shadow-sm sticky top-0 z-50 px-4 py-2 mb-6" style="background-color: rgba(255,255,255,0.95); backdrop-filter: blur(4px);">
-    <div class="flex-1">
-      <span class="text-xl font-bold tracking-tight" style="color: var(--col-blue)">CrickNet Checker</span>
-    </div>
-    <div class="flex-none items-center gap-2">
-      <!-- Actionable Toggle -->
-      <label class="cursor-pointer label p-0 mr-4 hidden md:flex">
-        <span class="label-text mr-2 text-xs font-semibold uppercase opacity-60">Actionable only</span> 
-        <input type="checkbox" class="toggle toggle-sm toggle-error" id="actionable-toggle" />
-      </label>
-      
-      <!-- Mobile Actionable Toggle (Compact) -->
-       <label class="cursor-pointer label p-0 mr-2 md:hidden">
-        <input type="checkbox" class="toggle toggle-xs toggle-error" id="actionable-toggle-mobile" />
-      </label>
+"""
 
-      <div class="divider divider-horizontal mx-1"></div>
-      
-      <!-- Links -->
-      <a href="#priority" class="btn btn-ghost btn-sm hidden sm:inline-flex">Priority</a>
-      <a href="#group-nav" class="btn btn-ghost btn-sm hidden sm:inline-flex">Groups</a>
-      
-      <!-- Actions -->
-      <button class="btn btn-ghost btn-sm btn-square" onclick="window.print()" title="Save as PDF">
-        <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M17 17h2a2 2 0 002-2v-4a2 2 0 00-2-2H5a2 2 0 00-2 2v4a2 2 0 002 2h2m2 4h6a2 2 0 002-2v-4a2 2 0 00-2-2H9a2 2 0 00-2 2v4a2 2 0 002 2zm8-12V5a2 2 0 00-2-2H9a2 2 0 00-2 2v4h10z" /></svg>
-      </button>
-      <button class="btn btn-ghost btn-sm btn-square" onclick="toggleAllGroups(true)" title="Expand All">
-        <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 13l-7 7-7-7m14-8l-7 7-7-7" /></svg>
-      </button>
-      <button class="btn btn-ghost btn-sm btn-square" onclick="toggleAllGroups(false)" title="Collapse All">
-        <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 15l7-7 7 7" /></svg>
-      </button>
-    </div>
-  </nav>
 
-  <div class="max-w-7xl mx-auto px-2.5 py-4 md:py-8">
-    <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-8">
-      <div class="stat-box bg-white p-4 rounded-lg shadow-sm border border-slate-100">
-        <div class="text-xs uppercase font-bold text-slate-400">Report Generated</div>
-        <div class="text-lg font-medium">{generated_friendly}</div>
-      </div>
-      <div class="stat-box bg-white p-4 rounded-lg shadow-sm border border-slate-100">
-        <div class="text-xs uppercase font-bold text-slate-400">Spreadsheet Data</div>
-        <div class="text-lg font-medium">Refreshed {source_updated_friendly}</div>
-        <div class="text-xs text-slate-500 mt-1">{next_update_html}</div>
-      </div>
-    </div>
+# Static report script: filters, calendar, agenda and URL state (plain string, so braces are not doubled).
+# The page defines window.CALENDAR_EVENTS just before it.
+REPORT_SCRIPT_JS = """
+    function toggleAllGroups(openState) {
+      document.querySelectorAll("details.group-details").forEach((el) => {
+        el.open = openState;
+      });
+    }
 
-    <div class="grid gap-6 lg:grid-cols-[460px_minmax(0,1fr)]">
-      <aside id="group-nav" class="space-y-4 min-w-0">
-        <div class="card bg-base-100 shadow quick-summary">
-          <div class="card-body p-4">
-            <div class="text-xs uppercase tracking-wide opacity-70">Quick summary</div>
-            <div class="mt-2 text-sm">
-              <div class="font-semibold">{total_confirmed} confirmed</div>
-              <div>{total_ok} OK</div>
-              <div class="text-error">{total_missing} missing on listings</div>
-              <div class="text-warning">{total_check} check</div>
-            </div>
-            <div class="mt-3 text-xs opacity-70">{summary_line}</div>
-          </div>
-        </div>
+    const summaryCard = document.querySelector(".quick-summary");
+    const calendarCard = document.querySelector("#calendar-card");
+    const summarySection = document.querySelector("#summary");
+    // Tracked in JS so syncing the calendar never reads back the class just written
+    let summaryIsVisible = false;
+    function syncCalendarVisibility() {
+      if (!calendarCard || !summaryCard) return;
+      calendarCard.classList.toggle("is-hidden", summaryIsVisible);
+    }
+    if (summaryCard && summarySection && "IntersectionObserver" in window) {
+      const observer = new IntersectionObserver(
+        (entries) => {
+          entries.forEach((entry) => {
+            summaryIsVisible = !entry.isIntersecting;
+            summaryCard.classList.toggle("is-visible", summaryIsVisible);
+            syncCalendarVisibility();
+          });
+        },
+        { root: null, threshold: 0.2 }
+      );
+      observer.observe(summarySection);
+    } else if (summaryCard) {
+      summaryIsVisible = true;
+      summaryCard.classList.add("is-visible");
+      syncCalendarVisibility();
+    }
 
-        <div id="calendar-card" class="card bg-base-100 shadow calendar-sticky" data-report-date="{report_date_iso}">
-          <div class="card-body p-4">
-            <div class="calendar-header">
-              <div class="text-xs uppercase tracking-wide opacity-70">Calendar</div>
-              <button class="btn btn-ghost btn-xs" id="calendar-collapse-toggle" type="button" aria-expanded="true">Collapse</button>
-            </div>
+    const groupCards = Array.from(document.querySelectorAll(".group-card[data-group]"));
+    const navLinks = Array.from(document.querySelectorAll("[data-group-link]"));
+    const linkByGroup = new Map();
+    navLinks.forEach((link) => {
+      linkByGroup.set(link.getAttribute("data-group-link"), { link, li: link.closest("li") });
+    });
 
-            <div id="calendar-body">
-              <div class="calendar-controls mt-2">
-                <div class="calendar-controls-row">
-                  <button class="btn btn-xs btn-outline" id="calendar-jump-today" type="button">Jump to today</button>
-                  <button class="btn btn-xs btn-outline" id="calendar-jump-issue" type="button">Jump to next issue</button>
-                  <button class="btn btn-xs btn-ghost" id="calendar-view-toggle" type="button">Month</button>
-                </div>
-                <div class="calendar-controls-row">
-                  <label class="calendar-toggle">
-                    <input type="checkbox" class="checkbox checkbox-xs" id="calendar-issues-only" />
-                    <span>Issues only</span>
-                  </label>
-                  <label class="calendar-toggle">
-                    <input type="checkbox" class="checkbox checkbox-xs" id="calendar-search-toggle" checked />
-                    <span>Search affects calendar</span>
-                  </label>
-                </div>
-              </div>
+    function setActiveGroup(slug) {
+      if (!slug) return;
+      navLinks.forEach((l) => l.classList.remove("is-active"));
+      const entry = linkByGroup.get(slug);
+      if (entry) {
+        entry.link.classList.add("is-active");
+      }
+    }
 
-              <div class="calendar-wrapper">
-                <div class="custom-calendar-card bg-base-100 border border-base-300 shadow-lg rounded-box p-4">
-                  <div class="cal-top-bar mb-4 flex justify-between items-center">
-                    <span class="text-lg font-bold tracking-tight" id="calendar-month-label">Month</span>
-                    <div class="flex gap-1">
-                      <select id="calendar-month-select" class="select select-xs select-bordered" aria-label="Jump to month"></select>
-                      <button class="btn btn-xs btn-ghost btn-square" id="calendar-prev" type="button" aria-label="Previous month">◀</button>
-                      <button class="btn btn-xs btn-ghost btn-square" id="calendar-next" type="button" aria-label="Next month">▶</button>
-                    </div>
-                  </div>
-                  <div class="cal-grid" id="calendar-grid"></div>
-                </div>
+    // With IntersectionObserver the active group follows the first visible card
+    // crossing a band below the header, so scrolling never reads layout
+    let groupObserver = null;
+    if ("IntersectionObserver" in window) {
+      groupObserver = new IntersectionObserver(
+        (entries) => {
+          entries.forEach((entry) => {
+            entry.target._intersecting = entry.isIntersecting;
+          });
+          updateActiveGroup();
+        },
+        { root: null, rootMargin: "-140px 0px -50% 0px", threshold: 0 }
+      );
+      groupCards.forEach((card) => groupObserver.observe(card));
+    }
 
-                <div class="calendar-events mt-2">
-                  <div class="calendar-events-header" id="calendar-events-title">Events</div>
-                  <div class="cal-events-list" id="calendar-events-list">
-                    {calendar_pills_html}
-                  </div>
-                  <div class="calendar-empty" id="calendar-events-empty">No events on this date.</div>
-                </div>
-              </div>
+    function updateActiveGroup() {
+      if (groupObserver) {
+        const current = groupCards.find((card) => card._intersecting && !card.classList.contains("is-hidden"));
+        if (current) setActiveGroup(current.getAttribute("data-group"));
+        else navLinks.forEach((l) => l.classList.remove("is-active"));
+        return;
+      }
 
-              <div class="calendar-agenda mt-4" id="calendar-agenda">
-                <div class="calendar-events-header">Agenda</div>
-                <div class="calendar-agenda-summary" id="calendar-agenda-summary"></div>
-                <div class="calendar-agenda-list" id="calendar-agenda-list"></div>
-                <div class="calendar-empty" id="calendar-agenda-empty">No items for this date.</div>
-              </div>
-            </div>
-          </div>
-        </div>
+      const visible = groupCards.filter((card) => !card.classList.contains("is-hidden"));
+      if (!visible.length) return;
 
-        <div class="card bg-base-100 shadow interest-groups-card">
-          <div class="card-body p-4">
-            <div class="text-xs uppercase tracking-wide opacity-70">Interest groups</div>
-            <div class="mt-3 flex gap-2">
-              <button type="button" class="btn btn-xs btn-outline tooltip" data-tip="Show internal only" data-category-preset="internal">Internal</button>
-              <button type="button" class="btn btn-xs btn-outline tooltip" data-tip="Show external only" data-category-preset="external">External</button>
-              <button type="button" class="btn btn-xs btn-ghost tooltip" data-tip="Show both" data-category-preset="all">All</button>
-            </div>
-            <ul class="mt-3 space-y-2">
-              {group_nav_html}
-            </ul>
-          </div>
-        </div>
-      </aside>
+      const inView = visible.filter((card) => {
+        const rect = card.getBoundingClientRect();
+        return rect.top < window.innerHeight && rect.bottom > 0;
+      });
 
-      <main class="space-y-6 min-w-0">
-        <section id="summary" class="card bg-base-100 shadow reveal">
-          <div class="card-body p-5 md:p-6">
-            <div class="flex flex-col lg:flex-row lg:items-center lg:justify-between gap-4">
-              <div>
-                <h2 class="text-xl font-semibold">At a glance</h2>
-                <p class="text-sm opacity-80 mt-1">Overview of confirmed entries and checks against site listings.</p>
-              </div>
-              <div class="summary-stats">
-                <div class="summary-stat">
-                  <div class="label">Confirmed</div>
-                  <div class="value">{total_confirmed}</div>
-                </div>
-                <div class="summary-stat value-ok">
-                  <div class="label">OK</div>
-                  <div class="value">{total_ok}</div>
-                </div>
-                <div class="summary-stat value-missing">
-                  <div class="label">Missing</div>
-                  <div class="value">{total_missing}</div>
-                </div>
-                <div class="summary-stat value-check">
-                  <div class="label">Check</div>
-                  <div class="value">{total_check}</div>
-                </div>
-              </div>
-            </div>
-          </div>
-        </section>
-
-        <section id="filters" class="card bg-base-100 shadow reveal">
-          <div class="card-body p-5 md:p-6">
-            <div class="flex flex-col md:flex-row md:items-center md:justify-between gap-3">
-              <div>
-                <h2 class="text-xl font-semibold">Filters</h2>
-                <p class="text-sm opacity-80 mt-1">Filter by group, status, or search for a speaker/lab.</p>
-              </div>
-              <div class="filter-actions">
-                <button id="clear-filters" class="btn btn-ghost btn-sm">Clear filters</button>
-              </div>
-            </div>
-            <div class="mt-4 filter-row">
-              <div>
-                <label class="text-xs uppercase tracking-wide opacity-70" for="filter-search">Search</label>
-                <input id="filter-search" class="input input-bordered w-full mt-2" type="search" placeholder="Search speaker, lab, or note" />
-              </div>
-              <div>
-                <label class="text-xs uppercase tracking-wide opacity-70" for="filter-group">Interest group</label>
-                <select id="filter-group" class="select select-bordered w-full mt-2">
-                  <option value="all">All groups</option>
-                  {group_filter_options}
-                </select>
-              </div>
-              <div>
-                 <label class="text-xs uppercase tracking-wide opacity-70" for="filter-category">Category</label>
-                 <select id="filter-category" class="select select-bordered w-full mt-2">
-                    <option value="all">All Categories</option>
-                    <option value="internal">Internal</option>
-                    <option value="external">External</option>
-                 </select>
-              </div>
-            </div>
-            <div class="mt-4 filter-status">
-              <label>
-                <input type="checkbox" class="checkbox checkbox-success" name="status-filter" value="ok" checked />
-                <span>OK</span>
-              </label>
-              <label>
-                <input type="checkbox" class="checkbox checkbox-error" name="status-filter" value="missing" checked />
-                <span>Missing</span>
-              </label>
-              <label>
-                <input type="checkbox" class="checkbox checkbox-warning" name="status-filter" value="check" checked />
-                <span>Check</span>
-              </label>
-              <label>
-                <input type="checkbox" class="checkbox checkbox-neutral" name="status-filter" value="extra" checked />
-                <span>Extra</span>
-              </label>
-            </div>
-          </div>
-        </section>
-
-        <section id="priority" class="card bg-base-100 shadow reveal">
-          <div class="card-body p-0">
-            <details class="collapse collapse-arrow">
-              <summary class="collapse-title px-6 py-5 cursor-pointer">
-                <div class="space-y-3">
-                  <div class="flex flex-col md:flex-row md:items-center md:justify-between gap-2">
-                    <div class="text-xl font-semibold">High priority (next 14 days)</div>
-                    <div class="flex flex-wrap gap-2">
-                      <span class="badge badge-neutral">{priority_group_count} group(s)</span>
-                      <span class="badge badge-ghost">{priority_item_count} item(s)</span>
-                    </div>
-                  </div>
-                  <div class="priority-counts">
-                    {priority_summary_items}
-                  </div>
-                </div>
-              </summary>
-              <div class="collapse-content px-6 pb-6">
-                <div>
-                  {priority_cards}
-                </div>
-              </div>
-            </details>
-          </div>
-        </section>
-
-        <section id="groups" class="space-y-5">
-          {group_html}
-        </section>
-      </main>
-    </div>
-  </div>
-
-  <button id="to-top" class="btn btn-primary btn-sm to-top" aria-label="Back to top">Top</button>
-
-  <script>
-    window.CALENDAR_EVENTS = {calendar_events_json};
-
-    function toggleAllGroups(openState) {{
-      document.querySelectorAll("details.group-details").forEach((el) => {{
-        el.open = openState;
-      }});
-    }}
-
-    const summaryCard = document.querySelector(".quick-summary");
-    const calendarCard = document.querySelector("#calendar-card");
-    const summarySection = document.querySelector("#summary");
-    function syncCalendarVisibility() {{
-      if (!calendarCard || !summaryCard) return;
-      calendarCard.classList.toggle("is-hidden", summaryCard.classList.contains("is-visible"));
-    }}
-    if (summaryCard && summarySection && "IntersectionObserver" in window) {{
-      const observer = new IntersectionObserver(
-        (entries) => {{
-          entries.forEach((entry) => {{
-            if (entry.isIntersecting) {{
-              summaryCard.classList.remove("is-visible");
-            }} else {{
-              summaryCard.classList.add("is-visible");
-            }}
-            syncCalendarVisibility();
-          }});
-        }},
-        {{ root: null, threshold: 0.2 }}
-      );
-      observer.observe(summarySection);
-    }} else if (summaryCard) {{
-      summaryCard.classList.add("is-visible");
-      syncCalendarVisibility();
-    }}
-
-    const groupCards = Array.from(document.querySelectorAll(".group-card[data-group]"));
-    const navLinks = Array.from(document.querySelectorAll("[data-group-link]"));
-    const linkByGroup = {{}};
-    navLinks.forEach((link) => {{
-      linkByGroup[link.getAttribute("data-group-link")] = link;
-    }});
-
-    function setActiveGroup(slug) {{
-      if (!slug) return;
-      navLinks.forEach((l) => l.classList.remove("is-active"));
-      const link = linkByGroup[slug];
-      if (link) {{
-        link.classList.add("is-active");
-      }}
-    }}
-
-    function updateActiveGroup() {{
-      const visible = groupCards.filter((card) => !card.classList.contains("is-hidden"));
-      if (!visible.length) return;
-
-      const inView = visible.filter((card) => {{
-        const rect = card.getBoundingClientRect();
-        return rect.top < window.innerHeight && rect.bottom > 0;
-      }});
-
-      if (!inView.length) {{
+      if (!inView.length) {
         navLinks.forEach((l) => l.classList.remove("is-active"));
         return;
-      }}
+      }
 
       const targetY = 140;
       let best = null;
       let bestDist = Infinity;
-      inView.forEach((card) => {{
+      inView.forEach((card) => {
         const top = card.getBoundingClientRect().top;
         const dist = Math.abs(top - targetY);
-        if (dist < bestDist) {{
+        if (dist < bestDist) {
           bestDist = dist;
           best = card;
-        }}
-      }});
+        }
+      });
 
-      if (best) {{
+      if (best) {
         setActiveGroup(best.getAttribute("data-group"));
-      }}
-    }}
-
-    navLinks.forEach((link) => {{
-      link.addEventListener("click", () => {{
-        setActiveGroup(link.getAttribute("data-group-link"));
-      }});
-    }});
+      }
+    }
 
     const filterGroup = document.querySelector("#filter-group");
     const filterCategory = document.querySelector("#filter-category");
@@ -2834,206 +2522,349 @@ def render_report_html(report: Dict[str, Any]) -> str:
     const actionableToggle = document.querySelector("#actionable-toggle");
     const actionableToggleMobile = document.querySelector("#actionable-toggle-mobile");
 
-    function statusChecked(value) {{
-      const input = statusInputs.find((el) => el.value === value);
+    const statusInputByValue = {};
+    statusInputs.forEach((input) => {
+      statusInputByValue[input.value] = input;
+    });
+
+    // Row statuses as bits, so the status filter is a single AND per row
+    const STATUS_BITS = { ok: 1, warn: 2, bad: 4, extra: 8, date_mismatch: 16 };
+    const ALL_STATUS_BITS = 31;
+    const FILTER_STATUS_BITS = {
+      missing: STATUS_BITS.bad,
+      check: STATUS_BITS.warn | STATUS_BITS.date_mismatch,
+    };
+
+    function statusChecked(value) {
+      const input = statusInputByValue[value];
       return input ? input.checked : false;
-    }}
-
-    function selectedRowStatuses() {{
-      const selected = new Set();
-      statusInputs.forEach((input) => {{
-        if (!input.checked) return;
-        if (input.value === "missing") {{
-          selected.add("bad");
-        }} else if (input.value === "check") {{
-          selected.add("warn");
-          selected.add("date_mismatch");
-        }} else {{
-          selected.add(input.value);
-        }}
-      }});
-      if (selected.size === 0) {{
-        ["ok", "warn", "bad", "extra", "date_mismatch"].forEach((st) => selected.add(st));
-      }}
-      return selected;
-    }}
+    }
+
+    function selectedStatusMask() {
+      let mask = 0;
+      for (let i = 0; i < statusInputs.length; i += 1) {
+        const input = statusInputs[i];
+        if (input.checked) mask |= FILTER_STATUS_BITS[input.value] || STATUS_BITS[input.value] || 0;
+      }
+      return mask || ALL_STATUS_BITS;
+    }
     
-    function getActionableState() {{
+    function getActionableState() {
         if (actionableToggle && actionableToggle.offsetParent !== null) return actionableToggle.checked;
         if (actionableToggleMobile && actionableToggleMobile.offsetParent !== null) return actionableToggleMobile.checked;
         return (actionableToggle ? actionableToggle.checked : false);
-    }}
+    }
     
-    function syncActionableToggles() {{
+    function syncActionableToggles() {
         const val = this.checked;
         if (actionableToggle) actionableToggle.checked = val;
         if (actionableToggleMobile) actionableToggleMobile.checked = val;
         applyFilters();
-    }}
+    }
+
+    // The report body is static, so card and row metadata is read from the DOM once
+    const allDateCards = Array.from(document.querySelectorAll(".date-card"));
+    const allRows = [];
+    allDateCards.forEach((card) => {
+      const titleEl = card.querySelector(".text-sm.font-medium");
+      const meta = {
+        date: card.getAttribute("data-date") || "",
+        groupLabel: card.getAttribute("data-group-label") || card.getAttribute("data-group") || "Group",
+        groupSlug: card.getAttribute("data-group-slug") || card.getAttribute("data-group") || "",
+        groupUrl: card.getAttribute("data-group-url") || "",
+        category: card.getAttribute("data-category") || "",
+        anchor: card.getAttribute("id") || "",
+        title: titleEl ? titleEl.textContent.trim() : "Agenda item",
+      };
+      card._meta = meta;
+      card._rows = Array.from(card.querySelectorAll("tbody tr"));
+      card._details = Array.from(card.querySelectorAll("[data-detail]"));
+      card._rows.forEach((row) => {
+        const cells = row.querySelectorAll("td");
+        const expected = cells[1] ? cells[1].textContent.trim() : "";
+        const found = cells[2] ? cells[2].textContent.trim() : "";
+        row._index = allRows.length;
+        allRows.push(row);
+        row._status = row.getAttribute("data-status") || "";
+        row._statusBit = STATUS_BITS[row._status] || 0;
+        // Agenda entries only depend on the static row, so build each one once
+        row._agendaItem = {
+          date: meta.date,
+          status: row._status,
+          title: expected || found || meta.title,
+          groupLabel: meta.groupLabel,
+          groupSlug: meta.groupSlug,
+          groupUrl: meta.groupUrl,
+          category: meta.category,
+          anchor: meta.anchor,
+          note: cells[3] ? cells[3].textContent.trim() : "",
+        };
+      });
+    });
+    groupCards.forEach((card) => {
+      card._dateCards = Array.from(card.querySelectorAll(".date-card"));
+    });
+
+    // Search uses a trigram index over the lowercased row text: rows holding every
+    // trigram of the query are candidates, and only those are checked with includes().
+    // Queries shorter than a trigram scan all rows.
+    let searchIndex = null;
+
+    function rowSearchText(row) {
+      if (row._searchText === undefined) row._searchText = row.textContent.toLowerCase();
+      return row._searchText;
+    }
+
+    function buildSearchIndex() {
+      const index = new Map();
+      allRows.forEach((row, i) => {
+        const text = rowSearchText(row);
+        for (let j = 0; j + 3 <= text.length; j += 1) {
+          const gram = text.slice(j, j + 3);
+          const postings = index.get(gram);
+          if (!postings) {
+            index.set(gram, [i]);
+          } else if (postings[postings.length - 1] !== i) {
+            postings.push(i);
+          }
+        }
+      });
+      return index;
+    }
+
+    function intersectSorted(a, b) {
+      const out = [];
+      let i = 0;
+      let j = 0;
+      while (i < a.length && j < b.length) {
+        if (a[i] === b[j]) {
+          out.push(a[i]);
+          i += 1;
+          j += 1;
+        } else if (a[i] < b[j]) {
+          i += 1;
+        } else {
+          j += 1;
+        }
+      }
+      return out;
+    }
+
+    function searchMatches(query) {
+      const flags = new Uint8Array(allRows.length);
+      if (query.length < 3) {
+        allRows.forEach((row, i) => {
+          if (rowSearchText(row).includes(query)) flags[i] = 1;
+        });
+        return flags;
+      }
+      if (!searchIndex) searchIndex = buildSearchIndex();
+      const lists = [];
+      for (let j = 0; j + 3 <= query.length; j += 1) {
+        const postings = searchIndex.get(query.slice(j, j + 3));
+        if (!postings) return flags;
+        lists.push(postings);
+      }
+      lists.sort((a, b) => a.length - b.length);
+      let candidates = lists[0];
+      for (let k = 1; k < lists.length && candidates.length; k += 1) {
+        candidates = intersectSorted(candidates, lists[k]);
+      }
+      candidates.forEach((i) => {
+        if (allRows[i]._searchText.includes(query)) flags[i] = 1;
+      });
+      return flags;
+    }
 
-    function applyFilters() {{
+    // Row/card visibility only; the calendar model is rebuilt separately
+    let rowSearchValue = "";
+    function applyRowFilters() {
       const groupValue = filterGroup ? filterGroup.value : "all";
       const categoryValue = filterCategory ? filterCategory.value : "all";
       const searchValue = filterSearch ? filterSearch.value.trim().toLowerCase() : "";
-      const selectedStatuses = selectedRowStatuses();
+      rowSearchValue = searchValue;
+      const statusMask = selectedStatusMask();
+      const searchFlags = searchValue ? searchMatches(searchValue) : null;
       const showMissing = statusChecked("missing");
       const showCheck = statusChecked("check");
       const showExtra = statusChecked("extra");
       
       const onlyActionable = getActionableState();
 
-      groupCards.forEach((card) => {{
+      groupCards.forEach((card) => {
         const groupSlug = card.getAttribute("data-group");
         const hasIssues = card.getAttribute("data-has-issues") === "true";
         
         let groupMatch = (groupValue === "all" || groupValue === groupSlug);
         
-        if (onlyActionable && !hasIssues) {{
+        if (onlyActionable && !hasIssues) {
            groupMatch = false;
-        }}
+        }
 
-        const dateCards = Array.from(card.querySelectorAll(".date-card"));
+        const dateCards = card._dateCards;
 
-        if (!dateCards.length) {{
+        if (!dateCards.length) {
            const visible = groupMatch;
            card.classList.toggle("is-hidden", !visible);
-           const link = linkByGroup[groupSlug];
-           if (link) {{
-             const li = link.closest("li");
-             if (li) li.classList.toggle("is-hidden", !visible);
-           }}
+           const entry = linkByGroup.get(groupSlug);
+           if (entry && entry.li) entry.li.classList.toggle("is-hidden", !visible);
            return;
-        }}
+        }
 
         let cardVisible = false;
-        dateCards.forEach((dateCard) => {{
-          const cardCat = dateCard.getAttribute("data-category") || "";
+        dateCards.forEach((dateCard) => {
+          const cardCat = dateCard._meta.category;
           let categoryMatch = true;
-          if (categoryValue !== "all") {{
-            if (categoryValue === "external") {{
+          if (categoryValue !== "all") {
+            if (categoryValue === "external") {
               categoryMatch = cardCat.includes("external");
-            }} else {{
+            } else {
               categoryMatch = cardCat.includes(categoryValue);
-            }}
-          }}
+            }
+          }
 
           const cardMatch = groupMatch && categoryMatch;
-          dateCard.setAttribute("data-card-match", cardMatch ? "1" : "0");
-          if (!cardMatch) {{
+          dateCard._cardMatch = cardMatch;
+          if (!cardMatch) {
             dateCard.classList.add("is-hidden");
             return;
-          }}
+          }
 
           let rowVisible = false;
-          const rows = Array.from(dateCard.querySelectorAll("tbody tr"));
-          rows.forEach((row) => {{
-            const status = row.getAttribute("data-status") || "";
-            
+          dateCard._rows.forEach((row) => {
+            const status = row._status;
+
             const actionableMatch = !(onlyActionable && status === "ok");
-            const statusMatch = selectedStatuses.has(status);
-            const textMatch = !searchValue || row.textContent.toLowerCase().includes(searchValue);
+            const statusMatch = (statusMask & row._statusBit) !== 0;
+            const textMatch = !searchFlags || searchFlags[row._index] === 1;
             const baseMatch = actionableMatch && statusMatch;
-            row.setAttribute("data-match-base", baseMatch ? "1" : "0");
-            row.setAttribute("data-match-search", textMatch ? "1" : "0");
+            row._matchBase = baseMatch;
+            row._matchSearch = textMatch;
             const show = baseMatch && textMatch;
-            row.classList.toggle("is-hidden", !show);
+            if (row._shown !== show) {
+              row.classList.toggle("is-hidden", !show);
+              row._shown = show;
+            }
             if (show) rowVisible = true;
-          }});
+          });
 
-          const details = Array.from(dateCard.querySelectorAll("[data-detail]"));
-          details.forEach((block) => {{
+          dateCard._details.forEach((block) => {
             const detailType = block.getAttribute("data-detail");
             let allow = true;
-            if (detailType === "missing") {{
+            if (detailType === "missing") {
               allow = showMissing;
-            }} else if (detailType === "extra") {{
+            } else if (detailType === "extra") {
               allow = showExtra;
-            }} else if (detailType === "likely") {{
+            } else if (detailType === "likely") {
               allow = showCheck || showExtra;
-            }} else if (detailType === "date-mismatch") {{
+            } else if (detailType === "date-mismatch") {
               allow = showCheck;
-            }}
+            }
             block.classList.toggle("is-hidden", !allow || !rowVisible);
-          }});
+          });
 
           dateCard.classList.toggle("is-hidden", !rowVisible);
           if (rowVisible) cardVisible = true;
-        }});
+        });
         
         card.classList.toggle("is-hidden", !groupMatch || !cardVisible);
-        const link = linkByGroup[groupSlug];
-        if (link) {{
-          const li = link.closest("li");
-          if (li) li.classList.toggle("is-hidden", !groupMatch || !cardVisible);
-        }}
-      }});
+        const entry = linkByGroup.get(groupSlug);
+        if (entry && entry.li) entry.li.classList.toggle("is-hidden", !groupMatch || !cardVisible);
+      });
 
       updateActiveGroup();
+    }
+
+    function applyFilters() {
+      applyRowFilters();
       rebuildCalendarModel();
-      updateUrlState();
-    }}
+      scheduleUrlState();
+    }
+
+    // Typing is coalesced to one row pass per frame, and the calendar is rebuilt
+    // once the keystrokes settle; other controls apply immediately
+    let searchFrame = 0;
+    let calendarRebuildTimer = 0;
+    function scheduleSearchFilters() {
+      if (searchFrame) return;
+      searchFrame = requestAnimationFrame(() => {
+        searchFrame = 0;
+        applyRowFilters();
+        clearTimeout(calendarRebuildTimer);
+        calendarRebuildTimer = setTimeout(() => {
+          rebuildCalendarModel();
+          scheduleUrlState();
+        }, 150);
+      });
+    }
 
     if (filterGroup) filterGroup.addEventListener("change", applyFilters);
     if (filterCategory) filterCategory.addEventListener("change", applyFilters);
-    if (filterSearch) filterSearch.addEventListener("input", applyFilters);
+    if (filterSearch) filterSearch.addEventListener("input", scheduleSearchFilters);
     if (actionableToggle) actionableToggle.addEventListener("change", syncActionableToggles);
     if (actionableToggleMobile) actionableToggleMobile.addEventListener("change", syncActionableToggles);
     statusInputs.forEach((input) => input.addEventListener("change", applyFilters));
     
-    if (clearFilters) {{
-      clearFilters.addEventListener("click", () => {{
+    if (clearFilters) {
+      clearFilters.addEventListener("click", () => {
         if (filterGroup) filterGroup.value = "all";
         if (filterCategory) filterCategory.value = "all";
         if (filterSearch) filterSearch.value = "";
         if (actionableToggle) actionableToggle.checked = false;
         if (actionableToggleMobile) actionableToggleMobile.checked = false;
-        statusInputs.forEach((input) => {{
+        statusInputs.forEach((input) => {
           input.checked = true;
-        }});
+        });
         applyFilters();
-      }});
-    }}
+      });
+    }
 
     const toTopButton = document.querySelector("#to-top");
-    function updateToTop() {{
+    function updateToTop() {
       if (!toTopButton) return;
-      if (window.scrollY > 400) {{
+      if (window.scrollY > 400) {
         toTopButton.classList.add("is-visible");
-      }} else {{
+      } else {
         toTopButton.classList.remove("is-visible");
-      }}
-    }}
-    if (toTopButton) {{
-      toTopButton.addEventListener("click", () => {{
-        window.scrollTo({{ top: 0, behavior: "smooth" }});
-      }});
-    }}
+      }
+    }
+    if (toTopButton) {
+      toTopButton.addEventListener("click", () => {
+        window.scrollTo({ top: 0, behavior: "smooth" });
+      });
+    }
 
     let scrollTicking = false;
-    function onScroll() {{
+    function onScroll() {
       if (scrollTicking) return;
       scrollTicking = true;
-      requestAnimationFrame(() => {{
-        updateActiveGroup();
+      requestAnimationFrame(() => {
+        if (!groupObserver) updateActiveGroup();
         updateToTop();
         scrollTicking = false;
-      }});
-    }}
+      });
+    }
 
-    window.addEventListener("scroll", onScroll, {{ passive: true }});
-    window.addEventListener("resize", () => {{
-      updateActiveGroup();
-    }});
+    window.addEventListener("scroll", onScroll, { passive: true });
+    let resizeTicking = false;
+    window.addEventListener("resize", () => {
+      if (resizeTicking) return;
+      resizeTicking = true;
+      requestAnimationFrame(() => {
+        updateActiveGroup();
+        resizeTicking = false;
+      });
+    }, { passive: true });
 
-    function setCountdownValue(el, value) {{
+    function setCountdownValue(el, value) {
       if (!el) return;
       const v = Math.max(0, value | 0);
       el.style.setProperty("--value", v);
       el.setAttribute("aria-label", String(v));
       el.textContent = String(v);
-    }}
+    }
 
-    function startNextUpdateCountdown() {{
+    function startNextUpdateCountdown() {
       const wrap = document.querySelector("#next-update-countdown");
       if (!wrap) return;
 
@@ -3045,39 +2876,60 @@ def render_report_html(report: Dict[str, Any]) -> str:
       const sEl = document.querySelector("#cd-secs");
       if (!hEl || !mEl || !sEl) return;
 
-      function tick() {{
-        const now = Math.floor(Date.now() / 1000);
-        let remaining = targetEpoch - now;
+      let lastHours = -1;
+      let lastMins = -1;
+      let lastSecs = -1;
+
+      function tick() {
+        const nowMs = Date.now();
+        let remaining = targetEpoch - Math.floor(nowMs / 1000);
 
-        if (remaining <= 0) {{
+        if (remaining <= 0) {
           wrap.innerHTML = "<span>Spreadsheet update is due (scheduled &gt; 6 hrs ago).</span>";
           return;
-        }}
+        }
 
         const hours = Math.floor(remaining / 3600);
         remaining %= 3600;
         const mins = Math.floor(remaining / 60);
         const secs = remaining % 60;
 
-        setCountdownValue(hEl, hours);
-        setCountdownValue(mEl, mins);
-        setCountdownValue(sEl, secs);
-      }}
+        // Only touch the digits that changed since the last tick
+        if (hours !== lastHours) {
+          setCountdownValue(hEl, hours);
+          lastHours = hours;
+        }
+        if (mins !== lastMins) {
+          setCountdownValue(mEl, mins);
+          lastMins = mins;
+        }
+        if (secs !== lastSecs) {
+          setCountdownValue(sEl, secs);
+          lastSecs = secs;
+        }
+
+        // Re-arm on the next wall-clock second so ticks do not drift
+        setTimeout(tick, 1000 - (nowMs % 1000));
+      }
 
       tick();
-      setInterval(tick, 1000);
-    }}
-
-    // Sidebar quick filters (Internal / External / All)
-    document.querySelectorAll("[data-category-preset]").forEach((btn) => {{
-      btn.addEventListener("click", () => {{
-        const v = btn.getAttribute("data-category-preset") || "all";
-        const sel = document.querySelector("#filter-category");
-        if (!sel) return;
-        sel.value = v;
-        sel.dispatchEvent(new Event("change"));
-      }});
-    }});
+    }
+
+    // Sidebar clicks: quick filters (Internal / External / All) and group links
+    const groupNav = document.querySelector("#group-nav");
+    if (groupNav) {
+      groupNav.addEventListener("click", (event) => {
+        const preset = event.target.closest("[data-category-preset]");
+        if (preset) {
+          if (!filterCategory) return;
+          filterCategory.value = preset.getAttribute("data-category-preset") || "all";
+          applyFilters();
+          return;
+        }
+        const link = event.target.closest("[data-group-link]");
+        if (link) setActiveGroup(link.getAttribute("data-group-link"));
+      });
+    }
 
     const calendarGrid = document.querySelector("#calendar-grid");
     const calendarMonthLabel = document.querySelector("#calendar-month-label");
@@ -3096,7 +2948,7 @@ def render_report_html(report: Dict[str, Any]) -> str:
     const calendarSearchToggle = document.querySelector("#calendar-search-toggle");
     const calendarCollapseToggle = document.querySelector("#calendar-collapse-toggle");
     const calendarMonthSelect = document.querySelector("#calendar-month-select");
-    const calendarEventsData = window.CALENDAR_EVENTS || calendarEvents.map((el) => {{
+    const calendarEventsData = window.CALENDAR_EVENTS || calendarEvents.map((el) => {
       const dateIso = el.getAttribute("data-cal-date") || "";
       const groupClass = Array.from(el.classList).find((cls) => cls.startsWith("group-")) || "";
       const groupSlug = groupClass.replace("group-", "");
@@ -3105,32 +2957,33 @@ def render_report_html(report: Dict[str, Any]) -> str:
       const shortLabelEl = el.querySelector(".cal-text");
       const shortLabel = shortLabelEl ? shortLabelEl.textContent.trim() : "";
       const isExternal = el.classList.contains("border-dashed");
-      return {{
+      return {
         date_iso: dateIso,
         group_slug: groupSlug,
         group_label: groupLabel,
         category: isExternal ? "External" : "Internal",
         anchor,
         short_label: shortLabel,
-      }};
-    }});
+      };
+    });
 
-    function formatCalendarHeader(iso) {{
+    function formatCalendarHeader(iso) {
       if (!iso) return "Events";
       const parsed = new Date(iso + "T00:00:00");
       if (Number.isNaN(parsed.getTime())) return "Events";
-      return "Events on " + parsed.toLocaleDateString("en-GB", {{
+      return "Events on " + parsed.toLocaleDateString("en-GB", {
         weekday: "short",
         day: "2-digit",
         month: "short",
-      }});
-    }}
+      });
+    }
+
+    // Zero-padded "01".."31" so building an ISO date is a plain concatenation
+    const PADDED_NUMBERS = Array.from({ length: 32 }, (_, i) => String(i).padStart(2, "0"));
 
-    function buildIsoDate(year, monthIndex, day) {{
-      const m = String(monthIndex + 1).padStart(2, "0");
-      const d = String(day).padStart(2, "0");
-      return `${{year}}-${{m}}-${{d}}`;
-    }}
+    function buildIsoDate(year, monthIndex, day) {
+      return year + "-" + PADDED_NUMBERS[monthIndex + 1] + "-" + PADDED_NUMBERS[day];
+    }
 
     const todayObj = new Date();
     const todayStr = buildIsoDate(todayObj.getFullYear(), todayObj.getMonth(), todayObj.getDate());
@@ -3140,14 +2993,14 @@ def render_report_html(report: Dict[str, Any]) -> str:
     let currentMonth = new Date(todayObj.getFullYear(), todayObj.getMonth(), 1);
     let calendarView = "month";
 
-    let calendarModel = {{
+    let calendarModel = {
       byDate: new Map(),
       issueDates: [],
       eventDates: [],
-    }};
+    };
 
-    function blankDateInfo() {{
-        return {{
+    function blankDateInfo() {
+        return {
           total: 0,
           ok: 0,
           missing: 0,
@@ -3155,171 +3008,219 @@ def render_report_html(report: Dict[str, Any]) -> str:
           extra: 0,
           dateMismatch: 0,
           issues: 0,
-          groups: new Map(),
+          // Issue counts per group label; dates rarely involve more than a few groups
+          groupNames: [],
+          groupCounts: [],
           groupSlugs: new Set(),
           agenda: [],
-        }};
-    }}
+        };
+    }
 
-    function addGroupIssue(info, groupLabel) {{
+    function addGroupIssue(info, groupLabel) {
       if (!groupLabel) return;
-      const prev = info.groups.get(groupLabel) || 0;
-      info.groups.set(groupLabel, prev + 1);
-    }}
+      const idx = info.groupNames.indexOf(groupLabel);
+      if (idx < 0) {
+        info.groupNames.push(groupLabel);
+        info.groupCounts.push(1);
+      } else {
+        info.groupCounts[idx] += 1;
+      }
+    }
 
-    function buildCalendarModel() {{
-      const model = {{
+    function buildCalendarModel() {
+      const model = {
         byDate: new Map(),
         issueDates: [],
         eventDates: [],
-      }};
-      const dateCards = Array.from(document.querySelectorAll(".date-card"));
-      dateCards.forEach((card) => {{
-        const cardMatch = card.getAttribute("data-card-match");
-        const includeSearch = calendarSearchToggle ? calendarSearchToggle.checked : true;
-        if (cardMatch === "0") return;
+      };
+      const includeSearch = calendarSearchToggle ? calendarSearchToggle.checked : true;
+      allDateCards.forEach((card) => {
+        if (card._cardMatch === false) return;
         if (includeSearch && card.classList.contains("is-hidden")) return;
-        const dateIso = card.getAttribute("data-date") || "";
+        const meta = card._meta;
+        const dateIso = meta.date;
         if (!dateIso) return;
-        const groupLabel = card.getAttribute("data-group-label") || card.getAttribute("data-group") || "Group";
-        const groupSlug = card.getAttribute("data-group-slug") || card.getAttribute("data-group") || "";
-        const groupUrl = card.getAttribute("data-group-url") || "";
-        const category = card.getAttribute("data-category") || "";
-        const anchor = card.getAttribute("id") || "";
-        const titleEl = card.querySelector(".text-sm.font-medium");
-        const cardTitle = titleEl ? titleEl.textContent.trim() : "Agenda item";
-        const rows = Array.from(card.querySelectorAll("tbody tr"));
-
-        rows.forEach((row) => {{
-          const baseMatch = row.getAttribute("data-match-base");
-          const searchMatch = row.getAttribute("data-match-search");
-          const matchesBase = baseMatch !== "0";
-          const matchesSearch = searchMatch !== "0";
-          const includeSearch = calendarSearchToggle ? calendarSearchToggle.checked : true;
+        const { groupLabel, groupSlug } = meta;
+        card._rows.forEach((row) => {
+          const matchesBase = row._matchBase !== false;
+          const matchesSearch = row._matchSearch !== false;
           if (!matchesBase) return;
           if (includeSearch && !matchesSearch) return;
-          const status = row.getAttribute("data-status") || "";
-          const cells = row.querySelectorAll("td");
-          const expected = cells[1] ? cells[1].textContent.trim() : "";
-          const found = cells[2] ? cells[2].textContent.trim() : "";
-          const note = cells[3] ? cells[3].textContent.trim() : "";
-          const title = expected || found || cardTitle;
+          const status = row._status;
 
           let info = model.byDate.get(dateIso);
-          if (!info) {{
+          if (!info) {
             info = blankDateInfo();
             model.byDate.set(dateIso, info);
-          }}
-          if (groupSlug) {{
+          }
+          if (groupSlug) {
             info.groupSlugs.add(groupSlug);
-          }}
+          }
 
           info.total += 1;
-          if (status === "ok") {{
+          if (status === "ok") {
             info.ok += 1;
-          }} else if (status === "bad") {{
+          } else if (status === "bad") {
             info.missing += 1;
             addGroupIssue(info, groupLabel);
-          }} else if (status === "warn") {{
+          } else if (status === "warn") {
             info.check += 1;
             addGroupIssue(info, groupLabel);
-          }} else if (status === "date_mismatch") {{
+          } else if (status === "date_mismatch") {
             info.check += 1;
             info.dateMismatch += 1;
             addGroupIssue(info, groupLabel);
-          }} else if (status === "extra") {{
+          } else if (status === "extra") {
             info.extra += 1;
-          }}
+          }
 
-          info.agenda.push({{
-            date: dateIso,
-            status,
-            title,
-            groupLabel,
-            groupSlug,
-            groupUrl,
-            category,
-            anchor,
-            note,
-          }});
-        }});
-      }});
-
-      model.byDate.forEach((info, dateIso) => {{
+          info.agenda.push(row._agendaItem);
+        });
+      });
+
+      model.byDate.forEach((info, dateIso) => {
         info.issues = info.missing + info.check;
         if (info.total > 0) model.eventDates.push(dateIso);
         if (info.issues > 0) model.issueDates.push(dateIso);
-      }});
+      });
 
       model.eventDates.sort();
       model.issueDates.sort();
       return model;
-    }}
+    }
 
-    function getHeatClass(issues) {{
+    function getHeatClass(issues) {
       if (issues <= 0) return "heat-0";
       if (issues === 1) return "heat-1";
       if (issues <= 3) return "heat-2";
       if (issues <= 6) return "heat-3";
       return "heat-4";
-    }}
+    }
 
-    function formatTooltip(info) {{
+    function formatTooltip(info) {
       if (!info) return "";
-      const topGroups = Array.from(info.groups.entries())
+      const topGroups = info.groupNames
+        .map((name, idx) => [name, info.groupCounts[idx]])
         .sort((a, b) => b[1] - a[1])
         .slice(0, 2)
-        .map(([name, count]) => `${{name}} (${{count}})`);
-      const summary = `OK ${{info.ok}} / Missing ${{info.missing}} / Check ${{info.check}} / Extra ${{info.extra}}`;
+        .map(([name, count]) => `${name} (${count})`);
+      const summary = `OK ${info.ok} / Missing ${info.missing} / Check ${info.check} / Extra ${info.extra}`;
       if (!topGroups.length) return summary;
-      return `${{summary}} · Top: ${{topGroups.join(", ")}}`;
-    }}
+      return `${summary} · Top: ${topGroups.join(", ")}`;
+    }
 
-    function rebuildCalendarModel() {{
+    // Everything the calendar model depends on. The search only counts when the
+    // calendar follows it, so search-only changes skip the rebuild otherwise.
+    let calendarModelKey = "";
+    function currentCalendarModelKey() {
+      const includeSearch = calendarSearchToggle ? calendarSearchToggle.checked : true;
+      return [
+        filterGroup ? filterGroup.value : "all",
+        filterCategory ? filterCategory.value : "all",
+        getActionableState() ? "1" : "0",
+        selectedStatusMask(),
+        includeSearch ? "q:" + rowSearchValue : "",
+      ].join("|");
+    }
+
+    function rebuildCalendarModel() {
+      const key = currentCalendarModelKey();
+      if (key === calendarModelKey) return;
+      calendarModelKey = key;
       calendarModel = buildCalendarModel();
-      populateMonthSelect();
       const hasVisibleSelection = Array.from(selectedDates).some((d) => calendarModel.byDate.has(d));
-      if (!hasVisibleSelection) {{
+      if (!hasVisibleSelection) {
         applyDefaultSelection();
         return;
-      }}
+      }
       updateCalendarEvents(focusDate);
       renderCalendar();
       renderAgenda();
-      updateUrlState();
-    }}
+      scheduleUrlState();
+    }
 
-    function renderCalendar() {{
-      if (!calendarGrid) return;
-      calendarGrid.innerHTML = "";
+    // Header and padding cells never change, so the same nodes are re-attached
+    // on every render (at most four padding cells either side of the month)
+    const weekdayHeaders = ["M", "T", "W", "T", "F"];
+    const weekdayHeaderCells = weekdayHeaders.map((label) => {
+      const cell = document.createElement("div");
+      cell.className = "cal-header";
+      cell.textContent = label;
+      return cell;
+    });
+    const emptyCellPool = Array.from({ length: 8 }, () => {
+      const empty = document.createElement("div");
+      empty.className = "cal-cell empty";
+      return empty;
+    });
+
+    // Day cells are created on first use and reused by every later render
+    const dayCellPool = [];
+    function dayCellSlot(idx) {
+      if (idx < dayCellPool.length) return dayCellPool[idx];
+      const cell = document.createElement("button");
+      cell.type = "button";
+      const dayNum = document.createElement("span");
+      dayNum.className = "day-num";
+      const dotsRow = document.createElement("div");
+      dotsRow.className = "cal-dots-row";
+      const tooltip = document.createElement("div");
+      tooltip.className = "calendar-tooltip";
+      const slot = { cell, dayNum, dotsRow, tooltip };
+      dayCellPool.push(slot);
+      return slot;
+    }
+
+    // One listener for every day cell; each cell carries its date in data-date
+    if (calendarGrid) {
+      calendarGrid.addEventListener("click", (event) => {
+        const cell = event.target.closest(".cal-cell");
+        if (!cell || cell.classList.contains("empty")) return;
+        const dateIso = cell.getAttribute("data-date");
+        if (dateIso) handleDateClick(event, dateIso);
+      });
+    }
+
+    // Navigation that can repeat quickly (held arrow keys, month stepping) renders
+    // at most once per frame; a direct render cancels any pending one
+    let calendarRenderFrame = 0;
+    function scheduleCalendarRender() {
+      if (calendarRenderFrame) return;
+      calendarRenderFrame = requestAnimationFrame(() => {
+        calendarRenderFrame = 0;
+        renderCalendar();
+      });
+    }
 
-      const weekdayHeaders = ["M", "T", "W", "T", "F"];
-      weekdayHeaders.forEach((label) => {{
-        const cell = document.createElement("div");
-        cell.className = "cal-header";
-        cell.textContent = label;
-        calendarGrid.appendChild(cell);
-      }});
+    function renderCalendar() {
+      if (calendarRenderFrame) {
+        cancelAnimationFrame(calendarRenderFrame);
+        calendarRenderFrame = 0;
+      }
+      if (!calendarGrid) return;
+      const frag = document.createDocumentFragment();
+      frag.append(...weekdayHeaderCells);
 
-      const monthYearLabel = currentMonth.toLocaleDateString("en-GB", {{
+      const monthYearLabel = currentMonth.toLocaleDateString("en-GB", {
         month: "long",
         year: "numeric",
-      }});
-      if (calendarMonthLabel) {{
-        if (calendarView === "week") {{
-          const focusObj = new Date((focusDate || todayStr) + "T00:00:00");
-          const weekLabel = Number.isNaN(focusObj.getTime())
+      });
+      if (calendarMonthLabel) {
+        if (calendarView === "week") {
+          const focusObj = parseIsoToDate(focusDate || todayStr);
+          const weekLabel = !focusObj
             ? monthYearLabel
-            : focusObj.toLocaleDateString("en-GB", {{ day: "2-digit", month: "short", year: "numeric" }});
-          calendarMonthLabel.textContent = `Week of ${{weekLabel}}`;
-        }} else {{
+            : focusObj.toLocaleDateString("en-GB", { day: "2-digit", month: "short", year: "numeric" });
+          calendarMonthLabel.textContent = `Week of ${weekLabel}`;
+        } else {
           calendarMonthLabel.textContent = monthYearLabel;
-        }}
-      }}
+        }
+      }
 
-      if (calendarMonthSelect) {{
+      if (calendarMonthSelect) {
+        populateMonthSelect();
         calendarMonthSelect.disabled = calendarView !== "month";
-      }}
+      }
 
       const year = currentMonth.getFullYear();
       const month = currentMonth.getMonth();
@@ -3327,154 +3228,256 @@ def render_report_html(report: Dict[str, Any]) -> str:
       let leadingEmpty = 0;
       let trailingEmpty = 0;
 
-      if (calendarView === "week") {{
-        let base = new Date((focusDate || todayStr) + "T00:00:00");
-        if (Number.isNaN(base.getTime())) base = new Date();
-        const start = new Date(base);
+      if (calendarView === "week") {
+        const start = new Date(parseIsoToDate(focusDate || todayStr) || Date.now());
         const offset = (start.getDay() + 6) % 7;
         start.setDate(start.getDate() - offset);
-        for (let i = 0; i < 5; i += 1) {{
+        for (let i = 0; i < 5; i += 1) {
           renderDates.push(new Date(start.getFullYear(), start.getMonth(), start.getDate() + i));
-        }}
-      }} else {{
+        }
+      } else {
         const firstDay = new Date(year, month, 1);
         let firstWeekday = new Date(firstDay);
-        while (isWeekend(firstWeekday)) {{
+        while (isWeekend(firstWeekday)) {
           firstWeekday.setDate(firstWeekday.getDate() + 1);
-        }}
+        }
         const weekdayIndex = (firstWeekday.getDay() + 6) % 7; // Monday-first
         leadingEmpty = Math.min(weekdayIndex, 4);
         const daysInMonth = new Date(year, month + 1, 0).getDate();
-        for (let day = 1; day <= daysInMonth; day += 1) {{
+        for (let day = 1; day <= daysInMonth; day += 1) {
           const dateObj = new Date(year, month, day);
-          if (!isWeekend(dateObj)) {{
+          if (!isWeekend(dateObj)) {
             renderDates.push(dateObj);
-          }}
-        }}
+          }
+        }
         const totalCells = leadingEmpty + renderDates.length;
         trailingEmpty = (5 - (totalCells % 5)) % 5;
-      }}
+      }
 
-      for (let i = 0; i < leadingEmpty; i += 1) {{
-        const empty = document.createElement("div");
-        empty.className = "cal-cell empty";
-        calendarGrid.appendChild(empty);
-      }}
+      let emptyUsed = 0;
+      for (let i = 0; i < leadingEmpty; i += 1) {
+        frag.appendChild(emptyCellPool[emptyUsed]);
+        emptyUsed += 1;
+      }
 
-      renderDates.forEach((dateObj) => {{
+      renderDates.forEach((dateObj, idx) => {
         const dateIso = buildIsoDate(dateObj.getFullYear(), dateObj.getMonth(), dateObj.getDate());
-        const cell = document.createElement("button");
-        cell.type = "button";
+        const slot = dayCellSlot(idx);
+        const cell = slot.cell;
         cell.className = "cal-cell day";
         if (dateIso === todayStr) cell.classList.add("is-today");
         if (selectedDates.has(dateIso)) cell.classList.add("is-selected");
         if (dateIso === focusDate) cell.classList.add("is-focused");
         cell.setAttribute("data-date", dateIso);
-
-        const dayNum = document.createElement("span");
-        dayNum.className = "day-num";
-        dayNum.textContent = String(dateObj.getDate());
-        cell.appendChild(dayNum);
+        slot.dayNum.textContent = String(dateObj.getDate());
 
         const info = calendarModel.byDate.get(dateIso);
-        if (info && info.total > 0) {{
+        if (info && info.total > 0) {
           cell.classList.add(getHeatClass(info.issues));
-          const dotsRow = document.createElement("div");
-          dotsRow.className = "cal-dots-row";
-          if (info.groupSlugs && info.groupSlugs.size) {{
-            Array.from(info.groupSlugs).forEach((slug) => {{
+          const dots = [];
+          if (info.groupSlugs && info.groupSlugs.size) {
+            info.groupSlugs.forEach((slug) => {
               const dot = document.createElement("span");
-              dot.className = `cal-grid-dot group-${{slug}}`;
-              dotsRow.appendChild(dot);
-            }});
-          }}
-          cell.appendChild(dotsRow);
-
-          const tooltip = document.createElement("div");
-          tooltip.className = "calendar-tooltip";
-          tooltip.textContent = formatTooltip(info);
-          cell.appendChild(tooltip);
-        }} else {{
+              dot.className = `cal-grid-dot group-${slug}`;
+              dots.push(dot);
+            });
+          }
+          slot.dotsRow.replaceChildren(...dots);
+          slot.tooltip.textContent = formatTooltip(info);
+          cell.replaceChildren(slot.dayNum, slot.dotsRow, slot.tooltip);
+        } else {
           cell.classList.add("heat-0");
-        }}
+          cell.replaceChildren(slot.dayNum);
+        }
 
-        if (calendarIssuesOnly && calendarIssuesOnly.checked && (!info || info.issues === 0)) {{
+        if (calendarIssuesOnly && calendarIssuesOnly.checked && (!info || info.issues === 0)) {
           cell.classList.add("issues-hidden");
-        }}
-
-        cell.addEventListener("click", (event) => {{
-          handleDateClick(event, dateIso);
-        }});
-        calendarGrid.appendChild(cell);
-      }});
-
-      for (let i = 0; i < trailingEmpty; i += 1) {{
-        const empty = document.createElement("div");
-        empty.className = "cal-cell empty";
-        calendarGrid.appendChild(empty);
-      }}
-    }}
-
-    function parseIsoToDate(iso) {{
+        }
+
+        frag.appendChild(cell);
+      });
+
+      for (let i = 0; i < trailingEmpty; i += 1) {
+        frag.appendChild(emptyCellPool[emptyUsed]);
+        emptyUsed += 1;
+      }
+      calendarGrid.replaceChildren(frag);
+    }
+
+    // Parsed dates are cached and shared, so callers must copy before mutating
+    const ISO_DATE_CACHE_MAX = 4096;
+    const isoDateCache = new Map();
+    function parseIsoToDate(iso) {
       if (!iso) return null;
-      const parsed = new Date(iso + "T00:00:00");
-      if (Number.isNaN(parsed.getTime())) return null;
+      if (isoDateCache.has(iso)) return isoDateCache.get(iso);
+      let parsed = new Date(iso + "T00:00:00");
+      if (Number.isNaN(parsed.getTime())) parsed = null;
+      if (isoDateCache.size >= ISO_DATE_CACHE_MAX) {
+        isoDateCache.delete(isoDateCache.keys().next().value);
+      }
+      isoDateCache.set(iso, parsed);
       return parsed;
-    }}
+    }
 
-    function isWeekend(dateObj) {{
+    function isWeekend(dateObj) {
       const day = dateObj.getDay();
       return day === 0 || day === 6;
-    }}
+    }
 
-    function skipWeekend(dateObj, step) {{
+    function skipWeekend(dateObj, step) {
       const cursor = new Date(dateObj);
       const direction = step >= 0 ? 1 : -1;
-      while (isWeekend(cursor)) {{
+      while (isWeekend(cursor)) {
         cursor.setDate(cursor.getDate() + direction);
-      }}
+      }
       return cursor;
-    }}
+    }
+
+    const MONTH_LENGTHS = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
+    function daysInMonth(year, monthIndex) {
+      if (monthIndex === 1 && ((year % 4 === 0 && year % 100 !== 0) || year % 400 === 0)) return 29;
+      return MONTH_LENGTHS[monthIndex];
+    }
 
-    function buildDateRange(startIso, endIso) {{
+    // Walks the range as a (year, month, day, weekday) counter rather than
+    // stepping a Date, so long shift-click ranges create no intermediate Dates
+    function buildDateRange(startIso, endIso) {
       const start = parseIsoToDate(startIso);
       const end = parseIsoToDate(endIso);
       if (!start || !end) return [];
       const dates = [];
-      const step = start <= end ? 1 : -1;
-      const cursor = new Date(start);
-      while ((step > 0 && cursor <= end) || (step < 0 && cursor >= end)) {{
-        if (!isWeekend(cursor)) {{
-          dates.push(buildIsoDate(cursor.getFullYear(), cursor.getMonth(), cursor.getDate()));
-        }}
-        cursor.setDate(cursor.getDate() + step);
-      }}
+      const span = Math.round((end - start) / 86400000);
+      const step = span >= 0 ? 1 : -1;
+      let year = start.getFullYear();
+      let month = start.getMonth();
+      let day = start.getDate();
+      let weekday = start.getDay();
+      for (let i = Math.abs(span); i >= 0; i -= 1) {
+        if (weekday !== 0 && weekday !== 6) {
+          dates.push(buildIsoDate(year, month, day));
+        }
+        if (step > 0) {
+          day += 1;
+          if (day > daysInMonth(year, month)) {
+            day = 1;
+            month += 1;
+            if (month > 11) {
+              month = 0;
+              year += 1;
+            }
+          }
+        } else {
+          day -= 1;
+          if (day < 1) {
+            month -= 1;
+            if (month < 0) {
+              month = 11;
+              year -= 1;
+            }
+            day = daysInMonth(year, month);
+          }
+        }
+        weekday = (weekday + step + 7) % 7;
+      }
       return dates;
-    }}
+    }
 
-    function updateCalendarEvents(dateIso) {{
+    function updateCalendarEvents(dateIso) {
       let visibleCount = 0;
-      calendarEvents.forEach((eventEl) => {{
+      calendarEvents.forEach((eventEl) => {
         const eventDate = eventEl.getAttribute("data-cal-date") || "";
         const show = (eventDate === dateIso);
         eventEl.classList.toggle("is-hidden", !show);
         if (show) visibleCount += 1;
-      }});
+      });
 
       if (calendarTitle) calendarTitle.textContent = formatCalendarHeader(dateIso);
-      if (calendarEmpty) {{
-        if (visibleCount === 0) {{
+      if (calendarEmpty) {
+        if (visibleCount === 0) {
           calendarEmpty.textContent = "No events on this date.";
           calendarEmpty.classList.add("is-visible");
-        }} else {{
+        } else {
           calendarEmpty.classList.remove("is-visible");
-        }}
-      }}
-    }}
+        }
+      }
+    }
+
+    // Long multi-date agendas are rendered a page at a time; the rest stay as data
+    // until "Show more" is pressed, so the DOM only holds what has been shown
+    const AGENDA_PAGE_SIZE = 50;
+    let agendaItems = [];
+    let agendaShown = 0;
+    const agendaMoreButton = document.createElement("button");
+    agendaMoreButton.type = "button";
+    agendaMoreButton.className = "btn btn-xs btn-ghost";
+    agendaMoreButton.addEventListener("click", () => {
+      renderAgendaPage();
+    });
+
+    function buildAgendaEntry(item) {
+      const statusLabel = item.status === "bad"
+        ? "Missing"
+        : (item.status === "warn" || item.status === "date_mismatch")
+          ? "Check"
+          : (item.status === "extra" ? "Extra" : "OK");
+
+      const entry = document.createElement("div");
+      entry.className = "agenda-item";
+
+      const main = document.createElement("div");
+      const titleEl = document.createElement("div");
+      titleEl.className = "agenda-title";
+      titleEl.textContent = item.title || "Agenda item";
+      const metaEl = document.createElement("div");
+      metaEl.className = "agenda-meta";
+      metaEl.textContent = `${item.groupLabel || "Group"} · ${statusLabel} · ${item.date}`;
+      main.appendChild(titleEl);
+      main.appendChild(metaEl);
+
+      const actions = document.createElement("div");
+      actions.className = "agenda-actions";
+
+      const openLink = document.createElement("a");
+      openLink.className = "btn btn-xs btn-ghost";
+      openLink.textContent = "Open";
+      openLink.href = item.anchor ? `#${item.anchor}` : "#";
+      actions.appendChild(openLink);
+
+      if (item.groupUrl) {
+        const sourceLink = document.createElement("a");
+        sourceLink.className = "btn btn-xs btn-ghost";
+        sourceLink.textContent = "Source";
+        sourceLink.href = item.groupUrl;
+        sourceLink.target = "_blank";
+        actions.appendChild(sourceLink);
+      }
+
+      entry.appendChild(main);
+      entry.appendChild(actions);
+      return entry;
+    }
+
+    function renderAgendaPage() {
+      const frag = document.createDocumentFragment();
+      const end = Math.min(agendaItems.length, agendaShown + AGENDA_PAGE_SIZE);
+      for (let i = agendaShown; i < end; i += 1) {
+        frag.appendChild(buildAgendaEntry(agendaItems[i]));
+      }
+      agendaShown = end;
+
+      const remaining = agendaItems.length - agendaShown;
+      if (remaining > 0) {
+        agendaMoreButton.textContent = `Show more (${remaining} left)`;
+        frag.appendChild(agendaMoreButton);
+      } else {
+        agendaMoreButton.remove();
+      }
+      calendarAgendaList.appendChild(frag);
+    }
 
-    function renderAgenda() {{
+    function renderAgenda() {
       if (!calendarAgendaList) return;
-      calendarAgendaList.innerHTML = "";
+      calendarAgendaList.replaceChildren();
 
       const sortedDates = Array.from(selectedDates).sort();
       let total = 0;
@@ -3484,7 +3487,7 @@ def render_report_html(report: Dict[str, Any]) -> str:
       let ok = 0;
       const items = [];
 
-      sortedDates.forEach((dateIso) => {{
+      sortedDates.forEach((dateIso) => {
         const info = calendarModel.byDate.get(dateIso);
         if (!info) return;
         total += info.total;
@@ -3493,111 +3496,73 @@ def render_report_html(report: Dict[str, Any]) -> str:
         extra += info.extra;
         ok += info.ok;
         info.agenda.forEach((item) => items.push(item));
-      }});
+      });
 
-      if (calendarAgendaSummary) {{
-        if (total > 0) {{
-          calendarAgendaSummary.textContent = `${{total}} items · Missing ${{missing}} · Check ${{check}} · Extra ${{extra}} · OK ${{ok}}`;
-        }} else {{
+      if (calendarAgendaSummary) {
+        if (total > 0) {
+          calendarAgendaSummary.textContent = `${total} items · Missing ${missing} · Check ${check} · Extra ${extra} · OK ${ok}`;
+        } else {
           calendarAgendaSummary.textContent = "";
-        }}
-      }}
+        }
+      }
 
-      if (calendarAgendaEmpty) {{
+      if (calendarAgendaEmpty) {
         calendarAgendaEmpty.classList.toggle("is-visible", items.length === 0);
-      }}
-
-      items.sort((a, b) => a.date.localeCompare(b.date));
-      items.forEach((item) => {{
-        const statusLabel = item.status === "bad"
-          ? "Missing"
-          : (item.status === "warn" || item.status === "date_mismatch")
-            ? "Check"
-            : (item.status === "extra" ? "Extra" : "OK");
-
-        const entry = document.createElement("div");
-        entry.className = "agenda-item";
-
-        const main = document.createElement("div");
-        const titleEl = document.createElement("div");
-        titleEl.className = "agenda-title";
-        titleEl.textContent = item.title || "Agenda item";
-        const metaEl = document.createElement("div");
-        metaEl.className = "agenda-meta";
-        metaEl.textContent = `${{item.groupLabel || "Group"}} · ${{statusLabel}} · ${{item.date}}`;
-        main.appendChild(titleEl);
-        main.appendChild(metaEl);
-
-        const actions = document.createElement("div");
-        actions.className = "agenda-actions";
-
-        const openLink = document.createElement("a");
-        openLink.className = "btn btn-xs btn-ghost";
-        openLink.textContent = "Open";
-        openLink.href = item.anchor ? `#${{item.anchor}}` : "#";
-        actions.appendChild(openLink);
-
-        if (item.groupUrl) {{
-          const sourceLink = document.createElement("a");
-          sourceLink.className = "btn btn-xs btn-ghost";
-          sourceLink.textContent = "Source";
-          sourceLink.href = item.groupUrl;
-          sourceLink.target = "_blank";
-          actions.appendChild(sourceLink);
-        }}
-
-        entry.appendChild(main);
-        entry.appendChild(actions);
-        calendarAgendaList.appendChild(entry);
-      }});
-    }}
-
-    function setSelection(datesLike, newFocus) {{
+      }
+
+      // Items were gathered date by date from the sorted selection, so they are
+      // already in date order
+      agendaItems = items;
+      agendaShown = 0;
+      renderAgendaPage();
+    }
+
+    function setSelection(datesLike, newFocus) {
       const nextDates = Array.isArray(datesLike) ? datesLike : Array.from(datesLike || []);
       selectedDates = new Set(nextDates);
-      if (newFocus) {{
+      if (newFocus) {
         focusDate = newFocus;
-      }} else if (nextDates.length) {{
+      } else if (nextDates.length) {
         focusDate = nextDates[nextDates.length - 1];
-      }}
+      }
 
       const focusObj = parseIsoToDate(focusDate);
-      if (focusObj) {{
+      if (focusObj) {
         currentMonth = new Date(focusObj.getFullYear(), focusObj.getMonth(), 1);
-      }}
+      }
 
       updateCalendarEvents(focusDate);
       renderCalendar();
       renderAgenda();
-    }}
+    }
 
-    function handleDateClick(event, dateIso) {{
+    function handleDateClick(event, dateIso) {
       if (!dateIso) return;
-      if (event.shiftKey && focusDate) {{
+      if (event.shiftKey && focusDate) {
         const range = buildDateRange(focusDate, dateIso);
         setSelection(range, dateIso);
-      }} else if (event.ctrlKey || event.metaKey) {{
+      } else if (event.ctrlKey || event.metaKey) {
         const next = new Set(selectedDates);
-        if (next.has(dateIso)) {{
+        if (next.has(dateIso)) {
           next.delete(dateIso);
-        }} else {{
+        } else {
           next.add(dateIso);
-        }}
+        }
         setSelection(next, dateIso);
-      }} else {{
+      } else {
         setSelection([dateIso], dateIso);
-      }}
-    }}
+      }
+    }
 
-    function scrollToDate(dateIso) {{
+    function scrollToDate(dateIso) {
       if (!dateIso) return;
-      const target = document.querySelector(`.date-card[data-date="${{dateIso}}"]:not(.is-hidden)`);
-      if (target) {{
-        target.scrollIntoView({{ behavior: "smooth", block: "start" }});
-      }}
-    }}
+      const target = document.querySelector(`.date-card[data-date="${dateIso}"]:not(.is-hidden)`);
+      if (target) {
+        target.scrollIntoView({ behavior: "smooth", block: "start" });
+      }
+    }
 
-    function jumpToNextIssue() {{
+    function jumpToNextIssue() {
       const list = calendarModel.issueDates;
       if (!list.length) return;
       const base = focusDate || todayStr;
@@ -3605,98 +3570,114 @@ def render_report_html(report: Dict[str, Any]) -> str:
       if (!next) next = list[0];
       setSelection([next], next);
       scrollToDate(next);
-    }}
+    }
 
-    function jumpToToday() {{
+    function jumpToToday() {
       setSelection([todayStr], todayStr);
       scrollToDate(todayStr);
-    }}
+    }
 
-    function populateMonthSelect() {{
+    // Synced on every calendar render; the options are only rebuilt when the year changes
+    let monthSelectYear = null;
+    function populateMonthSelect() {
       if (!calendarMonthSelect) return;
-      const monthNames = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
       const year = currentMonth.getFullYear();
-      calendarMonthSelect.innerHTML = "";
-      monthNames.forEach((label, idx) => {{
+      if (year === monthSelectYear) {
+        calendarMonthSelect.value = String(currentMonth.getMonth());
+        return;
+      }
+      monthSelectYear = year;
+      const monthNames = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
+      const frag = document.createDocumentFragment();
+      monthNames.forEach((label, idx) => {
         const option = document.createElement("option");
         option.value = String(idx);
-        option.textContent = `${{label}} ${{year}}`;
-        if (idx === currentMonth.getMonth()) {{
+        option.textContent = `${label} ${year}`;
+        if (idx === currentMonth.getMonth()) {
           option.selected = true;
-        }}
-        calendarMonthSelect.appendChild(option);
-      }});
-    }}
+        }
+        frag.appendChild(option);
+      });
+      calendarMonthSelect.replaceChildren(frag);
+    }
 
-    function applyDefaultSelection() {{
+    function applyDefaultSelection() {
       const calendarCardEl = document.querySelector("#calendar-card");
       const reportIso = calendarCardEl ? (calendarCardEl.getAttribute("data-report-date") || "") : "";
       const baseIso = reportIso || todayStr;
-      if (calendarModel.eventDates.length) {{
+      if (calendarModel.eventDates.length) {
         const upcoming = calendarModel.eventDates.find((d) => d >= baseIso);
         const fallback = upcoming || calendarModel.eventDates[calendarModel.eventDates.length - 1];
         setSelection([fallback], fallback);
         return;
-      }}
+      }
       setSelection([baseIso], baseIso);
-    }}
+    }
 
-    function setFocusDate(dateIso) {{
+    function setFocusDate(dateIso) {
       if (!dateIso) return;
       focusDate = dateIso;
       const focusObj = parseIsoToDate(focusDate);
-      if (focusObj) {{
+      if (focusObj) {
         currentMonth = new Date(focusObj.getFullYear(), focusObj.getMonth(), 1);
-      }}
-      renderCalendar();
-    }}
+      }
+      scheduleCalendarRender();
+    }
 
-    function moveFocusBy(days) {{
-      const base = parseIsoToDate(focusDate || todayStr) || new Date();
+    function moveFocusBy(days) {
+      const base = new Date(parseIsoToDate(focusDate || todayStr) || Date.now());
       base.setDate(base.getDate() + days);
       const adjusted = skipWeekend(base, days);
       const next = buildIsoDate(adjusted.getFullYear(), adjusted.getMonth(), adjusted.getDate());
       setFocusDate(next);
-    }}
+    }
 
-    function updateViewToggleLabel() {{
+    function updateViewToggleLabel() {
       if (!calendarViewToggle) return;
       calendarViewToggle.textContent = calendarView === "month" ? "Month" : "Week";
-    }}
+    }
+
+    // Filter passes write the URL through a short trailing timer so bursts of
+    // changes produce one history.replaceState
+    let urlStateTimer = 0;
+    function scheduleUrlState() {
+      clearTimeout(urlStateTimer);
+      urlStateTimer = setTimeout(updateUrlState, 250);
+    }
 
     // URL params: date=YYYY-MM-DD&group=...&status=...&category=...&q=...
-    function updateUrlState() {{
+    function updateUrlState() {
       const params = new URLSearchParams();
       if (focusDate) params.set("date", focusDate);
-      if (selectedDates.size > 1) {{
+      if (selectedDates.size > 1) {
         params.set("dates", Array.from(selectedDates).sort().join(","));
-      }}
-      if (filterGroup && filterGroup.value && filterGroup.value !== "all") {{
+      }
+      if (filterGroup && filterGroup.value && filterGroup.value !== "all") {
         params.set("group", filterGroup.value);
-      }}
-      if (filterCategory && filterCategory.value && filterCategory.value !== "all") {{
+      }
+      if (filterCategory && filterCategory.value && filterCategory.value !== "all") {
         params.set("category", filterCategory.value);
-      }}
-      if (filterSearch && filterSearch.value.trim()) {{
+      }
+      if (filterSearch && filterSearch.value.trim()) {
         params.set("q", filterSearch.value.trim());
-      }}
-      if (statusInputs.length) {{
+      }
+      if (statusInputs.length) {
         const statuses = statusInputs.filter((input) => input.checked).map((input) => input.value);
-        if (statuses.length && statuses.length !== statusInputs.length) {{
+        if (statuses.length && statuses.length !== statusInputs.length) {
           params.set("status", statuses.join(","));
-        }}
-      }}
+        }
+      }
       if (getActionableState()) params.set("actionable", "1");
       if (calendarView !== "month") params.set("view", calendarView);
       if (calendarIssuesOnly && calendarIssuesOnly.checked) params.set("issuesOnly", "1");
       if (calendarSearchToggle && calendarSearchToggle.checked) params.set("searchCal", "1");
 
       const qs = params.toString();
-      const nextUrl = qs ? `${{window.location.pathname}}?${{qs}}` : window.location.pathname;
+      const nextUrl = qs ? `${window.location.pathname}?${qs}` : window.location.pathname;
       history.replaceState(null, "", nextUrl);
-    }}
+    }
 
-    function applyUrlState() {{
+    function applyUrlState() {
       const params = new URLSearchParams(window.location.search);
       const group = params.get("group");
       const category = params.get("category");
@@ -3713,166 +3694,775 @@ def render_report_html(report: Dict[str, Any]) -> str:
       if (filterCategory && category) filterCategory.value = category;
       if (filterSearch && q !== null) filterSearch.value = q;
 
-      if (status) {{
+      if (status) {
         const allowed = new Set(status.split(",").map((s) => s.trim()).filter(Boolean));
-        statusInputs.forEach((input) => {{
+        statusInputs.forEach((input) => {
           input.checked = allowed.has(input.value);
-        }});
-      }}
+        });
+      }
 
-      if (actionable === "1") {{
+      if (actionable === "1") {
         if (actionableToggle) actionableToggle.checked = true;
         if (actionableToggleMobile) actionableToggleMobile.checked = true;
-      }}
+      }
 
-      if (view === "week" || view === "month") {{
+      if (view === "week" || view === "month") {
         calendarView = view;
         updateViewToggleLabel();
-      }}
+      }
 
-      if (calendarIssuesOnly && issuesOnly === "1") {{
+      if (calendarIssuesOnly && issuesOnly === "1") {
         calendarIssuesOnly.checked = true;
-      }}
+      }
 
-      if (calendarSearchToggle && searchCal === "1") {{
+      if (calendarSearchToggle && searchCal === "1") {
         calendarSearchToggle.checked = true;
-      }}
+      }
 
       let nextDates = [];
-      if (dates) {{
+      if (dates) {
         nextDates = dates.split(",").map((d) => d.trim()).filter(Boolean);
-      }} else if (date) {{
+      } else if (date) {
         nextDates = [date];
-      }}
-      if (nextDates.length) {{
+      }
+      if (nextDates.length) {
         selectedDates = new Set(nextDates);
         focusDate = nextDates[nextDates.length - 1];
         const focusObj = parseIsoToDate(focusDate);
-        if (focusObj) {{
+        if (focusObj) {
           currentMonth = new Date(focusObj.getFullYear(), focusObj.getMonth(), 1);
-        }}
-      }}
-    }}
+        }
+      }
+    }
 
-    window.filterDate = function(isoDate) {{
+    window.filterDate = function(isoDate) {
       if (!isoDate) return;
       setSelection([isoDate], isoDate);
-    }};
+    };
+
+    if (calendarPrev) {
+      calendarPrev.addEventListener("click", () => {
+        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() - 1, 1);
+        scheduleCalendarRender();
+      });
+    }
+    if (calendarNext) {
+      calendarNext.addEventListener("click", () => {
+        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() + 1, 1);
+        scheduleCalendarRender();
+      });
+    }
+
+    if (calendarMonthSelect) {
+      calendarMonthSelect.addEventListener("change", () => {
+        const nextMonth = parseInt(calendarMonthSelect.value, 10);
+        if (Number.isFinite(nextMonth)) {
+          currentMonth = new Date(currentMonth.getFullYear(), nextMonth, 1);
+          scheduleCalendarRender();
+        }
+      });
+    }
+
+    if (calendarViewToggle) {
+      calendarViewToggle.addEventListener("click", () => {
+        calendarView = calendarView === "month" ? "week" : "month";
+        updateViewToggleLabel();
+        renderCalendar();
+        scheduleUrlState();
+      });
+      updateViewToggleLabel();
+    }
+
+    if (calendarIssuesOnly) {
+      calendarIssuesOnly.addEventListener("change", () => {
+        scheduleCalendarRender();
+        scheduleUrlState();
+      });
+    }
+
+    if (calendarSearchToggle) {
+      calendarSearchToggle.addEventListener("change", () => {
+        rebuildCalendarModel();
+        scheduleUrlState();
+      });
+    }
+
+    if (calendarJumpToday) {
+      calendarJumpToday.addEventListener("click", () => {
+        jumpToToday();
+      });
+    }
+
+    if (calendarJumpIssue) {
+      calendarJumpIssue.addEventListener("click", () => {
+        jumpToNextIssue();
+      });
+    }
+
+    if (calendarCollapseToggle && calendarCard) {
+      const setCollapseState = (collapsed) => {
+        calendarCard.classList.toggle("is-collapsed", collapsed);
+        calendarCollapseToggle.setAttribute("aria-expanded", collapsed ? "false" : "true");
+        calendarCollapseToggle.textContent = collapsed ? "Expand" : "Collapse";
+      };
+
+      const initialCollapsed = window.matchMedia("(max-width: 768px)").matches;
+      setCollapseState(initialCollapsed);
+      calendarCollapseToggle.addEventListener("click", () => {
+        setCollapseState(!calendarCard.classList.contains("is-collapsed"));
+      });
+    }
+
+    document.addEventListener("keydown", (event) => {
+      const tag = (event.target && event.target.tagName || "").toLowerCase();
+      if (tag === "input" || tag === "textarea" || tag === "select") return;
+
+      if (event.key === "ArrowLeft") {
+        event.preventDefault();
+        moveFocusBy(-1);
+      } else if (event.key === "ArrowRight") {
+        event.preventDefault();
+        moveFocusBy(1);
+      } else if (event.key === "ArrowUp") {
+        event.preventDefault();
+        moveFocusBy(-7);
+      } else if (event.key === "ArrowDown") {
+        event.preventDefault();
+        moveFocusBy(7);
+      } else if (event.key === "Enter") {
+        if (focusDate) setSelection([focusDate], focusDate);
+      } else if (event.key === "n") {
+        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() + 1, 1);
+        scheduleCalendarRender();
+      } else if (event.key === "p") {
+        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() - 1, 1);
+        scheduleCalendarRender();
+      } else if (event.key === "t") {
+        jumpToToday();
+      }
+    });
+
+    applyUrlState();
+    calendarModel = buildCalendarModel();
+    applyDefaultSelection();
+
+    applyFilters();
+    startNextUpdateCountdown();
+    updateToTop();"""
+
+
+def render_report_html(report: Dict[str, Any]) -> str:
+    generated_friendly = html_escape(str(report.get("generated_friendly", "")))
+    source_updated_friendly = html_escape(str(report.get("sourceLastUpdatedFriendly", "")))
+    report_date_iso_raw = str(report.get("reportDateIso", "")).strip()
+    if not report_date_iso_raw:
+        report_date_iso_raw = today_iso()
+    report_date_iso = html_escape(report_date_iso_raw)
+    # Countdown: render DaisyUI markup (do NOT html_escape this block)
+    next_update_msg_fallback = html_escape(str(report.get("nextUpdateMsg", "")))
+    next_due = bool(report.get("nextUpdateDue", False))
+    next_target = report.get("nextUpdateTargetEpoch")
+
+    if next_due or not next_target:
+        next_update_html = next_update_msg_fallback
+    else:
+        next_update_html = f"""
+          <span class=\"mr-2\">Next update in</span>
+          <span id=\"next-update-countdown\" data-target-epoch=\"{int(next_target)}\">
+            <span class=\"countdown font-mono\"><span id=\"cd-hours\" style=\"--value:0;\" aria-live=\"polite\" aria-label=\"0\">0</span></span>h
+            <span class=\"countdown font-mono ml-2\"><span id=\"cd-mins\" style=\"--value:0;\" aria-live=\"polite\" aria-label=\"0\">0</span></span>m
+            <span class=\"countdown font-mono ml-2\"><span id=\"cd-secs\" style=\"--value:0;\" aria-live=\"polite\" aria-label=\"0\">0</span></span>s
+          </span>
+        """
+    if not generated_friendly:
+        generated_friendly = html_escape(str(report.get("generatedAt", "")))
+    if not source_updated_friendly:
+        source_updated_friendly = html_escape(str(report.get("sourceLastUpdated", "")))
+    if not source_updated_friendly:
+        source_updated_friendly = "Unknown"
+
+    priority = report.get("priority", [])
+    groups = report.get("groups", [])
+
+    priority_groups = {p.get("group", "") for p in priority if p.get("group")}
+    priority_group_count = len(priority_groups)
+    priority_item_count = len(priority)
+    # Counters read as 0 for groups without priority items
+    priority_counts: Counter = Counter()
+    priority_counts_int: Counter = Counter()
+    priority_counts_ext: Counter = Counter()
+    priority_display: Dict[str, str] = {}
+
+    for g in groups:
+        g_display = g.get("display", "")
+        priority_display[group_slug(g_display)] = str(g_display).strip()
+
+    for p in priority:
+        p_group = p.get("group", "")
+        slug = group_slug(p_group)
+        priority_counts[slug] += 1
+
+        # Treat anything not explicitly external as internal
+        cat = str(p.get("category", "")).strip().lower()
+        (priority_counts_ext if "external" in cat else priority_counts_int)[slug] += 1
+
+        if slug not in priority_display:
+            priority_display[slug] = str(p_group).strip()
+
+    summary_parts = []
+    add_summary = summary_parts.append
+    for slug in priority_display:
+        add_summary(PRIORITY_COUNT_HTML % (
+            slug,
+            html_escape_cached(priority_display[slug]),
+            priority_counts[slug],
+            priority_counts_int[slug],
+            priority_counts_ext[slug],
+        ))
+    priority_summary_items = "\n".join(summary_parts)
+
+    group_displays = [g.get("display", "") for g in groups]
+    option_parts = []
+    add_option = option_parts.append
+    for g_display in group_displays:
+        add_option(GROUP_OPTION_HTML % (group_slug(g_display), html_escape_cached(g_display)))
+    group_filter_options = "\n".join(option_parts)
+
+    def make_tooltip(counts: Dict[str, int]) -> str:
+        return f"Int: {counts['int']} | Ext: {counts['ext']}"
+
+    # One pass over every section; the overall summary is the sum of the groups
+    group_counts = [count_row_statuses(g.get("sections", [])) for g in groups]
+    global_stats = badge_stats(sum(group_counts, Counter()))
+
+    total_confirmed = global_stats["confirmed"]["total"]
+    total_ok = global_stats["ok"]["total"]
+    total_missing = global_stats["missing"]["total"]
+    total_check = global_stats["check"]["total"]
+
+    summary_line = (
+        f"{total_confirmed} confirmed, "
+        f"{total_ok} OK, "
+        f"{total_missing} missing on listings, "
+        f"{total_check} check."
+    )
+
+    def short_group_label(name: str) -> str:
+        parts = (name or "").strip().split()
+        if not parts:
+            return "Group"
+        return parts[0][:4]
+
+    # Calendar events (for the script) and their pills (static markup) in one pass
+    calendar_events: List[Dict[str, str]] = []
+    calendar_pills_parts: List[str] = []
+    add_pill = calendar_pills_parts.append
+    for g in groups:
+        g_name = str(g.get("display", "")).strip()
+        if not g_name:
+            continue
+        slug = group_slug(g_name)
+        short_label = short_group_label(g_name)
+        pill_fields = {
+            "slug": html_escape_cached(slug),
+            "label": html_escape_cached(g_name),
+            "short": html_escape_cached(short_label),
+        }
+        for s in g.get("sections", []):
+            date_iso = str(s.get("date_iso", "")).strip()
+            if not date_iso:
+                continue
+            category_raw = str(s.get("category", "")).strip()
+            anchor = section_anchor(g_name, date_iso, category_raw)
+            calendar_events.append({
+                "date_iso": date_iso,
+                "group_slug": slug,
+                "group_label": g_name,
+                "category": category_raw,
+                "anchor": anchor,
+                "short_label": short_label,
+            })
+            pill_fields["anchor"] = html_escape_cached(anchor)
+            pill_fields["border"] = "border-dashed" if "external" in category_raw.lower() else "border-solid"
+            pill_fields["date"] = html_escape_cached(date_iso)
+            add_pill(CALENDAR_PILL_HTML % pill_fields)
+
+    # Compact UTF-8 JSON; "</" is only rewritten (to keep the inline <script> intact) when present
+    calendar_events_json = json.dumps(calendar_events, ensure_ascii=False, separators=(",", ":"))
+    if "</" in calendar_events_json:
+        calendar_events_json = calendar_events_json.replace("</", "<\\/")
+    calendar_pills_html = "\n".join(calendar_pills_parts)
+
+    # Priority cards
+    priority_cards = ""
+    if priority:
+        cards = []
+        for idx, p in enumerate(priority):
+            p_group = p.get("group", "")
+            p_date_iso = p.get("date_iso", "")
+            p_date_uk = p.get("date_uk", "")
+            p_slug = group_slug(p_group)
+            anchor = section_anchor(p_group, p_date_iso, p.get("category", ""))
+            day, month = ticket_date_parts(p_date_iso, p_date_uk)
+            missing_list = [x for x in map(str, p.get("missing", [])) if x.strip()]
+            missing_text = ", ".join(missing_list) if missing_list else "Unknown"
+            
+            mailto_link = generate_mailto_cached(p_group, tuple(missing_list), p_date_uk)
+            
+            cards.append(PRIORITY_TICKET_HTML % {
+                "slug": p_slug,
+                "delay": idx * 60,
+                "day": html_escape_cached(day),
+                "month": html_escape_cached(month),
+                "group": html_escape_cached(p["group"]),
+                "category": html_escape_cached(p["category"]),
+                "anchor": html_escape_cached(anchor),
+                "title": html_escape_cached(p["title"]),
+                "missing": html_escape(missing_text),
+                "url": html_escape_cached(p["url"]),
+                "mailto": html_escape(mailto_link),
+            })
+        priority_cards = "\n".join(cards)
+    else:
+        priority_cards = """
+          <div class="alert alert-success">
+            <span>Nothing urgent: no missing Internal/External seminars in the next 14 days.</span>
+          </div>
+        """
+
+    # Group sections
+    group_html_parts: List[str] = []
+    add_part = group_html_parts.append
+    group_nav_items = []
+    for idx, g in enumerate(groups):
+        g_display = group_displays[idx]
+        g_name_raw = str(g_display)
+        g_name = html_escape_cached(g_name_raw)
+        g_url = html_escape_cached(g.get("url", ""))
+        g_url_attr = html_escape_cached(g_url)  # data-group-url has always been escaped twice
+        slug = group_slug(g_name_raw)
+        sections = g.get("sections", [])
+
+        # Detailed Counts with Tooltips
+        stats = badge_stats(group_counts[idx])
+        
+        confirmed_count = stats["confirmed"]["total"]
+        ok_count = stats["ok"]["total"]
+        missing_count = stats["missing"]["total"]
+        check_count = stats["check"]["total"]
+        
+        has_issues = missing_count > 0 or check_count > 0
+
+        fields = {
+            "slug": slug,
+            "has_issues": "true" if has_issues else "false",
+            "name": g_name,
+            "url": g_url,
+            "delay": idx * 70,
+            "confirmed": confirmed_count,
+            "ok": ok_count,
+            "missing": missing_count,
+            "check": check_count,
+            "confirmed_tip": make_tooltip(stats["confirmed"]),
+            "ok_tip": make_tooltip(stats["ok"]),
+            "missing_tip": make_tooltip(stats["missing"]),
+            "check_tip": make_tooltip(stats["check"]),
+        }
+        group_nav_items.append(GROUP_NAV_HTML % fields)
+        group_html_parts.append(GROUP_CARD_HEAD_HTML % fields)
+
+        if not sections:
+            group_html_parts.append("""
+                <div class="alert">
+                  <span>No upcoming Internal/External seminars found (or no data available).</span>
+                </div>
+            """)
+        elif missing_count == 0 and check_count == 0:
+             group_html_parts.append("""
+                <div class="flex flex-col items-center justify-center p-8 text-center opacity-60">
+                   <div class="text-4xl mb-2">✅</div>
+                   <div class="text-lg font-medium">All Good</div>
+                   <div class="text-sm">Everything scheduled matches the spreadsheet.</div>
+                </div>
+            """)
+        else:
+            for s in sections:
+                date_uk = html_escape_cached(s.get("date_uk", ""))
+                date_iso = s.get("date_iso", "")
+                category_raw = s.get("category", "")
+                category = html_escape_cached(category_raw)
+                title = html_escape_cached(s.get("title", "Interest group seminar"))
+                source_label = html_escape_cached(str(s.get("source_label", "CrickNet")))
+                found_label = "Found"
+                any_mismatch = bool(s.get("any_mismatch"))
+                rows_list = s.get("rows", [])
+                has_missing = has_check = False
+                for r in rows_list:
+                    if r.status == "bad":
+                        has_missing = True
+                    elif r.status in CHECK_STATUSES:
+                        has_check = True
+                    if has_missing and has_check:
+                        break
+                box_class = "border border-base-200 rounded-xl p-4 bg-base-100 shadow-sm"
+                
+                # Header Badge Logic
+                if has_missing:
+                    header_badge = "badge-error"
+                    header_text = "Missing"
+                elif has_check:
+                    header_badge = "badge-warning"
+                    header_text = "Check"
+                else:
+                    header_badge = "badge-success"
+                    header_text = "All good"
+
+                # Detail blocks are spliced into the flat part list after the table,
+                # so (like table rows) they carry no leading newline of their own.
+                # Sections without a mismatch never look at the detail lists.
+                detail_parts: List[str] = []
+                if any_mismatch:
+                    missing_list = s.get("missing") or ()
+                    date_mismatches_list = s.get("date_mismatches") or ()
+                    extra_list = s.get("extras") or ()
+                    likely = s.get("likely_pairs") or ()
+                    if missing_list:
+                        mailto_missing = generate_mailto_cached(g_name_raw, tuple(missing_list), date_uk)
+                        detail_parts.append(DETAIL_MISSING_HTML % {
+                            "source": source_label,
+                            "items": "".join(f"<li>{html_escape_cached(x)}</li>" for x in missing_list),
+                            "mailto": html_escape(mailto_missing),
+                        })
+                    if date_mismatches_list:
+                        # Message and the date it names depend on the mismatch direction
+                        dm_lines = []
+                        for dm in date_mismatches_list:
+                            date_key, line = DATE_MISMATCH_LINES.get(dm.get('direction', ''), DATE_MISMATCH_LINE_DEFAULT)
+                            dm_lines.append(line % (
+                                html_escape_cached(dm.get('speaker', '')),
+                                html_escape_cached(dm.get(date_key, '')),
+                                source_label,
+                            ))
+                        
+                        detail_parts.append(DETAIL_DATE_MISMATCH_HTML % "".join(dm_lines))
+                    if extra_list:
+                        detail_parts.append(DETAIL_EXTRA_HTML % {
+                            "source": source_label,
+                            "items": "".join(f"<li>{html_escape_cached(x)}</li>" for x in extra_list),
+                        })
+                    if likely:
+                        detail_parts.append(DETAIL_LIKELY_HTML % "".join(
+                            f"<li>{html_escape_cached(x['a'])} &nbsp;↔&nbsp; {html_escape_cached(x['b'])} ({int(x['score'])}% similar)</li>"
+                            for x in likely
+                        ))
+
+                add_part(SECTION_CARD_HEAD_HTML % {
+                    "anchor": html_escape_cached(section_anchor(g_display, date_iso, category_raw)),
+                    "box_class": box_class,
+                    "slug": slug,
+                    "category_attr": category.lower(),
+                    "date": html_escape_cached(date_iso),
+                    "group_label": g_name,
+                    "group_url": g_url_attr,
+                    "date_cell": date_cell_parts(date_iso, date_uk),
+                    "header_badge": header_badge,
+                    "header_text": header_text,
+                    "category": category,
+                    "title": title,
+                    "found_label": found_label,
+                })
+
+                # Table rows go straight into the flat part list; each row's
+                # leading newline comes from the "\n".join below.
+                for r in rows_list:
+                    st = r.status
+                    add_part(TABLE_ROW_HTML % (
+                        html_escape_cached(st),
+                        STATUS_CELLS.get(st) or status_cell_html(st),
+                        html_escape_cached(r.expected),
+                        html_escape_cached(r.found),
+                        html_escape_cached(r.note),
+                        "" if r.score is None else SCORE_SUFFIXES[r.score],
+                    ))
+
+                add_part("""                        </tbody>
+                      </table>
+                    </div>
+
+                    """)
+                group_html_parts.extend(detail_parts)
+                add_part("""                  </div>
+                """)
+
+        group_html_parts.append("""
+                  </div>
+                </div>
+              </details>
+            </div>
+          </div>
+        """)
+
+    group_html = "\n".join(group_html_parts)
+    group_nav_html = "\n".join(group_nav_items)
+
+    html = REPORT_HEAD_HTML + f"""<body>
+  <nav class="navbar bg-base-100 shadow-sm sticky top-0 z-50 px-4 py-2 mb-6" style="background-color: rgba(255,255,255,0.95); backdrop-filter: blur(4px);">
+    <div class="flex-1">
+      <span class="text-xl font-bold tracking-tight" style="color: var(--col-blue)">CrickNet Checker</span>
+    </div>
+    <div class="flex-none items-center gap-2">
+      <!-- Actionable Toggle -->
+      <label class="cursor-pointer label p-0 mr-4 hidden md:flex">
+        <span class="label-text mr-2 text-xs font-semibold uppercase opacity-60">Actionable only</span> 
+        <input type="checkbox" class="toggle toggle-sm toggle-error" id="actionable-toggle" />
+      </label>
+      
+      <!-- Mobile Actionable Toggle (Compact) -->
+       <label class="cursor-pointer label p-0 mr-2 md:hidden">
+        <input type="checkbox" class="toggle toggle-xs toggle-error" id="actionable-toggle-mobile" />
+      </label>
+
+      <div class="divider divider-horizontal mx-1"></div>
+      
+      <!-- Links -->
+      <a href="#priority" class="btn btn-ghost btn-sm hidden sm:inline-flex">Priority</a>
+      <a href="#group-nav" class="btn btn-ghost btn-sm hidden sm:inline-flex">Groups</a>
+      
+      <!-- Actions -->
+      <button class="btn btn-ghost btn-sm btn-square" onclick="window.print()" title="Save as PDF">
+        <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M17 17h2a2 2 0 002-2v-4a2 2 0 00-2-2H5a2 2 0 00-2 2v4a2 2 0 002 2h2m2 4h6a2 2 0 002-2v-4a2 2 0 00-2-2H9a2 2 0 00-2 2v4a2 2 0 002 2zm8-12V5a2 2 0 00-2-2H9a2 2 0 00-2 2v4h10z" /></svg>
+      </button>
+      <button class="btn btn-ghost btn-sm btn-square" onclick="toggleAllGroups(true)" title="Expand All">
+        <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 13l-7 7-7-7m14-8l-7 7-7-7" /></svg>
+      </button>
+      <button class="btn btn-ghost btn-sm btn-square" onclick="toggleAllGroups(false)" title="Collapse All">
+        <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 15l7-7 7 7" /></svg>
+      </button>
+    </div>
+  </nav>
 
-    if (calendarPrev) {{
-      calendarPrev.addEventListener("click", () => {{
-        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() - 1, 1);
-        populateMonthSelect();
-        renderCalendar();
-      }});
-    }}
-    if (calendarNext) {{
-      calendarNext.addEventListener("click", () => {{
-        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() + 1, 1);
-        populateMonthSelect();
-        renderCalendar();
-      }});
-    }}
+  <div class="max-w-7xl mx-auto px-2.5 py-4 md:py-8">
+    <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-8">
+      <div class="stat-box bg-white p-4 rounded-lg shadow-sm border border-slate-100">
+        <div class="text-xs uppercase font-bold text-slate-400">Report Generated</div>
+        <div class="text-lg font-medium">{generated_friendly}</div>
+      </div>
+      <div class="stat-box bg-white p-4 rounded-lg shadow-sm border border-slate-100">
+        <div class="text-xs uppercase font-bold text-slate-400">Spreadsheet Data</div>
+        <div class="text-lg font-medium">Refreshed {source_updated_friendly}</div>
+        <div class="text-xs text-slate-500 mt-1">{next_update_html}</div>
+      </div>
+    </div>
 
-    if (calendarMonthSelect) {{
-      calendarMonthSelect.addEventListener("change", () => {{
-        const nextMonth = parseInt(calendarMonthSelect.value, 10);
-        if (Number.isFinite(nextMonth)) {{
-          currentMonth = new Date(currentMonth.getFullYear(), nextMonth, 1);
-          renderCalendar();
-        }}
-      }});
-    }}
+    <div class="grid gap-6 lg:grid-cols-[460px_minmax(0,1fr)]">
+      <aside id="group-nav" class="space-y-4 min-w-0">
+        <div class="card bg-base-100 shadow quick-summary">
+          <div class="card-body p-4">
+            <div class="text-xs uppercase tracking-wide opacity-70">Quick summary</div>
+            <div class="mt-2 text-sm">
+              <div class="font-semibold">{total_confirmed} confirmed</div>
+              <div>{total_ok} OK</div>
+              <div class="text-error">{total_missing} missing on listings</div>
+              <div class="text-warning">{total_check} check</div>
+            </div>
+            <div class="mt-3 text-xs opacity-70">{summary_line}</div>
+          </div>
+        </div>
 
-    if (calendarViewToggle) {{
-      calendarViewToggle.addEventListener("click", () => {{
-        calendarView = calendarView === "month" ? "week" : "month";
-        updateViewToggleLabel();
-        renderCalendar();
-        updateUrlState();
-      }});
-      updateViewToggleLabel();
-    }}
+        <div id="calendar-card" class="card bg-base-100 shadow calendar-sticky" data-report-date="{report_date_iso}">
+          <div class="card-body p-4">
+            <div class="calendar-header">
+              <div class="text-xs uppercase tracking-wide opacity-70">Calendar</div>
+              <button class="btn btn-ghost btn-xs" id="calendar-collapse-toggle" type="button" aria-expanded="true">Collapse</button>
+            </div>
 
-    if (calendarIssuesOnly) {{
-      calendarIssuesOnly.addEventListener("change", () => {{
-        renderCalendar();
-        updateUrlState();
-      }});
-    }}
+            <div id="calendar-body">
+              <div class="calendar-controls mt-2">
+                <div class="calendar-controls-row">
+                  <button class="btn btn-xs btn-outline" id="calendar-jump-today" type="button">Jump to today</button>
+                  <button class="btn btn-xs btn-outline" id="calendar-jump-issue" type="button">Jump to next issue</button>
+                  <button class="btn btn-xs btn-ghost" id="calendar-view-toggle" type="button">Month</button>
+                </div>
+                <div class="calendar-controls-row">
+                  <label class="calendar-toggle">
+                    <input type="checkbox" class="checkbox checkbox-xs" id="calendar-issues-only" />
+                    <span>Issues only</span>
+                  </label>
+                  <label class="calendar-toggle">
+                    <input type="checkbox" class="checkbox checkbox-xs" id="calendar-search-toggle" checked />
+                    <span>Search affects calendar</span>
+                  </label>
+                </div>
+              </div>
 
-    if (calendarSearchToggle) {{
-      calendarSearchToggle.addEventListener("change", () => {{
-        rebuildCalendarModel();
-        updateUrlState();
-      }});
-    }}
+              <div class="calendar-wrapper">
+                <div class="custom-calendar-card bg-base-100 border border-base-300 shadow-lg rounded-box p-4">
+                  <div class="cal-top-bar mb-4 flex justify-between items-center">
+                    <span class="text-lg font-bold tracking-tight" id="calendar-month-label">Month</span>
+                    <div class="flex gap-1">
+                      <select id="calendar-month-select" class="select select-xs select-bordered" aria-label="Jump to month"></select>
+                      <button class="btn btn-xs btn-ghost btn-square" id="calendar-prev" type="button" aria-label="Previous month">◀</button>
+                      <button class="btn btn-xs btn-ghost btn-square" id="calendar-next" type="button" aria-label="Next month">▶</button>
+                    </div>
+                  </div>
+                  <div class="cal-grid" id="calendar-grid"></div>
+                </div>
 
-    if (calendarJumpToday) {{
-      calendarJumpToday.addEventListener("click", () => {{
-        jumpToToday();
-      }});
-    }}
+                <div class="calendar-events mt-2">
+                  <div class="calendar-events-header" id="calendar-events-title">Events</div>
+                  <div class="cal-events-list" id="calendar-events-list">
+                    {calendar_pills_html}
+                  </div>
+                  <div class="calendar-empty" id="calendar-events-empty">No events on this date.</div>
+                </div>
+              </div>
 
-    if (calendarJumpIssue) {{
-      calendarJumpIssue.addEventListener("click", () => {{
-        jumpToNextIssue();
-      }});
-    }}
+              <div class="calendar-agenda mt-4" id="calendar-agenda">
+                <div class="calendar-events-header">Agenda</div>
+                <div class="calendar-agenda-summary" id="calendar-agenda-summary"></div>
+                <div class="calendar-agenda-list" id="calendar-agenda-list"></div>
+                <div class="calendar-empty" id="calendar-agenda-empty">No items for this date.</div>
+              </div>
+            </div>
+          </div>
+        </div>
 
-    if (calendarCollapseToggle && calendarCard) {{
-      const setCollapseState = (collapsed) => {{
-        calendarCard.classList.toggle("is-collapsed", collapsed);
-        calendarCollapseToggle.setAttribute("aria-expanded", collapsed ? "false" : "true");
-        calendarCollapseToggle.textContent = collapsed ? "Expand" : "Collapse";
-      }};
+        <div class="card bg-base-100 shadow interest-groups-card">
+          <div class="card-body p-4">
+            <div class="text-xs uppercase tracking-wide opacity-70">Interest groups</div>
+            <div class="mt-3 flex gap-2">
+              <button type="button" class="btn btn-xs btn-outline tooltip" data-tip="Show internal only" data-category-preset="internal">Internal</button>
+              <button type="button" class="btn btn-xs btn-outline tooltip" data-tip="Show external only" data-category-preset="external">External</button>
+              <button type="button" class="btn btn-xs btn-ghost tooltip" data-tip="Show both" data-category-preset="all">All</button>
+            </div>
+            <ul class="mt-3 space-y-2">
+              {group_nav_html}
+            </ul>
+          </div>
+        </div>
+      </aside>
 
-      const initialCollapsed = window.matchMedia("(max-width: 768px)").matches;
-      setCollapseState(initialCollapsed);
-      calendarCollapseToggle.addEventListener("click", () => {{
-        setCollapseState(!calendarCard.classList.contains("is-collapsed"));
-      }});
-    }}
+      <main class="space-y-6 min-w-0">
+        <section id="summary" class="card bg-base-100 shadow reveal">
+          <div class="card-body p-5 md:p-6">
+            <div class="flex flex-col lg:flex-row lg:items-center lg:justify-between gap-4">
+              <div>
+                <h2 class="text-xl font-semibold">At a glance</h2>
+                <p class="text-sm opacity-80 mt-1">Overview of confirmed entries and checks against site listings.</p>
+              </div>
+              <div class="summary-stats">
+                <div class="summary-stat">
+                  <div class="label">Confirmed</div>
+                  <div class="value">{total_confirmed}</div>
+                </div>
+                <div class="summary-stat value-ok">
+                  <div class="label">OK</div>
+                  <div class="value">{total_ok}</div>
+                </div>
+                <div class="summary-stat value-missing">
+                  <div class="label">Missing</div>
+                  <div class="value">{total_missing}</div>
+                </div>
+                <div class="summary-stat value-check">
+                  <div class="label">Check</div>
+                  <div class="value">{total_check}</div>
+                </div>
+              </div>
+            </div>
+          </div>
+        </section>
 
-    document.addEventListener("keydown", (event) => {{
-      const tag = (event.target && event.target.tagName || "").toLowerCase();
-      if (tag === "input" || tag === "textarea" || tag === "select") return;
+        <section id="filters" class="card bg-base-100 shadow reveal">
+          <div class="card-body p-5 md:p-6">
+            <div class="flex flex-col md:flex-row md:items-center md:justify-between gap-3">
+              <div>
+                <h2 class="text-xl font-semibold">Filters</h2>
+                <p class="text-sm opacity-80 mt-1">Filter by group, status, or search for a speaker/lab.</p>
+              </div>
+              <div class="filter-actions">
+                <button id="clear-filters" class="btn btn-ghost btn-sm">Clear filters</button>
+              </div>
+            </div>
+            <div class="mt-4 filter-row">
+              <div>
+                <label class="text-xs uppercase tracking-wide opacity-70" for="filter-search">Search</label>
+                <input id="filter-search" class="input input-bordered w-full mt-2" type="search" placeholder="Search speaker, lab, or note" />
+              </div>
+              <div>
+                <label class="text-xs uppercase tracking-wide opacity-70" for="filter-group">Interest group</label>
+                <select id="filter-group" class="select select-bordered w-full mt-2">
+                  <option value="all">All groups</option>
+                  {group_filter_options}
+                </select>
+              </div>
+              <div>
+                 <label class="text-xs uppercase tracking-wide opacity-70" for="filter-category">Category</label>
+                 <select id="filter-category" class="select select-bordered w-full mt-2">
+                    <option value="all">All Categories</option>
+                    <option value="internal">Internal</option>
+                    <option value="external">External</option>
+                 </select>
+              </div>
+            </div>
+            <div class="mt-4 filter-status">
+              <label>
+                <input type="checkbox" class="checkbox checkbox-success" name="status-filter" value="ok" checked />
+                <span>OK</span>
+              </label>
+              <label>
+                <input type="checkbox" class="checkbox checkbox-error" name="status-filter" value="missing" checked />
+                <span>Missing</span>
+              </label>
+              <label>
+                <input type="checkbox" class="checkbox checkbox-warning" name="status-filter" value="check" checked />
+                <span>Check</span>
+              </label>
+              <label>
+                <input type="checkbox" class="checkbox checkbox-neutral" name="status-filter" value="extra" checked />
+                <span>Extra</span>
+              </label>
+            </div>
+          </div>
+        </section>
 
-      if (event.key === "ArrowLeft") {{
-        event.preventDefault();
-        moveFocusBy(-1);
-      }} else if (event.key === "ArrowRight") {{
-        event.preventDefault();
-        moveFocusBy(1);
-      }} else if (event.key === "ArrowUp") {{
-        event.preventDefault();
-        moveFocusBy(-7);
-      }} else if (event.key === "ArrowDown") {{
-        event.preventDefault();
-        moveFocusBy(7);
-      }} else if (event.key === "Enter") {{
-        if (focusDate) setSelection([focusDate], focusDate);
-      }} else if (event.key === "n") {{
-        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() + 1, 1);
-        populateMonthSelect();
-        renderCalendar();
-      }} else if (event.key === "p") {{
-        currentMonth = new Date(currentMonth.getFullYear(), currentMonth.getMonth() - 1, 1);
-        populateMonthSelect();
-        renderCalendar();
-      }} else if (event.key === "t") {{
-        jumpToToday();
-      }}
-    }});
+        <section id="priority" class="card bg-base-100 shadow reveal">
+          <div class="card-body p-0">
+            <details class="collapse collapse-arrow">
+              <summary class="collapse-title px-6 py-5 cursor-pointer">
+                <div class="space-y-3">
+                  <div class="flex flex-col md:flex-row md:items-center md:justify-between gap-2">
+                    <div class="text-xl font-semibold">High priority (next 14 days)</div>
+                    <div class="flex flex-wrap gap-2">
+                      <span class="badge badge-neutral">{priority_group_count} group(s)</span>
+                      <span class="badge badge-ghost">{priority_item_count} item(s)</span>
+                    </div>
+                  </div>
+                  <div class="priority-counts">
+                    {priority_summary_items}
+                  </div>
+                </div>
+              </summary>
+              <div class="collapse-content px-6 pb-6">
+                <div>
+                  {priority_cards}
+                </div>
+              </div>
+            </details>
+          </div>
+        </section>
 
-    applyUrlState();
-    calendarModel = buildCalendarModel();
-    populateMonthSelect();
-    applyDefaultSelection();
+        <section id="groups" class="space-y-5">
+          {group_html}
+        </section>
+      </main>
+    </div>
+  </div>
 
-    applyFilters();
-    startNextUpdateCountdown();
-    updateToTop();
+  <button id="to-top" class="btn btn-primary btn-sm to-top" aria-label="Back to top">Top</button>
+
+  <script>
+    window.CALENDAR_EVENTS = {calendar_events_json};
+{REPORT_SCRIPT_JS}
   </script>
 </body>
 </html>
@@ -3889,7 +4479,8 @@ def write_report_files(report_html: str) -> Tuple[str, str]:
     latest_path = reports_dir / "latest.html"
 
     stamped_path.write_text(report_html, encoding="utf-8")
-    latest_path.write_text(report_html, encoding="utf-8")
+    # Same bytes again: copy the file rather than re-encoding the whole report
+    shutil.copyfile(stamped_path, latest_path)
     return str(latest_path), str(stamped_path)
 
 def fetch_fresh_data_via_trigger(context, page, interactive: bool) -> bool:
@@ -3914,7 +4505,7 @@ def fetch_fresh_data_via_trigger(context, page, interactive: bool) -> bool:
     old_timestamp = ""
     if Path(LOCAL_JSON_PATH).exists():
         try:
-            old_data = json.loads(Path(LOCAL_JSON_PATH).read_text(encoding="utf-8"))
+            old_data = read_json_file(LOCAL_JSON_PATH)
             old_timestamp = old_data.get("lastUpdated", "")
             print(f"   Current Data Timestamp: {old_timestamp}")
         except:
@@ -3966,7 +4557,7 @@ def fetch_fresh_data_via_trigger(context, page, interactive: bool) -> bool:
         if dl_resp.ok:
             new_content = dl_resp.body()
             try:
-                new_json = json.loads(new_content)
+                new_json = json_loads(new_content)
                 new_timestamp = new_json.get("lastUpdated", "")
                 
                 # Compare timestamps
@@ -3989,6 +4580,9 @@ def fetch_fresh_data_via_trigger(context, page, interactive: bool) -> bool:
 # Main run
 # ---------------------------
 def run_once(headless: bool, interactive: bool) -> Tuple[bool, bool]:
+    today_date.cache_clear()
+    today_iso.cache_clear()
+
     with sync_playwright() as p:
         context = p.chromium.launch_persistent_context(
             PROFILE_DIR,
@@ -4021,7 +4615,7 @@ def run_once(headless: bool, interactive: bool) -> Tuple[bool, bool]:
         if sharepoint_ok:
             print(f"✅ Downloaded SharePoint data to: {LOCAL_JSON_PATH}")
             try:
-                raw = json.loads(Path(LOCAL_JSON_PATH).read_text(encoding="utf-8"))
+                raw = read_json_file(LOCAL_JSON_PATH)
                 if isinstance(raw, dict):
                     lu = str(raw.get("lastUpdated", "")).strip()
                     recs = raw.get("records", [])
@@ -4052,6 +4646,7 @@ def run_once(headless: bool, interactive: bool) -> Tuple[bool, bool]:
 
         # Fill group comparisons
         priority_items: List[Dict[str, Any]] = []
+        expected_index = load_all_expected(LOCAL_JSON_PATH) if Path(LOCAL_JSON_PATH).exists() else {}
 
         for g in report["groups"]:
             display_name = str(g["display"])
@@ -4059,10 +4654,7 @@ def run_once(headless: bool, interactive: bool) -> Tuple[bool, bool]:
             events_url = str(g["url"])
 
             # Expected
-            if Path(LOCAL_JSON_PATH).exists():
-                expected_map = load_expected_from_json(LOCAL_JSON_PATH, json_name)
-            else:
-                expected_map = {}
+            expected_map = expected_from_records(expected_index.get(json_name.lower(), []))
 
             # Found
             events = scrape_interest_group_events(page, events_url)
@@ -0,0 +1,132 @@
+import sys
+import types
+import unittest
+from unittest import mock
+
+
+def _ensure_stub(module_name: str, **attrs: object) -> None:
+    if module_name in sys.modules:
+        return
+    stub = types.ModuleType(module_name)
+    for key, value in attrs.items():
+        setattr(stub, key, value)
+    sys.modules[module_name] = stub
+
+
+try:
+    import requests  # noqa: F401
+except Exception:
+    _ensure_stub("requests")
+
+try:
+    from bs4 import BeautifulSoup  # noqa: F401
+except Exception:
+    _ensure_stub("bs4", BeautifulSoup=object, SoupStrainer=object)
+
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError  # noqa: F401
+except Exception:
+    _ensure_stub("playwright")
+    _ensure_stub(
+        "playwright.sync_api",
+        sync_playwright=lambda: None,
+        TimeoutError=Exception,
+    )
+
+import checker
+from checker import (
+    build_comparison_rows,
+    build_global_speaker_lookup,
+    key_speaker_lab,
+    norm_text,
+    similarity,
+)
+
+
+# fuzz.ratio and SequenceMatcher score this pair either side of MIN_FUZZY_SCORE
+BOUNDARY_PAIR = ("maria garcia", "maria ciargia")
+
+
+def _item(speaker: str, lab: str = "") -> dict:
+    return {"speaker": speaker, "lab": lab, "key": key_speaker_lab(speaker, lab)}
+
+
+class TestComparisonRows(unittest.TestCase):
+    def test_norm_text_collapses_whitespace_then_drops_punctuation(self):
+        self.assertEqual(norm_text("  Dr. Jane  O'Neil\t- Lab X "), "dr jane oneil  lab x")
+        self.assertEqual(norm_text("Zoë Müller"), "zo mller")
+        self.assertEqual(norm_text(""), "")
+
+    def test_similarity_identical_inputs(self):
+        self.assertEqual(similarity("jane doe", "jane doe"), 1.0)
+        self.assertLess(similarity("jane doe", "john smith"), 0.8)
+
+    @unittest.skipIf(checker.fuzz is None, "rapidfuzz not installed")
+    def test_boundary_pair_matches_with_rapidfuzz(self):
+        self.assertGreaterEqual(similarity(*BOUNDARY_PAIR), checker.MIN_FUZZY_SCORE)
+
+    def test_boundary_pair_misses_with_sequence_matcher(self):
+        with mock.patch.object(checker, "fuzz", None):
+            self.assertLess(similarity(*BOUNDARY_PAIR), checker.MIN_FUZZY_SCORE)
+
+    def test_exact_fuzzy_and_speaker_matches(self):
+        expected = [
+            _item("Jane Doe", "Doe Lab"),
+            _item("Sam Smithson", "Smithson Lab"),
+            _item("Alex Roe", "Roe Lab"),
+        ]
+        found = [
+            _item("Jane Doe", "Doe Lab"),
+            _item("Sam Smithsen", "Smithson Lab"),
+            _item("Alex Roe", "Some Other Group Entirely"),
+        ]
+        rows, summary = build_comparison_rows(expected, found, current_date="2026-01-01")
+        by_expected = {r.expected: r for r in rows}
+
+        self.assertEqual(by_expected["Jane Doe (Doe Lab)"].status, "ok")
+        self.assertIsNone(by_expected["Jane Doe (Doe Lab)"].score)
+
+        fuzzy = by_expected["Sam Smithson (Smithson Lab)"]
+        self.assertEqual(fuzzy.status, "warn")
+        self.assertEqual(fuzzy.found, "Sam Smithsen (Smithson Lab)")
+
+        speaker = by_expected["Alex Roe (Roe Lab)"]
+        self.assertEqual(speaker.status, "ok")
+        self.assertEqual(speaker.score, 100)
+
+        self.assertTrue(summary["any_mismatch"])
+        self.assertEqual(summary["missing_exact"], [])
+        self.assertEqual(summary["extras_exact"], [])
+
+    def test_unmatched_items_are_missing_and_extra(self):
+        rows, summary = build_comparison_rows(
+            [_item("Jane Doe", "Doe Lab")],
+            [_item("Completely Different", "Elsewhere")],
+            current_date="2026-01-01",
+        )
+        self.assertEqual(summary["missing_exact"], ["Jane Doe (Doe Lab)"])
+        self.assertEqual(summary["extras_exact"], ["Completely Different (Elsewhere)"])
+        self.assertEqual(len(summary["likely_pairs"]), 1)
+
+    def test_date_mismatch_uses_other_scheduled_date(self):
+        jane = _item("Jane Doe", "Doe Lab")
+        found_map = {
+            ("2026-01-01", "Internal"): [_item("Someone Else", "Else Lab")],
+            ("2026-01-08", "Internal"): [jane, dict(jane)],
+        }
+        lookup = build_global_speaker_lookup(found_map)
+        self.assertEqual([e["date_iso"] for e in lookup["jane doe"]], ["2026-01-08"])
+
+        rows, summary = build_comparison_rows(
+            [jane],
+            [],
+            current_date="2026-01-01",
+            cricknet_speaker_lookup=lookup,
+        )
+        self.assertEqual(rows[0].status, "date_mismatch")
+        self.assertEqual(summary["missing_exact"], [])
+        self.assertEqual(summary["date_mismatches"][0]["actual_date"], "2026-01-08")
+
+
+if __name__ == "__main__":
+    unittest.main()
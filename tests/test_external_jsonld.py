@@ -0,0 +1,59 @@
+import sys
+import types
+import unittest
+
+
+def _ensure_stub(module_name: str, **attrs: object) -> None:
+    if module_name in sys.modules:
+        return
+    stub = types.ModuleType(module_name)
+    for key, value in attrs.items():
+        setattr(stub, key, value)
+    sys.modules[module_name] = stub
+
+
+try:
+    import requests  # noqa: F401
+except Exception:
+    _ensure_stub("requests")
+
+try:
+    from bs4 import BeautifulSoup  # noqa: F401
+except Exception:
+    _ensure_stub("bs4", BeautifulSoup=object, SoupStrainer=object)
+
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError  # noqa: F401
+except Exception:
+    _ensure_stub("playwright")
+    _ensure_stub(
+        "playwright.sync_api",
+        sync_playwright=lambda: None,
+        TimeoutError=Exception,
+    )
+
+from checker import JSONLD_RE, external_extract_jsonld
+
+
+class TestExternalJsonLd(unittest.TestCase):
+    def test_pattern_matches_type_attribute(self):
+        for tag in (
+            '<script type="application/ld+json">{}</script>',
+            "<script id=\"x\" type='application/ld+json'>{}</script>",
+            "<SCRIPT\n  TYPE=application/ld+json>{}</SCRIPT>",
+        ):
+            self.assertIsNotNone(JSONLD_RE.search(tag), tag)
+
+    def test_pattern_ignores_data_type_attribute(self):
+        self.assertIsNone(JSONLD_RE.search('<script data-type="application/ld+json">{}</script>'))
+
+    def test_extract_skips_data_type_blocks(self):
+        html = (
+            '<script data-type="application/ld+json">{"name": "decoy"}</script>'
+            '<script type="application/ld+json">{"name": "Seminar"}</script>'
+        )
+        self.assertEqual(external_extract_jsonld(html), [{"name": "Seminar"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ fake_bs4 = types.ModuleType("bs4")
 class _DummySoup:  # pragma: no cover - test stub
     pass
 fake_bs4.BeautifulSoup = _DummySoup
+fake_bs4.SoupStrainer = _DummySoup
 
 fake_playwright = types.ModuleType("playwright")
 fake_sync_api = types.ModuleType("playwright.sync_api")
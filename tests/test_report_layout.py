@@ -20,7 +20,7 @@ except Exception:
 try:
     from bs4 import BeautifulSoup  # noqa: F401
 except Exception:
-    _ensure_stub("bs4", BeautifulSoup=object)
+    _ensure_stub("bs4", BeautifulSoup=object, SoupStrainer=object)
 
 try:
     from playwright.sync_api import sync_playwright, TimeoutError  # noqa: F401